@@ -1,11 +1,16 @@
 import streamlit as st
 import pandas as pd
 from views import roadmap, analysis, data_ops
-from logic import process_data, apply_sorting, filter_data
+from logic import process_data, process_data_incremental, memory_report
 from gsheet_handler import load_data
-from squad_manager import sort_squads
+from dataset_store import load_dataset, get_store
+from bounded_cache import get_cache
+from data_sources import DataSources, WEIGHT_SHEET_ID, WEIGHT_SHEET_GID
+import precompute
 import utils
 
+# Copy-on-Write: pipeline stages and session views share column buffers until one of them writes
+utils.enable_copy_on_write()
 
 # -----------------------------------------------------------------------------
 # PAGE CONFIG & STYLING
@@ -117,54 +122,86 @@ with st.sidebar.expander("🔌 Connection Settings", expanded=False):
 # LOAD DATA LOGIC
 # -----------------------------------------------------------------------------
 
-# 1. Load Roadmap Data
-df = None
-raw_df = None
-if sheet_id:
-    with st.spinner("Loading Roadmap data..."):
-        # load_data caches? If not, this might re-run on every interaction. 
-        # gsheet_handler.load_data should ideally be cached or st.cache_data used.
-        # For now, we follow existing pattern.
-        raw_df = load_data(sheet_id, worksheet_name)
-        if not raw_df.empty:
-            df = process_data(raw_df.copy()) # Use copy to preserve raw_df
-        else:
-            st.sidebar.warning("Roadmap 데이터를 불러오지 못했습니다.")
-
-# Fallback: Roadmap File Uploader (only if no sheet loaded)
-if df is None:
-    st.sidebar.markdown("---")
-    uploaded_file = st.sidebar.file_uploader("또는 Roadmap 엑셀 업로드", type=['xlsx', 'xls'], key="roadmap_file")
-    if uploaded_file:
-        df = pd.read_excel(uploaded_file)
-        df = process_data(df)
-
-# 2. Load Resource Data
-df_resource = None
-
-if res_source == "File Upload" and resource_file:
-    df_resource = utils.load_resource_data(resource_file)
-
-elif res_source == "Google Sheet":
-    # Auto-load if ID is present (uses cached load_data)
-    if res_sheet_id:
+# Each source is loaded on first use; pages request only what they declare in data_sources.PAGE_SOURCES.
+# Values loaded on earlier reruns are remembered per session for the precompute job (step 4)
+sources = DataSources(memory=st.session_state.setdefault('loaded_sources', {}))
+
+# 1. Roadmap Data -> (raw_df, processed df, row_keys)
+def load_roadmap():
+    df = None
+    raw_df = None
+    row_keys = None
+    if sheet_id:
+        with st.spinner("Loading Roadmap data..."):
+            # One immutable version per sheet content, shared by every session (dataset_store);
+            # the sheet is re-read after load_data's TTL / a cache clear and reprocessed only if it changed
+            dataset = load_dataset(
+                ('gsheet', sheet_id, worksheet_name),
+                lambda: load_data(sheet_id, worksheet_name),
+                process_data_incremental,  # Reprocesses only the rows that changed since the previous version
+            )
+            if dataset is not None:
+                raw_df, df, row_keys = dataset.view('raw'), dataset.view('processed'), dataset.view('keys')
+            else:
+                st.sidebar.warning("Roadmap 데이터를 불러오지 못했습니다.")
+
+    # Fallback: Roadmap File Uploader (only if no sheet loaded)
+    if df is None:
+        st.sidebar.markdown("---")
+        uploaded_file = st.sidebar.file_uploader("또는 Roadmap 엑셀 업로드", type=['xlsx', 'xls'], key="roadmap_file")
+        if uploaded_file:
+            df = pd.read_excel(uploaded_file)
+            df = process_data(df)
+    return raw_df, df, row_keys
+
+sources.register('roadmap', load_roadmap, key=('gsheet', sheet_id, worksheet_name))
+
+# 2. Resource Data (리소스 및 이슈 only)
+def load_resource():
+    if res_source == "File Upload" and resource_file:
+        return utils.load_resource_data(resource_file)
+
+    if res_source == "Google Sheet" and res_sheet_id:
+        # Auto-load if ID is present (uses cached load_data)
         try:
             raw_res_df = load_data(res_sheet_id, res_sheet_gid)
             if not raw_res_df.empty:
-                df_resource = utils.process_resource_dataframe(raw_res_df)
-                # if df_resource is not None:
-                #      st.sidebar.success("Resource Data Loaded!")
-            else:
-                 pass
+                return utils.process_resource_dataframe(raw_res_df)
         except Exception as e:
             st.sidebar.error(f"Error: {e}")
+    return None
 
-# 3. Load Weight Data
-df_weights = None
-try:
-    df_weights = load_data("1XwHp_Lm7FQEmZzib8qJ1C1Q--ogCTKPXcHYhMlkE-Ts", "520843420")
-except Exception as e:
-    st.sidebar.error(f"Error loading Weight data: {e}")
+def peek_resource():
+    # The resource sheet when it is already cached (e.g. loaded by another session); never reads the sheet
+    hit, raw_res_df = load_data.peek(res_sheet_id, res_sheet_gid) if res_sheet_id else (False, None)
+    if hit and raw_res_df is not None and not raw_res_df.empty:
+        return utils.process_resource_dataframe(raw_res_df)
+    return None
+
+if res_source == "File Upload":
+    sources.register('resource', load_resource, key=('file', getattr(resource_file, 'file_id', None)))
+else:
+    sources.register('resource', load_resource, key=('gsheet', res_sheet_id, res_sheet_gid), peek=peek_resource)
+
+# 3. Weight Data (리소스 및 이슈 only)
+def load_weights():
+    try:
+        return load_data(WEIGHT_SHEET_ID, WEIGHT_SHEET_GID)
+    except Exception as e:
+        st.sidebar.error(f"Error loading Weight data: {e}")
+        return None
+
+sources.register('weights', load_weights, key=('gsheet', WEIGHT_SHEET_ID, WEIGHT_SHEET_GID),
+                 peek=lambda: load_data.peek(WEIGHT_SHEET_ID, WEIGHT_SHEET_GID)[1])
+
+# Every page starts from the roadmap data
+raw_df, df, row_keys = sources.get('roadmap')
+final_df = None
+
+# 4. Warm the other pages' derived data off the request thread (page switches hit the cache);
+#    the job only computes on frames already available (loaded this session or cached) - nothing is loaded for it
+if df is not None:
+    precompute.start_precompute_from_sources(sources, df, row_keys, current_page=page)
 
 # -----------------------------------------------------------------------------
 # MAIN CONTENT & SIDEBAR LOGIC
@@ -195,28 +232,22 @@ else:
     st.sidebar.subheader("🔍 Filters")
     
     if df is not None:
-        # Status Filter
-        all_statuses = list(df['Status'].unique()) if 'Status' in df.columns else []
+        # Status / Squad Filter options (Squads in custom sort order)
+        all_statuses, all_squads = precompute.analysis_filter_options(df)
         selected_status = st.sidebar.multiselect("Status", all_statuses, default=all_statuses)
         
         # Squad Filter
-        all_squads = list(df['Squad'].unique()) if 'Squad' in df.columns else []
-        all_squads = sort_squads(all_squads) # Apply custom sort order
         selected_squads = st.sidebar.multiselect("Squad", all_squads, default=all_squads)
         
         # Date Range Filter removed as per user request
-        date_range = None
 
         # Sorting options
         st.sidebar.subheader("🔃 Sorting")
         sort_options = [c for c in df.columns if c not in ['Start', 'End', 'Duration_Text']]
         user_sort_col = st.sidebar.selectbox("Custom Sort Column", ["None"] + sort_options)
         
-        # Apply Logic
-        filtered_df = filter_data(df, selected_status, selected_squads, date_range)
-        
-        # Apply Sorting (Only meaningful for Roadmap usually, but good for table view too)
-        final_df = apply_sorting(filtered_df, user_sort_col if user_sort_col != "None" else None)
+        # Apply Logic: filter_data + apply_sorting (cached; the default filters are warmed by precompute)
+        final_df = precompute.analysis_frame(df, selected_status, selected_squads, user_sort_col if user_sort_col != "None" else None)
         
         st.sidebar.info(f"Total Tasks: {len(final_df)}")
         
@@ -228,7 +259,8 @@ else:
             </div>
             """, unsafe_allow_html=True)
             # if resource_file: logic removed as it is handled above.
-            analysis.render_analysis_report(final_df, raw_df, sheet_id, worksheet_name, df_resource, df_weights)
+            page_data = sources.resolve(page)
+            analysis.render_analysis_report(final_df, raw_df, sheet_id, worksheet_name, page_data['resource'], page_data['weights'], row_keys)
 
         elif page == "데이터 수정":
             st.markdown(f"""
@@ -245,3 +277,31 @@ else:
 
     else:
         st.info("데이터를 연결해주세요 (Google Sheet ID 또는 파일 업로드)")
+
+# -----------------------------------------------------------------------------
+# MEMORY REPORT (Sidebar)
+# -----------------------------------------------------------------------------
+if df is not None:
+    with st.sidebar.expander("🧠 메모리 사용량", expanded=False):
+        mem_df = memory_report({'raw_df': raw_df, 'processed': df, 'final_df': final_df})
+        st.dataframe(
+            mem_df.assign(**{c: mem_df[c] / 1024 for c in ['Bytes', 'Uncompacted_Bytes', 'Saved_Bytes']}),
+            column_config={
+                'Bytes': st.column_config.NumberColumn('사용량 (KB)', format="%.1f"),
+                'Uncompacted_Bytes': st.column_config.NumberColumn('압축 전 (KB)', format="%.1f"),
+                'Saved_Bytes': st.column_config.NumberColumn('절감 (KB)', format="%.1f"),
+            },
+            hide_index=True,
+        )
+        st.caption(f"세션당 절감: {mem_df['Saved_Bytes'].sum() / 1024:,.1f} KB")
+        store_df = get_store().stats()
+        if not store_df.empty:
+            st.caption(f"공유 데이터셋: {len(store_df)}개 버전 · {store_df['Bytes'].sum() / 1024:,.1f} KB "
+                       f"(세션 {store_df['Sessions'].sum()}개가 공유)")
+        cache = get_cache().summary()
+        st.caption(f"결과 캐시: {cache['entries']}개 · {cache['bytes'] / 1024 ** 2:,.1f} / {cache['budget_bytes'] / 1024 ** 2:,.0f} MB "
+                   f"(적중률 {cache['hit_rate']:.0%}, 제거 {cache['evictions']}회)")
+        if get_cache().shared is not None:
+            shared_df = get_cache().shared.stats()
+            st.caption(f"프로세스 공유 캐시: {shared_df['Entries'].sum()}개 · {shared_df['Bytes'].sum() / 1024 ** 2:,.1f} MB "
+                       f"(다른 프로세스 결과 사용 {cache['shared_hits']}회)")
@@ -0,0 +1,94 @@
+## 처리된 데이터셋을 Arrow IPC 파일로 공유하는 로직은 이 파일에서 중앙 관리
+## 다중 프로세스 모드에서 데이터 버전별 DataFrame을 한 번만 Arrow IPC 파일로 쓰고, 모든 프로세스/세션은
+## 이 파일을 메모리 매핑해 복사 없이 pandas DataFrame으로 감싸 사용한다(페이지 캐시를 프로세스들이 공유).
+## 매핑된 DataFrame은 읽기 전용이므로 항상 얕은 복사본(Dataset.view)에서 수정한다(Copy-on-Write).
+
+import logging
+import os
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+logger = logging.getLogger(__name__)
+
+DATASET_FILE_MAX_AGE_S = 2 * 600  # Twice the dataset TTL: older files are no longer referenced by a live shared entry
+
+
+class MappedFrame:
+    """Picklable reference to a DataFrame stored as an Arrow IPC file (what the shared cache entry holds)."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __repr__(self):
+        return f"MappedFrame({self.path!r})"
+
+
+def write_frame(path, df: pd.DataFrame):
+    """Writes df (with its index) as an Arrow IPC file; readers never see a partial file."""
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    for i, field in enumerate(table.schema):
+        if (pa.types.is_timestamp(field.type) and table.column(i).null_count
+                and field.name in df.columns and isinstance(df[field.name].dtype, np.dtype)):
+            # NaT as pandas' own int64 sentinel instead of a validity bitmap: readers then map the
+            # column as-is, where Arrow nulls would force a NaT-filled copy
+            ints = pa.array(df[field.name].to_numpy().view('i8'))
+            table = table.set_column(i, field, ints.view(field.type))
+    tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+    with ipc.new_file(tmp_path, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def map_frame(path) -> pd.DataFrame:
+    """
+    DataFrame over the memory-mapped file: numeric, datetime and categorical code columns are
+    read-only views of the mapping (no copy); only small dictionaries are materialized.
+    """
+    table = ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def externalize(frames: dict, directory, name) -> dict:
+    """
+    frames with every DataFrame written to `directory` and replaced by its MappedFrame
+    (a frame Arrow cannot represent, e.g. mixed-type object columns, stays in place).
+    """
+    os.makedirs(directory, exist_ok=True)
+    prune(directory)
+    stored = {}
+    for key, value in frames.items():
+        if isinstance(value, pd.DataFrame):
+            path = os.path.join(directory, f"{name}-{key}.arrow")
+            try:
+                write_frame(path, value)
+                value = MappedFrame(path)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                logger.warning("Keeping '%s' in the shared cache entry: not representable in Arrow (%s)", key, e)
+        stored[key] = value
+    return stored
+
+
+def materialize(frames: dict) -> dict:
+    """Inverse of externalize: MappedFrame references become memory-mapped DataFrames."""
+    return {key: map_frame(value.path) if isinstance(value, MappedFrame) else value for key, value in frames.items()}
+
+
+def prune(directory, max_age_s=DATASET_FILE_MAX_AGE_S):
+    """
+    Removes dataset files (and abandoned temp files) older than max_age_s. Processes that still map
+    a removed file keep their mapping (POSIX unlink semantics).
+    """
+    cutoff = time.time() - max_age_s
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(('.arrow', '.tmp')):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:  # Removed by another process meanwhile
+            pass
@@ -0,0 +1,526 @@
+// Roadmap canvas renderer (Streamlit custom component, plain JS, no build step / CDN).
+// The server sends a columnar payload (see views/roadmap_canvas.py::build_canvas_payload);
+// sorting, grouping, filtering, layout and drawing all happen here.
+// Only the rows inside the scroll viewport are drawn, so redraw cost follows the screen size.
+(function () {
+  'use strict';
+
+  const ROW_PX = 28;
+  const HEADER_PX = 36;
+  const BAR_RATIO = 0.7;
+  const MIN_PANEL_PX = 120;
+  const MAX_PANEL_PX = 320;
+  const PAD_DAYS = 30;          // Breathing room after the last End
+  const MS_PER_DAY = 86400000;
+  const STATUS_PRIORITY = ['진행 중', '진행 예정', '진행 완료', '미정', '이슈', '보류', 'DROP', '단순 인입'];
+  const PANEL_FONT = 'bold 13px Arial';
+  const BAR_FONT = 'bold 12px Pretendard, "Apple SD Gothic Neo", Arial';
+
+  const el = (id) => document.getElementById(id);
+  const canvas = el('chart');
+  const ctx = canvas.getContext('2d');
+  const scroller = el('scroller');
+  const spacer = el('spacer');
+  const tooltip = el('tooltip');
+
+  let data = null;              // Decoded payload
+  let maxHeight = 720;
+  let serverGroupCol = null;
+  let groupCol = 'Squad';
+  let search = '';
+  const hidden = new Set();     // Hidden status labels (legend toggles)
+  let zoom = 1;
+  let view = null;              // Current layout (rows, groups, scale)
+  let frame = 0;
+
+  // ---------------------------------------------------------------------------
+  // Streamlit component protocol (postMessage)
+  // ---------------------------------------------------------------------------
+  function send(type, extra) {
+    window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, extra || {}), '*');
+  }
+
+  function setFrameHeight() {
+    send('streamlit:setFrameHeight', { height: document.body.scrollHeight });
+  }
+
+  window.addEventListener('message', (event) => {
+    if (!event.data || event.data.type !== 'streamlit:render') return;
+    const args = event.data.args || {};
+    maxHeight = args.max_height || maxHeight;
+    if (args.group_col !== serverGroupCol) {
+      serverGroupCol = args.group_col;
+      groupCol = args.group_col;
+    }
+    load(args.payload);
+  });
+
+  // ---------------------------------------------------------------------------
+  // Data
+  // ---------------------------------------------------------------------------
+  function load(payload) {
+    const n = payload.n;
+    const empty = () => new Array(n).fill(null);
+    data = {
+      n: n,
+      today: payload.today,
+      start: (payload.days && payload.days.Start) || empty(),
+      end: (payload.days && payload.days.End) || empty(),
+      task: (payload.text && payload.text.Task) || new Array(n).fill(''),
+      codes: payload.codes || {},
+      dicts: payload.dicts || {},
+      panelColors: payload.panel_colors || {},
+      groupCols: payload.group_cols || [],
+      statusStyles: payload.status_styles || {},
+      squadRank: payload.squad_rank || [],
+    };
+    if (!data.groupCols.includes(groupCol)) groupCol = data.groupCols[0] || null;
+    buildControls();
+    relayout();
+  }
+
+  function label(col, i) {
+    const codes = data.codes[col];
+    if (!codes || codes[i] < 0) return '';
+    return data.dicts[col][codes[i]];
+  }
+
+  // Same span rules as views/roadmap.py::_bar_span
+  function span(i) {
+    const s = data.start[i];
+    const e = data.end[i];
+    const t = data.today;
+    if (s === null && e === null) return { marker: true, from: t, to: t };
+    const from = s !== null ? s : Math.min(e, t);
+    const to = e !== null ? e : t;
+    return { marker: false, from: from, to: Math.max(to, from + (e !== null ? 0.5 : 0)) };
+  }
+
+  function statusRank(s) {
+    const r = STATUS_PRIORITY.indexOf(s);
+    return r < 0 ? 999 : r;
+  }
+
+  // ---------------------------------------------------------------------------
+  // Layout
+  // ---------------------------------------------------------------------------
+  function visibleRows() {
+    const needle = search.trim().toLowerCase();
+    const rows = [];
+    for (let i = 0; i < data.n; i++) {
+      if (hidden.has(label('Status', i))) continue;
+      if (needle && !data.task[i].toLowerCase().includes(needle)) continue;
+      rows.push(i);
+    }
+    return rows;
+  }
+
+  function sortRows(rows) {
+    // Gantt order (views/roadmap.py::sort_roadmap_rows): primary group, squad rank, Start
+    const primary = data.codes[groupCol] || [];
+    const squad = data.codes.Squad || [];
+    const rank = (code) => (code < 0 ? 1000 : (data.squadRank[code] !== undefined ? data.squadRank[code] : 999));
+    const last = (code) => (code < 0 ? Infinity : code);  // Missing values sort last
+    const keys = (i) => {
+      const k = [];
+      if (groupCol === 'Squad') k.push(rank(primary[i]), last(primary[i]));
+      else k.push(last(primary[i]), rank(squad[i]), last(squad[i]));
+      k.push(data.start[i] === null ? Infinity : data.start[i]);
+      return k;
+    };
+    const cache = new Map(rows.map((i) => [i, keys(i)]));
+    return rows.sort((a, b) => {
+      const ka = cache.get(a);
+      const kb = cache.get(b);
+      for (let j = 0; j < ka.length; j++) {
+        if (ka[j] !== kb[j]) return ka[j] < kb[j] ? -1 : 1;
+      }
+      return a - b;
+    });
+  }
+
+  function wrapLabel(text, maxPx, maxLines) {
+    ctx.font = PANEL_FONT;
+    const lines = [];
+    let line = '';
+    for (const ch of text) {
+      if (line && ctx.measureText(line + ch).width > maxPx) {
+        lines.push(line.trim());
+        line = ch;
+        if (lines.length === maxLines) break;
+      } else {
+        line += ch;
+      }
+    }
+    if (lines.length < maxLines && line.trim()) lines.push(line.trim());
+    else if (lines.length === maxLines && line) lines[maxLines - 1] = lines[maxLines - 1].slice(0, -1) + '…';
+    return lines;
+  }
+
+  function relayout() {
+    const rows = sortRows(visibleRows());
+    const spans = rows.map(span);
+
+    // Group runs of the primary column
+    const groups = [];
+    const primary = data.codes[groupCol] || [];
+    rows.forEach((i, r) => {
+      const code = primary[i] !== undefined ? primary[i] : -1;
+      const g = groups[groups.length - 1];
+      if (g && g.code === code) g.last = r;
+      else groups.push({ code: code, first: r, last: r });
+    });
+
+    // Panel width from the real rendered label widths
+    ctx.font = PANEL_FONT;
+    let widest = 0;
+    for (const g of groups) {
+      g.label = g.code < 0 ? '(없음)' : data.dicts[groupCol][g.code];
+      g.color = g.code < 0 ? '#888888' : (data.panelColors[groupCol] || [])[g.code] || '#888888';
+      widest = Math.max(widest, ctx.measureText(g.label).width);
+    }
+    const panelPx = Math.max(MIN_PANEL_PX, Math.min(MAX_PANEL_PX, Math.ceil(widest) + 32));
+    for (const g of groups) g.lines = wrapLabel(g.label, panelPx - 16, Math.max(1, Math.min(3, g.last - g.first + 1)));
+
+    let day0 = data.today;
+    let day1 = data.today;
+    for (const s of spans) {
+      day0 = Math.min(day0, s.from);
+      day1 = Math.max(day1, s.to);
+    }
+    day0 -= 7;
+    day1 += PAD_DAYS;
+
+    const contentHeight = HEADER_PX + rows.length * ROW_PX;
+    scroller.style.height = Math.min(maxHeight, contentHeight + 18) + 'px';
+    const viewportWidth = scroller.clientWidth || document.body.clientWidth;
+    const fit = Math.max(0.2, (viewportWidth - panelPx) / Math.max(1, day1 - day0));
+    const pxPerDay = fit * zoom;
+
+    view = { rows, spans, groups, panelPx, day0, day1, pxPerDay };
+    spacer.style.width = Math.ceil(panelPx + (day1 - day0) * pxPerDay) + 'px';
+    spacer.style.height = contentHeight + 'px';
+
+    el('count').textContent = `${rows.length.toLocaleString()}개 과제 / 전체 ${data.n.toLocaleString()}개`;
+    resizeCanvas();
+    setFrameHeight();
+  }
+
+  function resizeCanvas() {
+    const dpr = window.devicePixelRatio || 1;
+    const w = scroller.clientWidth;
+    const h = scroller.clientHeight;
+    canvas.style.width = w + 'px';
+    canvas.style.height = h + 'px';
+    canvas.width = Math.round(w * dpr);
+    canvas.height = Math.round(h * dpr);
+    draw();
+  }
+
+  // ---------------------------------------------------------------------------
+  // Drawing (visible rows only)
+  // ---------------------------------------------------------------------------
+  function roundRect(x, y, w, h, r) {
+    r = Math.min(r, w / 2, h / 2);
+    ctx.beginPath();
+    ctx.moveTo(x + r, y);
+    ctx.arcTo(x + w, y, x + w, y + h, r);
+    ctx.arcTo(x + w, y + h, x, y + h, r);
+    ctx.arcTo(x, y + h, x, y, r);
+    ctx.arcTo(x, y, x + w, y, r);
+    ctx.closePath();
+  }
+
+  function fmtDay(day) {
+    return new Date(day * MS_PER_DAY).toISOString().slice(0, 10);
+  }
+
+  function months(day0, day1) {
+    const d = new Date(day0 * MS_PER_DAY);
+    let y = d.getUTCFullYear();
+    let m = d.getUTCMonth();
+    const out = [];
+    for (;;) {
+      const day = Date.UTC(y, m, 1) / MS_PER_DAY;
+      if (day > day1) break;
+      if (day >= day0) out.push({ day: day, text: `${y}-${String(m + 1).padStart(2, '0')}`, quarter: m % 3 === 0 });
+      m += 1;
+      if (m === 12) { m = 0; y += 1; }
+    }
+    return out;
+  }
+
+  function draw() {
+    frame = 0;
+    if (!view) return;
+    const dpr = window.devicePixelRatio || 1;
+    const W = canvas.width / dpr;
+    const H = canvas.height / dpr;
+    const sx = scroller.scrollLeft;
+    const sy = scroller.scrollTop;
+    const { rows, spans, groups, panelPx, day0, day1, pxPerDay } = view;
+    const x = (day) => panelPx + (day - day0) * pxPerDay - sx;
+    const y = (r) => HEADER_PX + r * ROW_PX - sy;
+
+    ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    ctx.clearRect(0, 0, W, H);
+
+    const r0 = Math.max(0, Math.floor(sy / ROW_PX));
+    const r1 = Math.min(rows.length, Math.ceil((sy + H - HEADER_PX) / ROW_PX) + 1);
+
+    // Zebra rows
+    for (let r = r0; r < r1; r++) {
+      ctx.fillStyle = r % 2 === 0 ? '#F8F8F8' : '#FFFFFF';
+      ctx.fillRect(panelPx, y(r), W - panelPx, ROW_PX);
+    }
+
+    // Month grid
+    const ticks = months(day0, day1);
+    const monthly = pxPerDay * 30 >= 70;
+    ctx.strokeStyle = '#E3E3E3';
+    ctx.lineWidth = 1;
+    for (const t of ticks) {
+      if (!monthly && !t.quarter) continue;
+      const tx = Math.round(x(t.day)) + 0.5;
+      if (tx < panelPx || tx > W) continue;
+      ctx.beginPath();
+      ctx.moveTo(tx, HEADER_PX);
+      ctx.lineTo(tx, H);
+      ctx.stroke();
+    }
+
+    // Bars and date-less markers
+    ctx.font = BAR_FONT;
+    ctx.textBaseline = 'middle';
+    const barH = ROW_PX * BAR_RATIO;
+    for (let r = r0; r < r1; r++) {
+      const i = rows[r];
+      const s = spans[r];
+      const status = label('Status', i);
+      const style = data.statusStyles[status] || { fill: '#888888', border: '#888888', bg_color: '#FFFFFF', text_color: '#000000', icon: '' };
+      const text = style.icon ? `${style.icon} ${data.task[i]}` : data.task[i];
+      const cy = y(r) + ROW_PX / 2;
+
+      if (s.marker) {
+        const mx = x(s.from);
+        ctx.strokeStyle = style.border;
+        ctx.lineWidth = 2;
+        ctx.beginPath();
+        ctx.moveTo(mx, cy - barH / 2);
+        ctx.lineTo(mx, cy + barH / 2);
+        ctx.stroke();
+        ctx.fillStyle = '#000000';
+        ctx.fillText(text, mx + 6, cy);
+        continue;
+      }
+
+      const bx = x(s.from);
+      const bw = Math.max(2, (s.to - s.from) * pxPerDay);
+      if (bx > W || bx + bw < panelPx) continue;
+      roundRect(bx, cy - barH / 2, bw, barH, 8);
+      ctx.fillStyle = style.bg_color || '#FFFFFF';
+      ctx.fill();
+      ctx.strokeStyle = style.border;
+      ctx.lineWidth = 1.5;
+      ctx.stroke();
+
+      const tw = ctx.measureText(text).width;
+      if (tw + 14 <= bw) {
+        ctx.fillStyle = style.text_color || '#000000';
+        ctx.fillText(text, bx + 8, cy);
+      } else {
+        ctx.fillStyle = '#333333';
+        ctx.fillText(text, bx + bw + 6, cy);  // Too narrow: label after the bar
+      }
+    }
+
+    // Today line
+    const todayX = x(data.today);
+    ctx.save();
+    ctx.strokeStyle = 'red';
+    ctx.lineWidth = 1.5;
+    ctx.setLineDash([3, 3]);
+    ctx.beginPath();
+    ctx.moveTo(todayX, HEADER_PX);
+    ctx.lineTo(todayX, H);
+    ctx.stroke();
+    ctx.restore();
+
+    // Group separators + panels (panels stay pinned to the left edge)
+    ctx.fillStyle = '#FFFFFF';
+    ctx.fillRect(0, HEADER_PX, panelPx, H - HEADER_PX);
+    for (const g of groups) {
+      if (g.last < r0 || g.first >= r1) continue;
+      const top = y(g.first);
+      const bottom = y(g.last + 1);
+      if (g.first > 0) {
+        ctx.strokeStyle = '#333333';
+        ctx.lineWidth = 2;
+        ctx.beginPath();
+        ctx.moveTo(0, top);
+        ctx.lineTo(W, top);
+        ctx.stroke();
+      }
+      ctx.fillStyle = g.color;
+      ctx.fillRect(2, top + 2, panelPx - 6, bottom - top - 4);
+
+      // Label centred in the visible part of the panel
+      const visTop = Math.max(top, HEADER_PX);
+      const visBottom = Math.min(bottom, H);
+      const lineH = 16;
+      let ty = (visTop + visBottom) / 2 - ((g.lines.length - 1) * lineH) / 2;
+      ctx.font = PANEL_FONT;
+      ctx.fillStyle = '#FFFFFF';
+      ctx.textAlign = 'center';
+      for (const line of g.lines) {
+        ctx.fillText(line, panelPx / 2 - 2, ty);
+        ty += lineH;
+      }
+      ctx.textAlign = 'left';
+    }
+
+    // Header (time axis)
+    ctx.fillStyle = '#FFFFFF';
+    ctx.fillRect(0, 0, W, HEADER_PX);
+    ctx.strokeStyle = '#CCCCCC';
+    ctx.lineWidth = 1;
+    ctx.beginPath();
+    ctx.moveTo(0, HEADER_PX - 0.5);
+    ctx.lineTo(W, HEADER_PX - 0.5);
+    ctx.stroke();
+    ctx.font = '12px Arial';
+    ctx.fillStyle = '#333333';
+    for (const t of ticks) {
+      if (!monthly && !t.quarter) continue;
+      const tx = x(t.day);
+      if (tx < panelPx - 1 || tx > W) continue;
+      ctx.fillText(t.text, tx + 4, HEADER_PX / 2 + 4);
+    }
+    if (todayX >= panelPx && todayX <= W) {
+      ctx.font = 'bold 11px "Arial Black", Arial';
+      ctx.fillStyle = 'red';
+      ctx.textAlign = 'center';
+      ctx.fillText('Today', todayX, 10);
+      ctx.textAlign = 'left';
+    }
+    ctx.fillStyle = '#FFFFFF';
+    ctx.fillRect(0, 0, panelPx, HEADER_PX - 1);
+    ctx.font = PANEL_FONT;
+    ctx.fillStyle = '#333333';
+    ctx.fillText(groupCol || '', 8, HEADER_PX / 2 + 4);
+  }
+
+  function requestDraw() {
+    if (!frame) frame = window.requestAnimationFrame(draw);
+  }
+
+  // ---------------------------------------------------------------------------
+  // Hover
+  // ---------------------------------------------------------------------------
+  function escapeHtml(s) {
+    return String(s).replace(/[&<>"']/g, (c) => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c]));
+  }
+
+  function hitTest(event) {
+    if (!view) return null;
+    const rect = scroller.getBoundingClientRect();
+    const cx = event.clientX - rect.left;
+    const cy = event.clientY - rect.top;
+    if (cy < HEADER_PX || cx < view.panelPx) return null;
+    const r = Math.floor((cy - HEADER_PX + scroller.scrollTop) / ROW_PX);
+    if (r < 0 || r >= view.rows.length) return null;
+    const s = view.spans[r];
+    const day = view.day0 + (cx - view.panelPx + scroller.scrollLeft) / view.pxPerDay;
+    const slack = 4 / view.pxPerDay;
+    return day >= s.from - slack && day <= s.to + slack ? r : null;
+  }
+
+  function showTooltip(event) {
+    const r = hitTest(event);
+    if (r === null) {
+      tooltip.style.display = 'none';
+      return;
+    }
+    const i = view.rows[r];
+    const s = view.spans[r];
+    const period = s.marker ? 'Unknown ~ Ongoing'
+      : `${fmtDay(s.from)} ~ ${data.end[i] !== null ? fmtDay(data.end[i]) : 'Ongoing'}`;
+    const fields = [['Squad', label('Squad', i)], ['Type', label('Type', i)], ['Status', label('Status', i)], ['Period', period]];
+    if (label('Comment', i)) fields.push(['Comment', label('Comment', i)]);
+    tooltip.innerHTML = `<div style="font-size:14px; font-weight:bold; margin-bottom:6px;">${escapeHtml(data.task[i])}</div>`
+      + fields.map(([k, v]) => `<b>${k}:</b> ${escapeHtml(v)}`).join('<br>');
+    tooltip.style.display = 'block';
+    const left = Math.min(event.clientX + 14, window.innerWidth - tooltip.offsetWidth - 8);
+    const top = Math.min(event.clientY + 14, window.innerHeight - tooltip.offsetHeight - 8);
+    tooltip.style.left = Math.max(0, left) + 'px';
+    tooltip.style.top = Math.max(0, top) + 'px';
+  }
+
+  // ---------------------------------------------------------------------------
+  // Controls (all client-side; no Streamlit rerun)
+  // ---------------------------------------------------------------------------
+  function buildControls() {
+    const select = el('group');
+    select.innerHTML = '';
+    for (const col of data.groupCols) {
+      const option = document.createElement('option');
+      option.value = col;
+      option.textContent = col;
+      option.selected = col === groupCol;
+      select.appendChild(option);
+    }
+
+    const legend = el('legend');
+    legend.innerHTML = '';
+    const counts = new Map();
+    for (let i = 0; i < data.n; i++) {
+      const s = label('Status', i);
+      counts.set(s, (counts.get(s) || 0) + 1);
+    }
+    const statuses = [...counts.keys()].sort((a, b) => statusRank(a) - statusRank(b) || (a < b ? -1 : a > b ? 1 : 0));
+    for (const s of statuses) {
+      const style = data.statusStyles[s] || { fill: '#888888', border: '#888888', bg_color: '#FFFFFF', text_color: '#333333', icon: '' };
+      const chip = document.createElement('span');
+      chip.className = 'chip' + (hidden.has(s) ? ' off' : '');
+      chip.style.borderColor = style.border;
+      chip.style.background = style.bg_color || '#FFFFFF';
+      chip.style.color = style.text_color || '#333333';
+      chip.textContent = `${style.icon ? style.icon + ' ' : ''}${s || '(없음)'} ${counts.get(s)}`;
+      chip.addEventListener('click', () => {
+        if (hidden.has(s)) hidden.delete(s);
+        else hidden.add(s);
+        chip.classList.toggle('off', hidden.has(s));
+        relayout();
+      });
+      legend.appendChild(chip);
+    }
+  }
+
+  el('group').addEventListener('change', (event) => {
+    groupCol = event.target.value;
+    relayout();
+  });
+
+  let searchTimer = 0;
+  el('search').addEventListener('input', (event) => {
+    window.clearTimeout(searchTimer);
+    searchTimer = window.setTimeout(() => {
+      search = event.target.value;
+      relayout();
+    }, 150);
+  });
+
+  el('zoom-in').addEventListener('click', () => { zoom *= 1.5; relayout(); });
+  el('zoom-out').addEventListener('click', () => { zoom = Math.max(1, zoom / 1.5); relayout(); });
+  el('zoom-fit').addEventListener('click', () => { zoom = 1; relayout(); });
+
+  scroller.addEventListener('scroll', () => {
+    tooltip.style.display = 'none';
+    requestDraw();
+  });
+  scroller.addEventListener('mousemove', showTooltip);
+  scroller.addEventListener('mouseleave', () => { tooltip.style.display = 'none'; });
+  window.addEventListener('resize', () => { if (data) relayout(); });
+
+  send('streamlit:componentReady', { apiVersion: 1 });
+})();
@@ -0,0 +1,62 @@
+// Debounced search box: sends the value to Streamlit once typing pauses (or on Enter),
+// so the script reruns once per pause instead of once per keystroke.
+(function () {
+  'use strict';
+
+  const input = document.getElementById('search');
+  const label = document.getElementById('label');
+  let debounceMs = 300;
+  let timer = null;
+  let sent = null;              // Last value sent to (or received from) the server
+
+  // ---------------------------------------------------------------------------
+  // Streamlit component protocol (postMessage)
+  // ---------------------------------------------------------------------------
+  function send(type, extra) {
+    window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, extra || {}), '*');
+  }
+
+  function setFrameHeight() {
+    send('streamlit:setFrameHeight', { height: document.body.scrollHeight });
+  }
+
+  function commit() {
+    clearTimeout(timer);
+    timer = null;
+    if (input.value === sent) return;
+    sent = input.value;
+    send('streamlit:setComponentValue', { value: sent, dataType: 'json' });
+  }
+
+  window.addEventListener('message', (event) => {
+    if (!event.data || event.data.type !== 'streamlit:render') return;
+    const args = event.data.args || {};
+    const theme = event.data.theme;
+    label.textContent = args.label || '';
+    input.placeholder = args.placeholder || '';
+    debounceMs = args.debounce_ms || debounceMs;
+    if (theme) {
+      document.body.style.color = theme.textColor || '';
+      input.style.background = theme.secondaryBackgroundColor || '';
+    }
+    // Server value only when the frame is (re)mounted, e.g. after a page switch: later renders may
+    // carry a value older than what the user has typed since
+    if (sent === null) {
+      sent = args.value || '';
+      input.value = sent;
+    }
+    setFrameHeight();
+  });
+
+  input.addEventListener('input', () => {
+    clearTimeout(timer);
+    timer = setTimeout(commit, debounceMs);
+  });
+  input.addEventListener('keydown', (event) => {
+    if (event.key === 'Enter') commit();
+  });
+  input.addEventListener('blur', commit);
+
+  send('streamlit:componentReady', { apiVersion: 1 });
+  setFrameHeight();
+})();
@@ -0,0 +1,70 @@
+"""
+Roadmap Gantt benchmark: figure build time and JSON payload size for synthetic roadmaps.
+
+    python benchmark_gantt.py            # 100 / 500 / 2000 tasks
+    python benchmark_gantt.py 300 3000   # custom sizes
+"""
+import sys
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+import utils
+from logic import process_data
+from views import roadmap
+
+STATUSES = ['진행 중', '진행 예정', '진행 완료', '이슈', '보류', 'DROP']
+SQUADS = ['공통', '회원', '커머스', '팬덤', 'Platform', 'Data', 'Infra', 'Growth']
+
+
+def make_roadmap(n_tasks, seed=0):
+    """Synthetic raw sheet shaped like the Google Sheet export."""
+    rng = np.random.default_rng(seed)
+    today = pd.Timestamp.today().normalize()
+    start = today + pd.to_timedelta(rng.integers(-180, 180, n_tasks), 'D')
+    end = start + pd.to_timedelta(rng.integers(3, 150, n_tasks), 'D')
+    start_str = pd.Series(start.strftime('%Y-%m-%d'))
+    end_str = pd.Series(end.strftime('%Y-%m-%d'))
+    start_str[rng.random(n_tasks) < 0.05] = ''
+    end_str[rng.random(n_tasks) < 0.05] = ''
+    return pd.DataFrame({
+        'squad': rng.choice(SQUADS, n_tasks),
+        'project_name': rng.choice([f'프로젝트 {i}' for i in range(max(1, n_tasks // 10))], n_tasks),
+        'subproject_name': [f'과제 {i}' for i in range(n_tasks)],
+        'start_date': start_str,
+        'end_date': end_str,
+        'status': rng.choice(STATUSES, n_tasks),
+        'sub_goal': rng.choice(['성장', '안정화', '효율'], n_tasks),
+        'type': rng.choice(['Project', 'Task'], n_tasks),
+        'comment': rng.choice(['', '일정 협의 필요 ' * 8, '리소스 확인 중'], n_tasks),
+    })
+
+
+def measure(n_tasks, group_col='Squad', repeat=3):
+    df = process_data.__wrapped__(make_roadmap(n_tasks))
+    build = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fig = roadmap.create_professional_gantt.__wrapped__(df, group_col)
+        build.append(time.perf_counter() - t0)
+    payload = len(fig.to_json().encode('utf-8'))
+    return {
+        'tasks': n_tasks,
+        'group_by': group_col,
+        'traces': len(fig.data),
+        'shapes': len(fig.layout.shapes),
+        'annotations': len(fig.layout.annotations),
+        'build_s': round(min(build), 3),
+        'json_kb': round(payload / 1024, 1),
+        'json_kb_per_100': round(payload / 1024 / n_tasks * 100, 1),
+    }
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [100, 500, 2000]
+    # Keep the benchmark offline / deterministic (no Google Sheet squad order)
+    with patch.object(utils, 'get_custom_squad_order', lambda: []):
+        results = pd.DataFrame([measure(n, g) for n in sizes for g in ['Squad', 'Status']])
+    print(results.to_string(index=False))
@@ -0,0 +1,301 @@
+## 메모리 상한이 있는 결과 캐시 관련 로직은 이 파일에서 중앙 관리
+## st.cache_data는 항목 수/크기 제한 없이 TTL까지 결과를 쌓아 두므로, 사용자 입력(시트 ID, 필터 조합)에 따라
+## 항목이 무한히 늘어나는 함수는 이 캐시를 사용한다. 항목마다 직렬화 크기를 기록하고, 전체 예산을 넘으면
+## 가장 오래 사용되지 않은 항목부터 제거한다(LRU). 적중/실패/제거 횟수는 stats()로 확인한다.
+## 다중 프로세스 모드(shared_cache)에서는 로컬에 없는 결과를 공유 디스크 캐시에서 먼저 찾고, 계산한 결과도 함께 저장한다.
+
+import functools
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from shared_cache import shared_cache_from_env
+
+CACHE_BUDGET_BYTES = 256 * 1024 * 1024  # Shared by every bounded_cache function in the process
+
+
+def _hash_value(digest, value):
+    """Feeds a stable representation of a cache argument into digest (DataFrames by content)."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(type(value).__name__.encode())
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(zip(value.columns, value.dtypes.astype(str)))).encode('utf-8'))
+        else:
+            digest.update(f"{value.name!r}:{value.dtype}".encode('utf-8'))
+        try:
+            hashed = pd.util.hash_pandas_object(value, index=True)
+        except TypeError:  # Unhashable cells (lists, dicts)
+            hashed = pd.util.hash_pandas_object(value.astype(str), index=True)
+        digest.update(hashed.to_numpy().tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}[{len(value)}]".encode())
+        for item in value:
+            _hash_value(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict[{len(value)}]".encode())
+        for k in sorted(value, key=repr):
+            _hash_value(digest, k)
+            _hash_value(digest, value[k])
+    else:
+        digest.update(f"{type(value).__name__}:{value!r}".encode('utf-8'))
+    digest.update(b'\x1e')
+
+
+def cache_key(func_name, args, kwargs):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(func_name.encode())
+    _hash_value(digest, args)
+    _hash_value(digest, kwargs)
+    return digest.hexdigest()
+
+
+class _Entry:
+    __slots__ = ('func', 'payload', 'expires')
+
+    def __init__(self, func, payload, expires):
+        self.func = func
+        self.payload = payload
+        self.expires = expires
+
+
+class BoundedCache:
+    """
+    Process-wide LRU cache of pickled results under one byte budget.
+    Entries are stored serialized (like st.cache_data), so their size is known exactly and
+    every hit returns an independent copy. A result larger than the whole budget is not stored.
+    With a SharedCache (multi-process mode), local misses are looked up there before computing.
+    """
+
+    def __init__(self, max_bytes=CACHE_BUDGET_BYTES, shared=None):
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> _Entry, least recently used first
+        self._key_locks = {}           # key -> [lock held while the value is computed, callers holding or awaiting it]
+        self._bytes = 0
+        self._counters = {}            # func -> {'hits', 'misses', 'shared_hits', 'evictions'}
+        self._generation = None
+        self._epoch = None             # Last seen SharedCache epoch
+
+    def _count(self, func, name):
+        counters = self._counters.setdefault(func, {'hits': 0, 'misses': 0, 'shared_hits': 0, 'evictions': 0})
+        counters[name] += 1
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.payload)
+        return entry
+
+    def _clear_entries(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def sync_generation(self, generation):
+        """
+        Drops every entry when st.cache_data was cleared since the last call (refresh / save buttons).
+        In multi-process mode such a clear also clears the shared cache, and a clear by another process
+        (epoch change) drops this process's entries.
+        """
+        with self._lock:
+            cleared = self._generation is not None and generation != self._generation
+            if generation != self._generation:
+                self._generation = generation
+                self._clear_entries()
+        if self.shared is None:
+            return
+        if cleared:
+            self.shared.clear()
+        epoch = self.shared.epoch()
+        with self._lock:
+            if epoch != self._epoch:
+                if self._epoch is not None:
+                    self._clear_entries()
+                self._epoch = epoch
+
+    def get(self, func, key, count=True):
+        """(True, value) on a fresh hit, else (False, None). count=False: do not update the hit/miss counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires is not None and entry.expires <= time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                if count:
+                    self._count(func, 'misses')
+                return False, None
+            self._entries.move_to_end(key)
+            if count:
+                self._count(func, 'hits')
+            payload = entry.payload
+        return True, pickle.loads(payload)
+
+    def put(self, func, key, value, ttl=None):
+        self.put_payload(func, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ttl)
+
+    def put_payload(self, func, key, payload, ttl=None):
+        if len(payload) > self.max_bytes or (ttl is not None and ttl <= 0):
+            return
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(func, payload, expires)
+            self._bytes += len(payload)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.payload)
+                self._count(evicted.func, 'evictions')
+
+    def shared_lookup(self, func, key, compute, ttl=None):
+        """
+        (value, payload, expires) via the shared cache: another process's result, or compute() run here and
+        published for the others. Without a shared cache: (compute(), None, None).
+        """
+        if self.shared is None:
+            return compute(), None, None
+        computed = []
+
+        def dump():
+            computed.append(compute())
+            return pickle.dumps(computed[0], protocol=pickle.HIGHEST_PROTOCOL)
+
+        payload, expires, _ = self.shared.get_or_compute(func, key, dump, ttl)
+        if computed:
+            return computed[0], payload, expires
+        with self._lock:
+            self._count(func, 'shared_hits')
+        return pickle.loads(payload), payload, expires
+
+    def peek(self, func, key):
+        """(True, value) if key is cached here or in the shared cache, else (False, None); never computes."""
+        hit, value = self.get(func, key, count=False)
+        if hit or self.shared is None:
+            return hit, value
+        found = self.shared.get(key)
+        if found is None:
+            return False, None
+        payload, expires = found
+        self.put_payload(func, key, payload, expires - time.time() if expires is not None else None)
+        with self._lock:
+            self._count(func, 'shared_hits')
+        return True, pickle.loads(payload)
+
+    def key_lock(self, key):
+        """The computation lock for key; every call must be paired with release_key_lock(key)."""
+        with self._lock:
+            slot = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+            return slot[0]
+
+    def release_key_lock(self, key):
+        """Drops the lock once no caller holds or awaits it (a result that was not stored keeps callers serialized)."""
+        with self._lock:
+            slot = self._key_locks[key]
+            slot[1] -= 1
+            if slot[1] == 0:
+                del self._key_locks[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._counters.clear()
+
+    def stats(self) -> pd.DataFrame:
+        """
+        One row per function: Function, Entries, Bytes, Hits, Misses, Shared_Hits, Evictions
+        (Shared_Hits: local misses served by another process's result).
+        """
+        with self._lock:
+            rows = {func: [0, 0, c['hits'], c['misses'], c['shared_hits'], c['evictions']] for func, c in self._counters.items()}
+            for entry in self._entries.values():
+                row = rows.setdefault(entry.func, [0, 0, 0, 0, 0, 0])
+                row[0] += 1
+                row[1] += len(entry.payload)
+        return pd.DataFrame(
+            [(func, *row) for func, row in sorted(rows.items())],
+            columns=['Function', 'Entries', 'Bytes', 'Hits', 'Misses', 'Shared_Hits', 'Evictions'],
+        )
+
+    def summary(self) -> dict:
+        """Totals over all functions plus the budget."""
+        stats = self.stats()
+        lookups = int(stats['Hits'].sum() + stats['Misses'].sum())
+        return {
+            'budget_bytes': self.max_bytes,
+            'bytes': int(stats['Bytes'].sum()),
+            'entries': int(stats['Entries'].sum()),
+            'hits': int(stats['Hits'].sum()),
+            'misses': int(stats['Misses'].sum()),
+            'shared_hits': int(stats['Shared_Hits'].sum()),
+            'evictions': int(stats['Evictions'].sum()),
+            'hit_rate': stats['Hits'].sum() / lookups if lookups else 0.0,
+        }
+
+
+@st.cache_resource(show_spinner=False)
+def get_cache() -> BoundedCache:
+    return BoundedCache(shared=shared_cache_from_env())
+
+
+@st.cache_data(show_spinner=False)
+def _generation():
+    """Changes whenever st.cache_data is cleared, so the bounded caches follow the existing refresh buttons."""
+    return time.time_ns()
+
+
+def _call(func, show_spinner, args, kwargs):
+    if show_spinner and get_script_run_ctx(suppress_warning=True) is not None:
+        with st.spinner(show_spinner) if isinstance(show_spinner, str) else st.spinner():
+            return func(*args, **kwargs)
+    return func(*args, **kwargs)
+
+
+def bounded_cache(ttl=None, show_spinner=False):
+    """
+    Drop-in for @st.cache_data(ttl=..., show_spinner=...) on functions whose argument space is open-ended:
+    results share the process-wide byte budget (LRU eviction) instead of growing until the TTL,
+    and in multi-process mode every process reuses a result computed by any of them.
+    The undecorated function stays available as `__wrapped__`; `peek(*args, **kwargs)` returns
+    (True, cached result) or (False, None) without running it.
+    """
+    def decorator(func):
+        func_name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_cache()
+            cache.sync_generation(_generation())
+            key = cache_key(func_name, args, kwargs)
+            hit, value = cache.get(func_name, key)
+            if hit:
+                return value
+
+            try:
+                with cache.key_lock(key):  # Concurrent callers (e.g. the precompute thread) wait for one computation
+                    hit, value = cache.get(func_name, key, count=False)
+                    if hit:
+                        return value
+                    value, payload, expires = cache.shared_lookup(func_name, key, lambda: _call(func, show_spinner, args, kwargs), ttl)
+                    if payload is None:
+                        cache.put(func_name, key, value, ttl)
+                    else:  # Keep the shared entry's remaining lifetime
+                        cache.put_payload(func_name, key, payload, expires - time.time() if expires is not None else None)
+                    return value
+            finally:
+                cache.release_key_lock(key)
+
+        def peek(*args, **kwargs):
+            cache = get_cache()
+            cache.sync_generation(_generation())
+            return cache.peek(func_name, cache_key(func_name, args, kwargs))
+
+        wrapper.peek = peek
+        return wrapper
+    return decorator
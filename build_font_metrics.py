@@ -0,0 +1,79 @@
+"""
+Regenerates assets/font_metrics.json (glyph advance tables used by text_metrics) from font files.
+
+    python build_font_metrics.py "Arial Bold=/path/arialbd.ttf,/path/AppleSDGothicNeo.ttc" "Arial=,/path/NanumBarunGothic.ttf"
+
+Each argument is `name=font file[,Hangul font file]`. The printable ASCII advances are stored per font
+(units per 1000 em) and Hangul/CJK glyphs use the font's `wide` advance (measured on '가'), anything else
+uses `default`. Latin-only fonts draw Hangul in the browser's fallback font, so pass that font as the second
+file; without one (and for fonts that do not contain Hangul) `wide` is not measured. An empty font file
+keeps the font's current ASCII table (e.g. the Helvetica AFM advances Arial shares) and measures `wide` only.
+Only entries with `"measured": true` are used for layout (text_metrics.has_font_metrics); the others
+fall back to the visual-width heuristics. Fonts not given on the command line keep their current entry.
+
+Dev-only dependency: Pillow (pip install pillow), not needed to run the app.
+"""
+import json
+import os
+import sys
+
+from PIL import ImageFont
+
+METRICS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'font_metrics.json')
+ASCII_RANGE = range(0x20, 0x7F)
+UNITS_PER_EM = 1000
+HANGUL_SAMPLE = '가'  # Hangul syllables share one advance in Korean fonts
+MISSING_GLYPH = '\uffff'  # Noncharacter: always drawn as .notdef
+
+
+def measure_ascii(path):
+    """ASCII advances (per 1000 em) and a default advance (average lowercase) for one font file."""
+    font = ImageFont.truetype(path, UNITS_PER_EM)
+    ascii_advances = [round(font.getlength(chr(c))) for c in ASCII_RANGE]
+    lowercase = ascii_advances[ord('a') - 0x20:ord('z') - 0x20 + 1]
+    return {'ascii': ascii_advances, 'default': round(sum(lowercase) / len(lowercase)), 'source': os.path.basename(path)}
+
+
+def measure_wide(hangul_path):
+    """Wide advance ('가', per 1000 em) from a font file that contains Hangul."""
+    hangul = ImageFont.truetype(hangul_path, UNITS_PER_EM)
+    if hangul.getmask(HANGUL_SAMPLE).getbbox() == hangul.getmask(MISSING_GLYPH).getbbox():
+        raise SystemExit(f"{hangul_path} has no Hangul glyphs (pass the Hangul fallback font)")
+    return {'wide': round(hangul.getlength(HANGUL_SAMPLE)), 'wide_source': os.path.basename(hangul_path), 'measured': True}
+
+
+def dump_metrics(metrics, f):
+    """Writes the metrics file with one line per font (keeps the file small and diffable)."""
+    fonts = metrics['fonts']
+    header = {k: v for k, v in metrics.items() if k != 'fonts'}
+    f.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "fonts": {\n')
+    f.write(',\n'.join(
+        f"  {json.dumps(name, ensure_ascii=False)}: {json.dumps(entry, ensure_ascii=False, separators=(',', ':'))}"
+        for name, entry in fonts.items()
+    ))
+    f.write('\n}}\n')
+
+
+def main(args):
+    with open(METRICS_PATH, encoding='utf-8') as f:
+        metrics = json.load(f)
+
+    for arg in args:
+        name, paths = arg.split('=', 1)
+        path, _, hangul_path = paths.partition(',')
+        entry = metrics['fonts'].get(name, {'wide': UNITS_PER_EM})
+        if path:
+            entry.update(measure_ascii(path))
+        elif 'ascii' not in entry:
+            raise SystemExit(f"{name} has no ASCII table yet (pass its font file)")
+        entry.update(measure_wide(hangul_path) if hangul_path
+                     else {'measured': False, 'wide_source': 'assumed 1 em (not measured)'})
+        metrics['fonts'][name] = entry
+        print(f"{name}: {path or 'ASCII table kept'}, Hangul: {hangul_path or 'not measured'}")
+
+    with open(METRICS_PATH, 'w', encoding='utf-8') as f:
+        dump_metrics(metrics, f)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,84 @@
+## 데이터 소스(로드맵 / 리소스 / 가중치) 지연 로딩 관련 로직은 이 파일에서 중앙 관리
+## 페이지마다 사용하는 소스를 PAGE_SOURCES에 선언하고, 각 소스는 처음 요청될 때 한 번만 불러온다.
+## 세션에서 이미 불러온 값은 다음 rerun에도 기억해 두어, 다른 페이지의 사전 계산(precompute)이 불러오기 없이 사용한다.
+
+import threading
+
+# Type weight sheet (Project/Task weights used by the resource analysis)
+WEIGHT_SHEET_ID = "1XwHp_Lm7FQEmZzib8qJ1C1Q--ogCTKPXcHYhMlkE-Ts"
+WEIGHT_SHEET_GID = "520843420"
+
+# Sources each page consumes (keys of app.PAGES -> source names)
+PAGE_SOURCES = {
+    "로드맵": ('roadmap',),
+    "리소스 및 이슈": ('roadmap', 'resource', 'weights'),
+    "데이터 수정": ('roadmap',),
+}
+
+
+class DataSources:
+    """
+    Named data loaders for one rerun, resolved lazily: the first get(name) runs the loader and
+    later calls return the same value, so a source no page asks for is never loaded.
+    Each source also has a key (e.g. sheet id / gid) that identifies its data without loading it.
+    memory (the session's dict, kept across reruns) remembers the last value loaded per source and key,
+    so resolved() can hand data loaded on an earlier rerun to the precompute job.
+    Thread-safe: concurrent get(name) calls load a source once.
+    """
+
+    def __init__(self, memory=None):
+        self._loaders = {}
+        self._keys = {}
+        self._peeks = {}
+        self._values = {}
+        self._locks = {}
+        self._memory = memory if memory is not None else {}  # name -> (key, value) of the last load in the session
+
+    def register(self, name, loader, key=None, peek=None):
+        """
+        loader: zero-argument callable returning the source's value (None = not available).
+        peek: optional zero-argument callable returning the value when it is available without loading
+        (e.g. already in the process-wide cache), else None.
+        """
+        self._loaders[name] = loader
+        self._keys[name] = key
+        self._locks[name] = threading.Lock()
+        if peek is not None:
+            self._peeks[name] = peek
+
+    def key(self, name):
+        return self._keys.get(name)
+
+    def loaded(self, name):
+        return name in self._values
+
+    def get(self, name):
+        if name not in self._loaders:
+            return None
+        with self._locks[name]:
+            if name not in self._values:
+                self._values[name] = self._loaders[name]()
+                self._memory[name] = (self._keys[name], self._values[name])
+            return self._values[name]
+
+    def _available(self, name):
+        """(True, value) if name is available without running its loader, else (False, None)."""
+        if name in self._values:
+            return True, self._values[name]
+        remembered = self._memory.get(name)
+        if remembered is not None and remembered[0] == self._keys.get(name):
+            return True, remembered[1]
+        value = self._peeks[name]() if name in self._peeks else None
+        return value is not None, value
+
+    def resolved(self, page):
+        """
+        {source name: value} for the sources of `page` available without loading (never runs a loader):
+        loaded in this rerun, loaded on an earlier rerun of the session with the same key, or peeked.
+        """
+        found = {name: self._available(name) for name in PAGE_SOURCES.get(page, ())}
+        return {name: value for name, (ok, value) in found.items() if ok}
+
+    def resolve(self, page):
+        """{source name: value} for the sources `page` declares in PAGE_SOURCES."""
+        return {name: self.get(name) for name in PAGE_SOURCES.get(page, ())}
@@ -0,0 +1,201 @@
+## 세션 간 공유 데이터셋 저장소 관련 로직은 이 파일에서 중앙 관리
+## st.cache_data는 세션/리런마다 DataFrame을 복사해 주므로, 로드맵 데이터는 버전(내용 해시)당 한 벌만 보관하고
+## 모든 세션에 읽기 전용 뷰(얕은 복사, Copy-on-Write)로 나눠 준다. 어떤 세션도 참조하지 않는 이전 버전은 바로 제거한다.
+## 다중 프로세스 모드에서는 버전별 처리 결과를 공유 캐시에 올려, 한 프로세스만 처리하고 나머지는 그대로 가져다 쓴다.
+## 이때 DataFrame은 Arrow IPC 파일로 한 번만 쓰고, 모든 프로세스가 메모리 매핑해 복사 없이 공유한다(arrow_store).
+
+import hashlib
+import threading
+import time
+import weakref
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import arrow_store
+from bounded_cache import cache_key, get_cache
+from utils import shallow_copy
+
+DATASET_TTL_S = 600  # Same as gsheet_handler.load_data: the source is re-read after this
+
+
+def dataset_version(raw_df: pd.DataFrame) -> str:
+    """Content hash of a raw sheet (column names, then every cell in order)."""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update('\x1f'.join(str(c) for c in raw_df.columns).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(raw_df.astype(str), index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class Dataset:
+    """
+    One immutable version of a source. `frames` is the build result ({'raw', 'processed', 'keys', ...});
+    it is never modified after publishing - callers get view() copies that share the column data.
+    """
+
+    def __init__(self, source, version, frames, stamp):
+        self.source = source
+        self.version = version
+        self.frames = frames
+        self.stamp = stamp
+
+    def view(self, name):
+        """Shallow copy of a stored frame: no data is copied, and with Copy-on-Write writes never reach the store."""
+        value = self.frames.get(name)
+        return shallow_copy(value) if isinstance(value, (pd.DataFrame, pd.Series)) else value
+
+    def nbytes(self):
+        return sum(int(v.memory_usage(deep=True).sum()) for v in self.frames.values() if isinstance(v, pd.DataFrame))
+
+
+class DatasetStore:
+    """
+    Process-wide store: one Dataset per (source, version), shared by every session.
+    Sessions hold one version per source (acquire); a version that is no longer current
+    is evicted as soon as no session holds it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current = {}   # source -> Dataset
+        self._datasets = {}  # (source, version) -> Dataset
+        self._holders = {}   # (source, version) -> session ids
+        self._sessions = {}  # session id -> {source: version}
+
+    def current(self, source):
+        with self._lock:
+            return self._current.get(source)
+
+    def publish(self, source, raw_df, build, stamp=None, version=None):
+        """
+        Makes raw_df the current version of source and returns its Dataset.
+        build(raw_df, previous frames or None) -> frames runs only for new content (outside the lock);
+        identical content keeps the existing Dataset. version: dataset_version(raw_df) if already known.
+        """
+        version = version or dataset_version(raw_df)
+        with self._lock:
+            dataset = self._datasets.get((source, version))
+            if dataset is not None:
+                return self._make_current(dataset, stamp)
+            previous = self._current.get(source)
+
+        frames = build(raw_df, previous.frames if previous is not None else None)
+        frames.setdefault('raw', raw_df)
+        with self._lock:
+            dataset = self._datasets.get((source, version))  # Another session may have built it meanwhile
+            if dataset is None:
+                dataset = Dataset(source, version, frames, stamp)
+                self._datasets[(source, version)] = dataset
+                self._holders[(source, version)] = set()
+            return self._make_current(dataset, stamp)
+
+    def _make_current(self, dataset, stamp):
+        dataset.stamp = stamp
+        previous = self._current.get(dataset.source)
+        self._current[dataset.source] = dataset
+        if previous is not None and previous is not dataset:
+            self._evict_unused(previous.source, previous.version)
+        return dataset
+
+    def acquire(self, session_id, dataset):
+        """session_id now uses `dataset` for its source (its previous version of the source is released)."""
+        with self._lock:
+            held = self._sessions.setdefault(session_id, {})
+            old = held.get(dataset.source)
+            if old == dataset.version:
+                return
+            held[dataset.source] = dataset.version
+            self._holders.setdefault((dataset.source, dataset.version), set()).add(session_id)
+            if old is not None:
+                self._holders.get((dataset.source, old), set()).discard(session_id)
+                self._evict_unused(dataset.source, old)
+
+    def release_session(self, session_id):
+        """Drops every version the session holds (called when the session ends)."""
+        with self._lock:
+            for source, version in self._sessions.pop(session_id, {}).items():
+                self._holders.get((source, version), set()).discard(session_id)
+                self._evict_unused(source, version)
+
+    def _evict_unused(self, source, version):
+        current = self._current.get(source)
+        if self._holders.get((source, version)) or (current is not None and current.version == version):
+            return
+        self._datasets.pop((source, version), None)
+        self._holders.pop((source, version), None)
+
+    def stats(self) -> pd.DataFrame:
+        """One row per stored version: Source, Version, Current, Sessions, Bytes."""
+        with self._lock:
+            rows = [
+                (str(source), version, self._current.get(source) is ds, len(self._holders.get((source, version), ())), ds.nbytes())
+                for (source, version), ds in self._datasets.items()
+            ]
+        return pd.DataFrame(rows, columns=['Source', 'Version', 'Current', 'Sessions', 'Bytes'])
+
+
+@st.cache_resource(show_spinner=False)
+def get_store() -> DatasetStore:
+    return DatasetStore()
+
+
+@st.cache_data(ttl=DATASET_TTL_S, show_spinner=False)
+def _source_stamp(source):
+    """Changes when the source's TTL expires or st.cache_data is cleared (refresh / save buttons)."""
+    return time.time_ns()
+
+
+class _SessionLease:
+    """Kept in st.session_state; releases the session's datasets once the session (and its state) is dropped."""
+
+    def __init__(self, store, session_id):
+        self.session_id = session_id
+        weakref.finalize(self, store.release_session, session_id)
+
+
+def _session_id():
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+def _shared_build(source, version, build):
+    """
+    build, run by one process per version in multi-process mode: its DataFrames are written once as
+    Arrow IPC files and every process (the builder included) memory-maps them instead of holding a copy.
+    """
+    cache = get_cache()
+    if cache.shared is None:
+        return build
+    key = cache_key('dataset_store.frames', (source, version), {})
+
+    def build_mapped(raw_df, previous):
+        def externalized():
+            return arrow_store.externalize(build(raw_df, previous), cache.shared.files_dir, key)
+        refs = cache.shared_lookup('dataset_store.frames', key, externalized, DATASET_TTL_S)[0]
+        return arrow_store.materialize(refs)
+    return build_mapped
+
+
+def load_dataset(source, loader, build):
+    """
+    Current Dataset of `source` (hashable, e.g. ('gsheet', sheet id, gid)) for this session.
+    loader() -> raw DataFrame runs only when the source's stamp changed; build(raw_df, previous frames)
+    runs only for new content. Returns None when the loader returns nothing.
+    """
+    store = get_store()
+    stamp = _source_stamp(source)
+    dataset = store.current(source)
+    if dataset is None or dataset.stamp != stamp:
+        raw_df = loader()
+        if raw_df is None or raw_df.empty:
+            return None
+        version = dataset_version(raw_df)
+        dataset = store.publish(source, raw_df, _shared_build(source, version, build), stamp, version=version)
+
+    session_id = _session_id()
+    if session_id is not None:
+        if 'dataset_lease' not in st.session_state:
+            st.session_state['dataset_lease'] = _SessionLease(store, session_id)
+        store.acquire(session_id, dataset)
+    return dataset
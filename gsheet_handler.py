@@ -2,12 +2,13 @@
 
 import streamlit as st
 import pandas as pd
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 from datetime import datetime
 import os
 import unicodedata
 
+from bounded_cache import bounded_cache
+from utils import shallow_copy
+
 # Scope for Google Sheets API
 SCOPE = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
 
@@ -15,6 +16,10 @@ def connect_to_sheet():
     """
     Connects to Google Sheets using Streamlit secrets.
     """
+    # Imported on first connection: gspread + oauth2client add ~0.4 s to a cold start
+    import gspread
+    from oauth2client.service_account import ServiceAccountCredentials
+
     try:
         # Expecting secrets to be set in .streamlit/secrets.toml
         # [gcp_service_account]
@@ -45,6 +50,8 @@ def _get_worksheet(sheet, worksheet_name):
     """
     Helper to find a worksheet by name, index, or GID.
     """
+    import gspread  # Already loaded by connect_to_sheet
+
     try:
         # First, check if it matches a GID exactly (as string or int)
         target_gid_str = str(worksheet_name)
@@ -72,7 +79,7 @@ def _get_worksheet(sheet, worksheet_name):
         st.error(f"❌ Error finding worksheet: {e}")
         return None
 
-@st.cache_data(ttl=600)
+@bounded_cache(ttl=600)  # Keyed on whatever sheet id / worksheet the user types
 def load_data(sheet_url_or_id: str, worksheet_name: str = 0) -> pd.DataFrame:
     """
     Loads data from a specific worksheet.
@@ -83,6 +90,7 @@ def load_data(sheet_url_or_id: str, worksheet_name: str = 0) -> pd.DataFrame:
     client = connect_to_sheet()
     if not client:
         return pd.DataFrame() # Return empty on failure
+    import gspread  # Loaded by connect_to_sheet
         
     try:
         # Try opening sheet
@@ -138,8 +146,8 @@ def save_snapshot(sheet_url_or_id: str, df: pd.DataFrame, master_worksheet_name:
         # ---------------------------------------------------------------------
         # SAFE SERIALIZATION LOGIC (CRITICAL FIX)
         # ---------------------------------------------------------------------
-        # Create a copy to avoid modifying the displayed DF safely
-        df_to_save = df.copy()
+        # Shallow copy: with Copy-on-Write the conversions below never modify the displayed DF
+        df_to_save = shallow_copy(df)
         print(f"DEBUG: Saving data to {master_worksheet_name}. Shape: {df_to_save.shape}")
         
         # [Fix] Convert Categorical types to Object to prevent "Cannot setitem with new category" error
@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import unicodedata
 from datetime import datetime
-import plotly.express as px
 from squad_manager import get_squad_order
+from utils import shallow_copy
 
 # -----------------------------------------------------------------------------
 # CONSTANTS
@@ -28,41 +29,68 @@ STATUS_ORDER = [
 
 DEFAULT_STATUS_COLOR = '#888888'
 
+# Column mapping based on requirements and existing utils.py
+COLUMN_MAP = {
+    'Squad (대분류)': 'Squad', 'squad': 'Squad',
+    'subproject_name': 'Task', 'Subproject_Name (소분류)': 'Task',
+    'start_date': 'Start', '시작일 (Start)': 'Start',
+    'end_date': 'End', '종료일 (End)': 'End',
+    'status': 'Status', '상태 (Status)': 'Status',
+    'Goal (목표)': 'Goal', 'goal': 'Goal',
+    'order': 'Order', '정렬 순서': 'Order',
+    
+    # New columns from [Master] CTO office Roadmap (2).xlsx
+    'Biz_impact': 'Biz_impact', 'main_goal': 'Biz_impact', 'Main_Goal': 'Biz_impact',
+    'Product_track': 'Product_track', 'sub_goal': 'Product_track', 'Sub_Goal': 'Product_track',
+    
+    'project_name': 'Project',
+    'type': 'Type',
+    'comment': 'Comment', 
+    'target': 'Target',
+    'cto_manager': 'Manager',
+    'PM': 'PM', 'PD': 'PD', 'FE': 'FE', 'BE': 'BE', 'QA': 'QA',
+    'remarks': 'Remarks'
+}
+
+# Compact layout of the processed frame (see compact_frame)
+# - CATEGORY_COLS / TEXT_COLS: categorical when values repeat enough to pay off
+# - PEOPLE_COLS: categoricals sharing one dictionary of names
+CATEGORY_COLS = ['Squad', 'Goal', 'Biz_impact', 'Product_track', 'Project', 'Type', 'Target']
+PEOPLE_COLS = ['Manager', 'PM', 'PD', 'FE', 'BE', 'QA']
+TEXT_COLS = ['Comment', 'Remarks']
+CATEGORY_MAX_RATIO = 0.5  # unique values / rows
+
 # -----------------------------------------------------------------------------
 # DATA PROCESSING
 # -----------------------------------------------------------------------------
+def _status_categorical(status: pd.Series) -> pd.Categorical:
+    """
+    Sort Status by defined order.
+    Create final order: STATUS_ORDER candidates first, then any others found in data sorted alphabetically
+    """
+    present_status = status.unique().tolist()
+    
+    # Identify statuses not in our fixed list
+    known_set = set(STATUS_ORDER)
+    unknown_statuses = sorted([s for s in present_status if s not in known_set])
+    
+    # Final combined order
+    final_status_order = STATUS_ORDER + unknown_statuses
+    return pd.Categorical(status, categories=final_status_order, ordered=True)
+
 @st.cache_data(ttl=600)
 def process_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardizes column names and formats data.
     """
-    df.columns = df.columns.astype(str).str.strip()
-    
-    # Column mapping based on requirements and existing utils.py
-    # Column mapping based on requirements and existing utils.py
-    col_map = {
-        'Squad (대분류)': 'Squad', 'squad': 'Squad',
-        'subproject_name': 'Task', 'Subproject_Name (소분류)': 'Task',
-        'start_date': 'Start', '시작일 (Start)': 'Start',
-        'end_date': 'End', '종료일 (End)': 'End',
-        'status': 'Status', '상태 (Status)': 'Status',
-        'Goal (목표)': 'Goal', 'goal': 'Goal',
-        'order': 'Order', '정렬 순서': 'Order',
-        
-        # New columns from [Master] CTO office Roadmap (2).xlsx
-        'Biz_impact': 'Biz_impact', 'main_goal': 'Biz_impact', 'Main_Goal': 'Biz_impact',
-        'Product_track': 'Product_track', 'sub_goal': 'Product_track', 'Sub_Goal': 'Product_track',
-        
-        'project_name': 'Project',
-        'type': 'Type',
-        'comment': 'Comment', 
-        'target': 'Target',
-        'cto_manager': 'Manager',
-        'PM': 'PM', 'PD': 'PD', 'FE': 'FE', 'BE': 'BE', 'QA': 'QA',
-        'remarks': 'Remarks'
-    }
+    return compact_frame(_process_frame(df))
+
+def _process_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # Uncached body of process_data (also used for the partial frames of process_data_incremental)
+    # set_axis instead of assigning df.columns so the caller's frame is left untouched (no defensive copy needed)
+    df = df.set_axis(df.columns.astype(str).str.strip(), axis=1)
     
-    rename_dict = {k: v for k, v in col_map.items() if k in df.columns}
+    rename_dict = {k: v for k, v in COLUMN_MAP.items() if k in df.columns}
     df = df.rename(columns=rename_dict)
     
     # Handle Goal column logic
@@ -91,22 +119,60 @@ def process_data(df: pd.DataFrame) -> pd.DataFrame:
             else:
                 pass # Let it fail or handle downstream if critical
 
-    # Sort Status by defined order
-    # Create final order: STATUS_ORDER candidates first, then any others found in data sorted alphabetically
-    present_status = df['Status'].unique().tolist() if 'Status' in df.columns else []
-    
-    # Identify statuses not in our fixed list
-    known_set = set(STATUS_ORDER)
-    unknown_statuses = sorted([s for s in present_status if s not in known_set])
-    
-    # Final combined order
-    final_status_order = STATUS_ORDER + unknown_statuses
-    
-    # Apply Categorical type
-    df['Status'] = pd.Categorical(df['Status'], categories=final_status_order, ordered=True)
+    # Apply Categorical type (STATUS_ORDER first, then unknown statuses alphabetically)
+    df['Status'] = _status_categorical(df['Status'])
 
     return df
 
+def _sorted_categories(values) -> list:
+    return sorted(pd.unique(np.asarray(values, dtype=object)[pd.notna(values)]).tolist(), key=str)
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrinks the processed frame's memory footprint.
+    - Repetitive text columns become categoricals (sorted categories, so sorting is unchanged)
+    - People columns share a single dictionary
+    - Order is downcast to the smallest numeric type
+    """
+    df = shallow_copy(df)
+
+    for col in CATEGORY_COLS + TEXT_COLS:
+        if col not in df.columns:
+            continue
+        if len(df) and df[col].nunique() <= len(df) * CATEGORY_MAX_RATIO:
+            values = df[col].to_numpy(dtype=object)
+            df[col] = pd.Categorical(values, categories=_sorted_categories(values))
+        elif isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(df[col].cat.categories.dtype)  # Too diverse now; back to plain text
+
+    people_cols = [c for c in PEOPLE_COLS if c in df.columns]
+    if people_cols:
+        people = np.concatenate([df[c].to_numpy(dtype=object) for c in people_cols])
+        people_dtype = pd.CategoricalDtype(_sorted_categories(people))
+        for col in people_cols:
+            df[col] = pd.Categorical(df[col].to_numpy(dtype=object), dtype=people_dtype)
+
+    if 'Order' in df.columns and pd.api.types.is_numeric_dtype(df['Order']) and not pd.api.types.is_bool_dtype(df['Order']):
+        downcast = 'integer' if pd.api.types.is_integer_dtype(df['Order']) else 'float'
+        df['Order'] = pd.to_numeric(df['Order'], downcast=downcast)
+
+    return df
+
+def memory_report(stages: dict) -> pd.DataFrame:
+    """
+    Memory usage per pipeline stage ({name: DataFrame}).
+    'Saved' compares against the same frame with categoricals expanded back to plain text.
+    """
+    rows = []
+    for name, frame in stages.items():
+        if frame is None:
+            continue
+        used = int(frame.memory_usage(index=True, deep=True).sum())
+        cat_cols = [c for c in frame.columns if isinstance(frame[c].dtype, pd.CategoricalDtype) and c != 'Status']
+        expanded = int(frame.astype({c: frame[c].cat.categories.dtype for c in cat_cols}).memory_usage(index=True, deep=True).sum()) if cat_cols else used
+        rows.append({'Stage': name, 'Rows': len(frame), 'Bytes': used, 'Uncompacted_Bytes': expanded, 'Saved_Bytes': expanded - used})
+    return pd.DataFrame(rows, columns=['Stage', 'Rows', 'Bytes', 'Uncompacted_Bytes', 'Saved_Bytes'])
+
 def apply_sorting(df: pd.DataFrame, user_sort_col: str = None) -> pd.DataFrame:
     """
     Applies the complex sorting logic:
@@ -116,6 +182,7 @@ def apply_sorting(df: pd.DataFrame, user_sort_col: str = None) -> pd.DataFrame:
     """
     sort_cols = []
     ascending = []
+    df = shallow_copy(df)  # Squad/Order are reassigned below; CoW keeps the caller's columns intact
     
     if user_sort_col and user_sort_col in df.columns:
         sort_cols.append(user_sort_col)
@@ -147,11 +214,92 @@ def apply_sorting(df: pd.DataFrame, user_sort_col: str = None) -> pd.DataFrame:
 
     return df.sort_values(by=sort_cols, ascending=ascending)
 
+# -----------------------------------------------------------------------------
+# INCREMENTAL REFRESH
+# -----------------------------------------------------------------------------
+def compute_row_keys(raw_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stable per-row identity and content hash for a raw sheet, indexed like raw_df.
+    - Task_Key: hash of (Squad, Task) plus occurrence number, so duplicates stay distinct
+    - Row_Hash: hash of the whole row content
+    """
+    source_cols = {COLUMN_MAP.get(str(c).strip(), str(c).strip()): c for c in raw_df.columns}
+    ident_cols = [source_cols[c] for c in ['Squad', 'Task'] if c in source_cols]
+
+    as_text = raw_df.astype(str)
+    if ident_cols:
+        ident = pd.util.hash_pandas_object(as_text[ident_cols], index=False)
+    else:
+        ident = pd.Series(np.zeros(len(raw_df), dtype=np.uint64), index=raw_df.index)
+    occurrence = ident.groupby(ident).cumcount()
+
+    return pd.DataFrame({
+        'Task_Key': pd.util.hash_pandas_object(pd.DataFrame({'ident': ident, 'n': occurrence}), index=False),
+        'Row_Hash': pd.util.hash_pandas_object(as_text, index=False),
+    }, index=raw_df.index)
+
+
+def diff_row_keys(prev_keys: pd.DataFrame, curr_keys: pd.DataFrame) -> dict:
+    """
+    Compares two compute_row_keys results.
+    Returns {'inserted', 'updated', 'deleted'} as Index objects of Task_Key values.
+    """
+    prev = pd.Series(prev_keys['Row_Hash'].to_numpy(), index=prev_keys['Task_Key'].to_numpy())
+    curr = pd.Series(curr_keys['Row_Hash'].to_numpy(), index=curr_keys['Task_Key'].to_numpy())
+
+    common = curr.index.intersection(prev.index)
+    return {
+        'inserted': curr.index.difference(prev.index),
+        'updated': common[curr[common].to_numpy() != prev[common].to_numpy()],
+        'deleted': prev.index.difference(curr.index),
+    }
+
+
+def process_data_incremental(raw_df: pd.DataFrame, previous: dict = None) -> dict:
+    """
+    process_data for a refreshed sheet, reprocessing only inserted/updated rows.
+    `previous` is the dict returned by the last call (None for a full build).
+
+    Returns {'raw_columns', 'keys', 'processed', 'changes', 'changed_squads'}.
+    'changes' / 'changed_squads' are None after a full build.
+    """
+    keys = compute_row_keys(raw_df)
+    raw_columns = list(raw_df.columns)
+
+    if previous is None or previous.get('raw_columns') != raw_columns or not raw_df.index.is_unique:
+        processed = process_data(raw_df)
+        return {'raw_columns': raw_columns, 'keys': keys, 'processed': processed, 'changes': None, 'changed_squads': None}
+
+    prev_keys = previous['keys']
+    prev_processed = previous['processed']
+    changes = diff_row_keys(prev_keys, keys)
+
+    # Rows to (re)process; everything else is reused from the previous version
+    dirty = keys['Task_Key'].isin(changes['inserted'].union(changes['updated'])).to_numpy()
+    prev_label = pd.Series(prev_keys.index, index=prev_keys['Task_Key'].to_numpy())
+
+    reused = prev_processed.loc[prev_label.loc[keys['Task_Key'].to_numpy()[~dirty]].to_numpy()]
+    reused.index = keys.index[~dirty]
+    parts = [reused]
+    if dirty.any():
+        parts.append(_process_frame(raw_df[dirty]))
+
+    processed = pd.concat(parts).loc[keys.index]  # Back to sheet order
+    processed['Status'] = _status_categorical(processed['Status'].astype(object))
+    processed = compact_frame(processed)  # Re-derive shared dictionaries over the merged rows
+
+    # Squads touched by the change set (old and new values)
+    changed_prev = prev_keys['Task_Key'].isin(changes['updated'].union(changes['deleted'])).to_numpy()
+    changed_squads = set(processed.loc[dirty, 'Squad'].astype(str)) | set(prev_processed.loc[changed_prev, 'Squad'].astype(str))
+
+    return {'raw_columns': raw_columns, 'keys': keys, 'processed': processed, 'changes': changes, 'changed_squads': changed_squads}
+
+
 # -----------------------------------------------------------------------------
 # FILTERING
 # -----------------------------------------------------------------------------
 def filter_data(df: pd.DataFrame, status_filter=None, squad_filter=None, date_range=None) -> pd.DataFrame:
-    filtered = df.copy()
+    filtered = df  # Each filter step returns a new frame; df itself is never modified
     
     if status_filter:
         filtered = filtered[filtered['Status'].isin(status_filter)]
@@ -179,7 +327,7 @@ def calculate_workload(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame()
         
-    workload = df.groupby('Squad').agg(
+    workload = df.groupby('Squad', observed=True).agg(
         Total_Tasks=('Task', 'count'),
         Active_Tasks=('Status', lambda x: x.isin(['진행 중', '진행 예정']).sum())
     ).reset_index()
@@ -202,13 +350,54 @@ def predict_start_date(df: pd.DataFrame, squad: str) -> datetime:
     return max_end + pd.Timedelta(days=1)
 
 
+def predict_start_dates(df: pd.DataFrame, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None,
+                        capacity_aware: bool = False) -> pd.DataFrame:
+    """
+    Batch version of predict_start_date for every squad in one groupby pass.
+    Default: day after the squad's latest End date (today if none).
+    capacity_aware: first day from today on which the squad's weighted active load
+    drops below its capacity (Headcount / Min_Personnel), read off the load timeline.
+    Falls back to the default date when the squad never frees up within the roadmap.
+    """
+    if df.empty or 'Squad' not in df.columns:
+        return pd.DataFrame(columns=['Squad', 'Possible Start Date'])
+
+    max_end = df.groupby('Squad', observed=True)['End'].max()
+    predicted = (max_end + pd.Timedelta(days=1)).fillna(pd.Timestamp(datetime.today()))
+
+    if capacity_aware and df_resource is not None and not df_resource.empty:
+        today_date = pd.Timestamp(datetime.now().date())
+        latest_end = max_end.max()
+        horizon_end = max(today_date, latest_end.normalize() if pd.notna(latest_end) else today_date) + pd.Timedelta(days=1)
+        days = pd.date_range(today_date, horizon_end, freq='D')
+
+        starts, ends = _active_intervals(
+            pd.to_datetime(df['Start'], errors='coerce').dt.normalize().to_numpy(dtype='datetime64[ns]'),
+            pd.to_datetime(df['End'], errors='coerce').dt.normalize().to_numpy(dtype='datetime64[ns]'),
+            (df['Status'] == '진행 중').to_numpy(dtype=bool), today_date, horizon_end
+        )
+        codes = pd.Categorical(df['Squad'], categories=list(max_end.index)).codes
+        if 'Type' in df.columns:
+            task_weight = _task_weights(df['Type'], _weight_lookup(df_weights))
+        else:
+            task_weight = np.ones(len(df))
+
+        load = _sweep_load(codes, starts, ends, task_weight, len(max_end), today_date, len(days))
+        capacity, _ = _squad_capacity(df_resource, max_end.index)
+        first_free = _first_day_below(load, capacity, days)
+        first_free.index = max_end.index
+        predicted = first_free.fillna(predicted)
+
+    return pd.DataFrame({'Squad': predicted.index, 'Possible Start Date': predicted.to_numpy()})
+
+
 def identify_issues(df: pd.DataFrame) -> pd.DataFrame:
     """
     Returns tasks that are defined as issues or strategic tasks.
     Prioritizes '보류/이슈' Status first, then '전략과제'.
     """
     # 1. Status Issue
-    status_issues = df[df['Status'] == '이슈'].copy()
+    status_issues = shallow_copy(df[df['Status'] == '이슈'])
     status_issues['Issue_Type'] = 'Status Issue'
     
     # 2. Strategic Tasks (Only if Status == '단순 인입')
@@ -218,7 +407,7 @@ def identify_issues(df: pd.DataFrame) -> pd.DataFrame:
         is_simple = df['Status'] == '단순 인입'
         
         strategic_mask = is_strategic & is_simple
-        strategic_tasks = df[strategic_mask].copy()
+        strategic_tasks = shallow_copy(df[strategic_mask])
         strategic_tasks['Issue_Type'] = 'Strategic Task'
 
     # Combine
@@ -241,7 +430,7 @@ def identify_issues(df: pd.DataFrame) -> pd.DataFrame:
     if not isinstance(final_mask, bool) and not final_mask.any(): # Handle empty or all False
          return pd.DataFrame()
          
-    issues = df[final_mask].copy()
+    issues = shallow_copy(df[final_mask])
     
     # Define Issue Type and Sort Order
     # We want Status Issue at top.
@@ -276,6 +465,120 @@ def identify_issues(df: pd.DataFrame) -> pd.DataFrame:
     
     return issues
 
+def _weight_lookup(df_weights: pd.DataFrame = None) -> pd.Series:
+    """
+    Builds a Type -> Weight lookup Series from the weight sheet.
+    Later rows win on duplicate types (same as the previous dict-based map).
+    """
+    if df_weights is None or df_weights.empty:
+        return pd.Series(dtype=float)
+
+    type_col = next((c for c in df_weights.columns if str(c).strip().lower() == 'type'), None)
+    weight_col = next((c for c in df_weights.columns if str(c).strip().lower() == 'weight'), None)
+    if not type_col or not weight_col:
+        return pd.Series(dtype=float)
+
+    types = df_weights[type_col].map(str).str.strip()
+    weights = pd.to_numeric(df_weights[weight_col], errors='coerce')
+    valid = weights.notna() & (types != '')
+
+    lookup = pd.Series(weights[valid].astype(float).to_numpy(), index=types[valid].to_numpy())
+    return lookup[~lookup.index.duplicated(keep='last')]
+
+
+def _task_weights(types: pd.Series, weight_lookup: pd.Series) -> np.ndarray:
+    """
+    Maps task Types to weights via their categories (one lookup per distinct Type).
+    Missing, blank or unknown Types weigh 1.0.
+    """
+    cat = pd.Categorical(types)
+    cat_keys = pd.Index(cat.categories).map(str).str.strip()
+    cat_weights = weight_lookup.reindex(cat_keys).fillna(1.0).to_numpy(dtype=float)
+    # Code -1 (missing) picks the trailing default weight
+    return np.append(cat_weights, 1.0)[cat.codes]
+
+
+def _capacity_columns(headcount, min_personnel):
+    """
+    Column-wise capacity arithmetic shared by the utilization engines.
+    Returns (capacity_score, unit_score) as float arrays.
+    """
+    headcount = pd.to_numeric(pd.Series(headcount), errors='coerce').fillna(0).to_numpy(dtype=float)
+    min_p = pd.to_numeric(pd.Series(min_personnel), errors='coerce').to_numpy(dtype=float)
+    min_p = np.where(min_p > 0, min_p, 1.0)  # NaN / <= 0 -> 1.0 (avoid div/0)
+
+    # A. Capacity Score: (보유인원 / 최소인원) * 5.0 * 0.8
+    capacity_score = (headcount / min_p) * 5.0 * 0.8
+
+    # Unit Score = 4.0 / Min_Personnel (Shortage = (Load - Capacity) / Unit Score)
+    unit_score = 4.0 / min_p
+
+    return capacity_score, unit_score
+
+
+def _active_mask(df_tasks: pd.DataFrame, today_date: pd.Timestamp) -> np.ndarray:
+    """
+    Active if: Status is '진행 중' OR (Start_Date <= Today <= End_Date)
+    """
+    # Ensure Start and End are datetime
+    start_col = pd.to_datetime(df_tasks['Start'], errors='coerce')
+    end_col = pd.to_datetime(df_tasks['End'], errors='coerce')
+
+    is_in_progress = df_tasks['Status'] == '진행 중'
+    is_in_range = (start_col <= today_date) & (end_col >= today_date)
+    return (is_in_progress | is_in_range).to_numpy(dtype=bool)
+
+
+def _active_intervals(starts: np.ndarray, ends: np.ndarray, in_progress: np.ndarray, today_date, horizon_end):
+    """
+    Normalizes task Start/End (datetime64 arrays, day precision) into active intervals.
+    '진행 중' tasks always cover today (as in calculate_utilization_metrics) and
+    open-ended ones run to the horizon end. Undated other tasks stay NaT.
+    """
+    today64 = np.datetime64(pd.Timestamp(today_date).normalize())
+    end64 = np.datetime64(pd.Timestamp(horizon_end).normalize())
+    starts = np.where(in_progress, np.minimum(np.where(np.isnat(starts), today64, starts), today64), starts)
+    ends = np.where(in_progress, np.maximum(np.where(np.isnat(ends), end64, ends), today64), ends)
+    return starts, ends
+
+
+def _sweep_load(codes: np.ndarray, starts: np.ndarray, ends: np.ndarray, weights: np.ndarray,
+                n_groups: int, horizon_start, n_days: int) -> np.ndarray:
+    """
+    Difference-array sweep: +w at start, -w after end, cumulative sum along the day axis.
+    Returns an (n_groups, n_days) matrix of weighted active load (End inclusive).
+    """
+    dated = ~(np.isnat(starts) | np.isnat(ends)) & (codes >= 0)
+    h0 = np.datetime64(pd.Timestamp(horizon_start).normalize())
+    s_idx = np.clip((starts[dated] - h0) // np.timedelta64(1, 'D'), 0, n_days).astype(np.int64)
+    e_idx = np.clip((ends[dated] - h0) // np.timedelta64(1, 'D') + 1, 0, n_days).astype(np.int64)
+    keep = s_idx < e_idx
+
+    diff = np.zeros((n_groups, n_days + 1))
+    np.add.at(diff, (codes[dated][keep], s_idx[keep]), weights[dated][keep])
+    np.add.at(diff, (codes[dated][keep], e_idx[keep]), -weights[dated][keep])
+    return np.round(np.cumsum(diff[:, :-1], axis=1), 9)  # drop float drift from +w/-w pairs
+
+
+def _first_day_below(load: np.ndarray, capacity: np.ndarray, days: pd.DatetimeIndex) -> pd.Series:
+    """
+    First day per row on which load < capacity (NaT if never within the horizon).
+    """
+    below = load < np.asarray(capacity, dtype=float)[:, None]
+    first = days[below.argmax(axis=1)] if len(days) else pd.DatetimeIndex([pd.NaT] * len(load))
+    return pd.Series(first).where(below.any(axis=1)).reset_index(drop=True)
+
+
+def _squad_capacity(df_resource: pd.DataFrame, squads):
+    """
+    (capacity_score, unit_score) per squad in `squads` order.
+    Uses the first resource row per squad; squads without one get Headcount 0 / Min_Personnel 1.0.
+    """
+    res = df_resource.drop_duplicates(subset='Squad').set_index('Squad').reindex(pd.Index(list(squads), dtype=object))
+    min_personnel = res['Min_Personnel'].fillna(1.0) if 'Min_Personnel' in res.columns else pd.Series(1.0, index=res.index)
+    return _capacity_columns(res['Headcount'].fillna(0), min_personnel)
+
+
 def calculate_utilization_metrics(df_tasks: pd.DataFrame, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None) -> pd.DataFrame:
     """
     Calculates utilization metrics per squad combining Task data and Resource data.
@@ -286,56 +589,21 @@ def calculate_utilization_metrics(df_tasks: pd.DataFrame, df_resource: pd.DataFr
     else:
         # Calculate Active Count: Start <= Today <= End
         today_date = pd.Timestamp(datetime.now().date())
-        
-        # Ensure Start and End are datetime
-        start_col = pd.to_datetime(df_tasks['Start'], errors='coerce')
-        end_col = pd.to_datetime(df_tasks['End'], errors='coerce')
-        
-        # Active if: Status is '진행 중' OR (Start_Date <= Today <= End_Date)
-        is_in_progress = df_tasks['Status'] == '진행 중'
-        is_in_range = (start_col <= today_date) & (end_col >= today_date)
-        active_mask = is_in_progress | is_in_range
-
-        squad_summary = df_tasks.groupby('Squad').agg(
-            Total_Tasks=('Task', 'count')
-        ).reset_index()
+        active_mask = _active_mask(df_tasks, today_date)
 
-        active_counts = df_tasks[active_mask].groupby('Squad').size().reset_index(name='Active_Tasks_Calc')
-        
-        # Merge to ensure 0 for no active tasks
-        squad_summary = pd.merge(squad_summary, active_counts, on='Squad', how='left')
-        squad_summary['Active_Tasks'] = squad_summary['Active_Tasks_Calc'].fillna(0)
-        squad_summary = squad_summary.drop(columns=['Active_Tasks_Calc'])
-        
-        # Calculate Active_Tasks_Score using weights
-        active_tasks_df = df_tasks[active_mask].copy()
-        
-        weight_map = {}
-        if df_weights is not None and not df_weights.empty:
-            type_col = next((c for c in df_weights.columns if str(c).strip().lower() == 'type'), None)
-            weight_col = next((c for c in df_weights.columns if str(c).strip().lower() == 'weight'), None)
-            if type_col and weight_col:
-                for _, row in df_weights.iterrows():
-                    t = str(row[type_col]).strip()
-                    w = pd.to_numeric(row[weight_col], errors='coerce')
-                    if pd.notna(w) and t:
-                        weight_map[t] = float(w)
-                        
-        def get_task_weight(type_val):
-            if pd.isna(type_val) or str(type_val).strip() == "":
-                return 1.0 # Default weight is 1.0
-            type_str = str(type_val).strip()
-            return weight_map.get(type_str, 1.0)
-            
-        if 'Type' in active_tasks_df.columns:
-            active_tasks_df['Task_Weight'] = active_tasks_df['Type'].apply(get_task_weight)
+        # Task weights (Type -> Weight), only active tasks contribute to the score
+        if 'Type' in df_tasks.columns:
+            task_weight = _task_weights(df_tasks['Type'], _weight_lookup(df_weights))
         else:
-            active_tasks_df['Task_Weight'] = 1.0
-            
-        active_scores = active_tasks_df.groupby('Squad')['Task_Weight'].sum().reset_index(name='Active_Tasks_Score')
-        
-        squad_summary = pd.merge(squad_summary, active_scores, on='Squad', how='left')
-        squad_summary['Active_Tasks_Score'] = squad_summary['Active_Tasks_Score'].fillna(0)
+            task_weight = np.ones(len(df_tasks))
+
+        # Single grouped pass for count / active count / weighted score
+        squad_summary = pd.DataFrame({
+            'Squad': df_tasks['Squad'],
+            'Total_Tasks': df_tasks['Task'].notna().astype(np.int64),
+            'Active_Tasks': active_mask.astype(np.float64),  # Float, as the former merge + fillna(0) produced
+            'Active_Tasks_Score': np.where(active_mask, task_weight, 0.0),
+        }, index=df_tasks.index).groupby('Squad', observed=True).sum().reset_index()
 
     if df_resource is None or df_resource.empty:
         # Return basic stats if no resource data, but ensure columns exist for UI consistency
@@ -354,34 +622,167 @@ def calculate_utilization_metrics(df_tasks: pd.DataFrame, df_resource: pd.DataFr
     merged['Headcount'] = merged['Headcount'].fillna(0)
     merged['Min_Personnel'] = merged['Min_Personnel'].fillna(1.0) # Avoid div/0
     
-    # 3. Calculate Metrics
-    def calc_row(row):
-        headcount = pd.to_numeric(row['Headcount'], errors='coerce')
-        if pd.isna(headcount): headcount = 0
-            
-        min_p = pd.to_numeric(row['Min_Personnel'], errors='coerce')
-        if pd.isna(min_p) or min_p <= 0: min_p = 1.0
-        
-        active_count = row['Active_Tasks']
-        total_load_score = row.get('Active_Tasks_Score', active_count)
-        
-        # A. Capacity Score: (보유인원 / 최소인원) * 5.0 * 0.8
-        capacity_score = (headcount / min_p) * 5.0 * 0.8
-        
-        # B. Total Load Score
-        # Already calculated as total_load_score
-        
-        # C. Shortage: (Total Load Score - Capacity Score) / Unit Score
-        # Unit Score = 4.0 / Min_Personnel
-        unit_score = 4.0 / min_p
-        shortage = round((total_load_score - capacity_score) / unit_score, 1) if unit_score > 0 else 0.0
-        
-        return pd.Series([capacity_score, total_load_score, shortage])
+    # 3. Calculate Metrics (whole-column arithmetic)
+    load_col = 'Active_Tasks_Score' if 'Active_Tasks_Score' in merged.columns else 'Active_Tasks'
+    total_load_score = merged[load_col].to_numpy(dtype=float)
+    capacity_score, unit_score = _capacity_columns(merged['Headcount'], merged['Min_Personnel'])
+    raw_shortage = (total_load_score - capacity_score) / unit_score
 
-    merged[['Capacity_Score', 'Total_Load_Score', 'Shortage']] = merged.apply(calc_row, axis=1)
+    merged['Capacity_Score'] = capacity_score
+    merged['Total_Load_Score'] = total_load_score
+    merged['Shortage'] = raw_shortage.round(1)
     
     # [User Request] Filter out '미정' and '공통' squads
     merged = merged[~merged['Squad'].isin(['미정', '공통'])]
 
     return merged
 
+
+def splice_squad_rows(base_df: pd.DataFrame, fresh_df: pd.DataFrame, squads) -> pd.DataFrame:
+    """
+    Replaces the rows of `squads` in a per-squad frame (metrics, predictions)
+    with freshly computed ones. Untouched squads keep their position; new ones go last.
+    """
+    squads = set(squads)
+    replaced = base_df['Squad'].isin(squads).to_numpy()
+    fresh = fresh_df[fresh_df['Squad'].isin(squads)]
+    kept = base_df[~replaced]
+    if fresh.empty:
+        return kept
+
+    if isinstance(kept['Squad'].dtype, pd.CategoricalDtype):
+        kept = kept.astype({'Squad': object})
+    if isinstance(fresh['Squad'].dtype, pd.CategoricalDtype):
+        fresh = fresh.astype({'Squad': object})
+
+    base_position = {s: i for i, s in enumerate(base_df['Squad'])}
+    order = np.concatenate([
+        np.flatnonzero(~replaced),
+        [base_position.get(s, len(base_position)) for s in fresh['Squad']]
+    ])
+    combined = pd.concat([kept, fresh], ignore_index=True)
+    return combined.iloc[np.argsort(order, kind='stable')].reset_index(drop=True)
+
+
+def _frame_signature(df: pd.DataFrame = None) -> int:
+    if df is None or df.empty:
+        return 0
+    return int(pd.util.hash_pandas_object(df.astype(str), index=False).sum())
+
+
+def update_utilization_metrics(df_tasks: pd.DataFrame, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None,
+                               row_keys: pd.DataFrame = None, previous: dict = None):
+    """
+    Incremental calculate_utilization_metrics.
+    Each squad gets a signature from the Row_Hash of its rows (row_keys from compute_row_keys,
+    aligned by index); only squads whose signature changed since `previous` are recomputed.
+    Returns (metrics, state) - pass `state` back as `previous` on the next call.
+    """
+    context = (datetime.now().date(), _frame_signature(df_resource), _frame_signature(df_weights))
+    hashes = row_keys['Row_Hash'].reindex(df_tasks.index) if row_keys is not None else None
+    if df_tasks.empty or hashes is None or hashes.isna().any():
+        return calculate_utilization_metrics(df_tasks, df_resource, df_weights), None
+
+    # Order-insensitive per-squad signature (two 32-bit halves summed without overflow)
+    hashes = hashes.to_numpy(dtype=np.uint64)
+    squad_sig = pd.DataFrame({
+        'lo': (hashes & np.uint64(0xFFFFFFFF)).astype(np.int64),
+        'hi': (hashes >> np.uint64(32)).astype(np.int64),
+    }, index=df_tasks.index).groupby(df_tasks['Squad'], observed=True).sum()
+    squad_sig.index = squad_sig.index.astype(object)
+
+    if previous is None or previous['context'] != context:
+        metrics = calculate_utilization_metrics(df_tasks, df_resource, df_weights)
+        return metrics, {'context': context, 'squad_sig': squad_sig, 'metrics': metrics}
+
+    prev_sig = previous['squad_sig'].reindex(squad_sig.index)
+    changed = set(squad_sig.index[(prev_sig != squad_sig).any(axis=1)])
+    removed = set(previous['squad_sig'].index.difference(squad_sig.index))
+
+    metrics = previous['metrics']
+    if changed or removed:
+        subset = df_tasks[df_tasks['Squad'].isin(changed)]
+        fresh = calculate_utilization_metrics(subset, df_resource, df_weights)
+        metrics = splice_squad_rows(metrics, fresh, changed | removed)
+
+        # Same squad order as a full groupby
+        position = {s: i for i, s in enumerate(squad_sig.index)}
+        order = [position.get(s, len(position)) for s in metrics['Squad']]
+        metrics = metrics.iloc[np.argsort(order, kind='stable')].reset_index(drop=True)
+
+    return metrics, {'context': context, 'squad_sig': squad_sig, 'metrics': metrics}
+
+
+def calculate_utilization_timeline(df_tasks: pd.DataFrame, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None,
+                                   freq: str = 'D', start_date=None, end_date=None) -> pd.DataFrame:
+    """
+    Weighted active load per squad for every day ('D') or week ('W') of the horizon.
+    Uses a difference-array / cumulative-sum sweep over Start/End instead of
+    re-running the single-day metric per date. Weekly periods report the peak day.
+
+    A task is active from Start to End (inclusive). '진행 중' tasks are always active
+    today (as in calculate_utilization_metrics) and open-ended ones run to the horizon end.
+    Returns long-format rows: Period, Squad, Load_Score, Capacity_Score, Shortage.
+    """
+    out_cols = ['Period', 'Squad', 'Load_Score', 'Capacity_Score', 'Shortage']
+    if df_tasks.empty:
+        return pd.DataFrame(columns=out_cols)
+
+    today_date = pd.Timestamp(datetime.now().date())
+    start_col = pd.to_datetime(df_tasks['Start'], errors='coerce').dt.normalize()
+    end_col = pd.to_datetime(df_tasks['End'], errors='coerce').dt.normalize()
+    is_in_progress = (df_tasks['Status'] == '진행 중').to_numpy(dtype=bool)
+
+    # 1. Horizon (defaults to the roadmap's dated span, extended to today so overdue '진행 중' tasks stay visible)
+    horizon_start = pd.Timestamp(start_date).normalize() if start_date is not None else start_col.min()
+    horizon_end = pd.Timestamp(end_date).normalize() if end_date is not None else end_col.max()
+    if pd.isna(horizon_start): horizon_start = today_date
+    if pd.isna(horizon_end): horizon_end = today_date
+    if end_date is None: horizon_end = max(horizon_end, today_date)
+    if horizon_end < horizon_start:
+        return pd.DataFrame(columns=out_cols)
+    days = pd.date_range(horizon_start, horizon_end, freq='D')
+    n_days = len(days)
+
+    # 2. Task intervals (day precision) and weights
+    starts, ends = _active_intervals(
+        start_col.to_numpy(dtype='datetime64[ns]'), end_col.to_numpy(dtype='datetime64[ns]'),
+        is_in_progress, today_date, horizon_end
+    )
+    squad_cat = pd.Categorical(df_tasks['Squad']).remove_unused_categories()
+
+    if 'Type' in df_tasks.columns:
+        task_weight = _task_weights(df_tasks['Type'], _weight_lookup(df_weights))
+    else:
+        task_weight = np.ones(len(df_tasks))
+
+    # 3. Sweep over Start/End
+    load = _sweep_load(squad_cat.codes, starts, ends, task_weight, len(squad_cat.categories), horizon_start, n_days)
+
+    periods = days
+    if freq == 'W':
+        week_start = days.to_period('W').start_time
+        bounds = np.flatnonzero(np.r_[True, week_start[1:] != week_start[:-1]])
+        load = np.maximum.reduceat(load, bounds, axis=1)
+        periods = week_start[bounds]
+
+    # 4. Capacity per squad (same defaults as calculate_utilization_metrics)
+    squads = pd.Index(squad_cat.categories)
+    n_periods = len(periods)
+    if df_resource is None or df_resource.empty:
+        capacity = np.zeros(len(squads))
+        shortage = np.zeros((len(squads), n_periods))
+    else:
+        capacity, unit_score = _squad_capacity(df_resource, squads)
+        shortage = np.round((load - capacity[:, None]) / unit_score[:, None], 1)
+
+    timeline = pd.DataFrame({
+        'Period': np.tile(periods.to_numpy(), len(squads)),
+        'Squad': np.repeat(squads.to_numpy(), n_periods),
+        'Load_Score': load.ravel(),
+        'Capacity_Score': np.repeat(capacity, n_periods),
+        'Shortage': shortage.ravel(),
+    })
+
+    # [User Request] Filter out '미정' and '공통' squads
+    return timeline[~timeline['Squad'].isin(['미정', '공통'])].reset_index(drop=True)
@@ -0,0 +1,150 @@
+## 페이지 전환 대비 사전 계산 (백그라운드 스레드) 관련 로직은 이 파일에서 중앙 관리
+## 데이터가 로드되면 현재 페이지 외의 파생 데이터(이슈 표, 리소스 지표, 시작 가능일 예측, 기본 로드맵 차트)를
+## 요청 스레드 밖에서 미리 계산해 st.cache_data에 채워 두고, 페이지는 같은 캐시 함수를 호출해 결과를 받는다.
+
+import logging
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from logic import (filter_data, apply_sorting, identify_issues, update_utilization_metrics,
+                   calculate_utilization_timeline, predict_start_dates)
+from squad_manager import sort_squads
+from views import roadmap
+
+PRECOMPUTE_TTL_S = 600  # Same as the cached artifacts below; an older finished job is run again
+
+# Pages whose artifacts are warmed (keys of app.PAGES)
+ROADMAP_PAGE = "로드맵"
+ANALYSIS_PAGE = "리소스 및 이슈"
+
+_jobs = {}  # fingerprint -> (thread, started at)
+_jobs_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# Cached artifacts (shared by the pages and the background job)
+# -----------------------------------------------------------------------------
+def analysis_filter_options(df: pd.DataFrame):
+    """Status and Squad filter options of the analysis pages (both are selected by default)."""
+    all_statuses = list(df['Status'].unique()) if 'Status' in df.columns else []
+    all_squads = list(df['Squad'].unique()) if 'Squad' in df.columns else []
+    return all_statuses, sort_squads(all_squads)  # Apply custom sort order
+
+@st.cache_data(ttl=600, show_spinner=False)
+def analysis_frame(df: pd.DataFrame, status_filter=None, squad_filter=None, sort_col: str = None) -> pd.DataFrame:
+    """filter_data + apply_sorting as the analysis pages apply them."""
+    return apply_sorting(filter_data(df, status_filter, squad_filter, None), sort_col)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def issues_table(df: pd.DataFrame) -> pd.DataFrame:
+    return identify_issues(df)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def utilization_metrics(df: pd.DataFrame, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None,
+                        row_keys: pd.DataFrame = None):
+    """First (full) update_utilization_metrics run: (metrics, state); later runs are incremental on state."""
+    return update_utilization_metrics(df, df_resource, df_weights, row_keys, None)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def utilization_timeline(df: pd.DataFrame, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None,
+                         freq: str = 'W', start_date=None) -> pd.DataFrame:
+    return calculate_utilization_timeline(df, df_resource, df_weights, freq=freq, start_date=start_date)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def start_date_predictions(df: pd.DataFrame, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None,
+                           capacity_aware: bool = False) -> pd.DataFrame:
+    return predict_start_dates(df, df_resource, df_weights, capacity_aware=capacity_aware)
+
+
+# -----------------------------------------------------------------------------
+# Background job
+# -----------------------------------------------------------------------------
+def warm_analysis(df, df_resource=None, df_weights=None, row_keys=None, with_resources=True):
+    """
+    Everything '리소스 및 이슈' computes on its first visit with the default filters.
+    with_resources=False: only the roadmap-only artifacts (the resource/weight data is not loaded yet,
+    and the page's resource metrics are keyed on it).
+    """
+    all_statuses, all_squads = analysis_filter_options(df)
+    final_df = analysis_frame(df, all_statuses, all_squads, None)
+    issues_table(final_df)
+    if not with_resources:
+        return
+    utilization_metrics(final_df, df_resource, df_weights, row_keys)
+    utilization_timeline(final_df, df_resource, df_weights, freq='W', start_date=datetime.now().date())
+    start_date_predictions(final_df, df_resource, df_weights, capacity_aware=False)
+    if df_resource is not None and not df_resource.empty:
+        start_date_predictions(final_df, df_resource, df_weights, capacity_aware=True)
+
+def warm_roadmap(df):
+    """The roadmap chart with the default sidebar options."""
+    roadmap.build_default_chart(df)
+
+def _fingerprint(frame):
+    if frame is None:
+        return None
+    try:
+        return (frame.shape, int(pd.util.hash_pandas_object(frame, index=True).sum()))
+    except TypeError:  # Unhashable cells (lists, dicts)
+        return (frame.shape, int(pd.util.hash_pandas_object(frame.astype(str), index=True).sum()))
+
+def _run(tasks):
+    for task, args in tasks:
+        try:
+            task(*args)
+        except Exception:
+            # The page computes the artifact on demand (and shows the error) when it is opened
+            logger.exception("Precompute %s failed", task.__name__)
+
+def start_precompute(df, row_keys=None, current_page=None, df_resource=None, df_weights=None, with_resources=True):
+    """
+    Warms the artifacts of the pages other than current_page in a daemon thread.
+    The job only computes on the frames passed in (already loaded on the request thread): it has no
+    ScriptRunContext, so it never runs loaders, reads uploaded files or calls Streamlit UI functions.
+    with_resources=False: the resource/weight sources are not loaded yet (they stay unloaded until
+    their page is opened), so only the roadmap-only artifacts are warmed.
+    One job per dataset (fingerprints of the frames); returns the job's thread,
+    or None when nothing needs to run. The current page computes its own artifacts as usual,
+    and a page opened while the job is still running waits on the same cache entry instead of recomputing.
+    """
+    if df is None or df.empty:
+        return None
+
+    tasks = []
+    if current_page != ANALYSIS_PAGE:
+        tasks.append((warm_analysis, (df, df_resource, df_weights, row_keys, with_resources)))
+    if current_page != ROADMAP_PAGE:
+        tasks.append((warm_roadmap, (df,)))
+    if not tasks:
+        return None
+
+    key = (_fingerprint(df), _fingerprint(df_resource), _fingerprint(df_weights), with_resources,
+           current_page, datetime.now().date())
+    now = time.monotonic()
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is not None and (job[0].is_alive() or now - job[1] < PRECOMPUTE_TTL_S):
+            return None
+        # Forget finished jobs of other datasets
+        for k in [k for k, (t, _) in _jobs.items() if not t.is_alive()]:
+            del _jobs[k]
+        thread = threading.Thread(target=_run, args=(tasks,), name="precompute", daemon=True)
+        _jobs[key] = (thread, now)
+    thread.start()
+    return thread
+
+def start_precompute_from_sources(sources, df, row_keys=None, current_page=None):
+    """
+    start_precompute with the analysis page's resource/weight data taken from sources.resolved():
+    data loaded on an earlier rerun of the session or already cached, never loaded here.
+    """
+    analysis_data = sources.resolved(ANALYSIS_PAGE)
+    return start_precompute(df, row_keys, current_page=current_page,
+                            df_resource=analysis_data.get('resource'), df_weights=analysis_data.get('weights'),
+                            with_resources={'resource', 'weights'} <= analysis_data.keys())
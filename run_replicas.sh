@@ -0,0 +1,11 @@
+#!/bin/bash
+# Multi-process mode: REPLICAS app processes on consecutive ports, sharing one on-disk cache
+# (put a load balancer with sticky sessions in front: a Streamlit session lives on one process)
+source .venv/bin/activate
+REPLICAS=${REPLICAS:-4}
+BASE_PORT=${BASE_PORT:-8501}
+export ROADMAP_SHARED_CACHE=${ROADMAP_SHARED_CACHE:-.cache/shared_cache.sqlite}
+for i in $(seq 0 $((REPLICAS - 1))); do
+    streamlit run app.py --server.port $((BASE_PORT + i)) --server.headless true &
+done
+wait
@@ -0,0 +1,244 @@
+## What-if(스왑) 시나리오 관련 로직은 이 파일에서 중앙 관리
+
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from logic import (
+    calculate_utilization_metrics, predict_start_dates, splice_squad_rows,
+    _weight_lookup, _task_weights, _capacity_columns, _active_intervals, _sweep_load, _first_day_below
+)
+
+# Supported edit actions (edits are plain dicts, e.g. {'action': 'move', 'task': 12, 'squad': '커머스'})
+# - move:      {'task': <row label>, 'squad': <target squad>}
+# - shift:     {'task': <row label>, 'days': <int, +/->}
+# - drop:      {'task': <row label>}
+# - headcount: {'squad': <squad>, 'headcount': <number>}
+SCENARIO_ACTIONS = {
+    'move': '과제 이동 (스쿼드 변경)',
+    'shift': '일정 이동',
+    'drop': '과제 제외',
+    'headcount': '보유 인원 변경',
+}
+
+
+class ScenarioEngine:
+    """
+    Evaluates hypothetical edits as overlays on a base dataset.
+    Per-task arrays and base metrics/predictions are computed once; each scenario
+    only re-aggregates the squads its edits touch and splices them into the base results.
+    """
+
+    def __init__(self, df_tasks: pd.DataFrame, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None,
+                 capacity_aware: bool = False, base_metrics: pd.DataFrame = None, base_predictions: pd.DataFrame = None):
+        self.df_tasks = df_tasks
+        self.df_resource = df_resource if df_resource is not None and not df_resource.empty else None
+        self.df_weights = df_weights
+        self.capacity_aware = capacity_aware and self.df_resource is not None
+        self.today = pd.Timestamp(datetime.now().date())
+
+        if base_metrics is None:
+            base_metrics = calculate_utilization_metrics(df_tasks, df_resource, df_weights)
+        # Plain object Squad keys so splicing never re-casts the base frames
+        self.base_metrics = base_metrics.astype({'Squad': object}).reset_index(drop=True)
+        if base_predictions is None:
+            base_predictions = predict_start_dates(df_tasks, df_resource, df_weights, capacity_aware=self.capacity_aware)
+        self.base_predictions = base_predictions.astype({'Squad': object}).reset_index(drop=True)
+        self._metric_cols = list(self.base_metrics.columns)
+
+        # Per-task arrays (same rules as logic.calculate_utilization_metrics)
+        self._squad = df_tasks['Squad'].to_numpy(dtype=object)
+        self._start = pd.to_datetime(df_tasks['Start'], errors='coerce').to_numpy(dtype='datetime64[ns]')
+        self._end = pd.to_datetime(df_tasks['End'], errors='coerce').to_numpy(dtype='datetime64[ns]')
+        self._in_progress = (df_tasks['Status'] == '진행 중').to_numpy(dtype=bool)
+        self._has_task = df_tasks['Task'].notna().to_numpy(dtype=bool)
+        if 'Type' in df_tasks.columns:
+            self._weight = _task_weights(df_tasks['Type'], _weight_lookup(df_weights))
+        else:
+            self._weight = np.ones(len(df_tasks))
+
+        # Squad -> positional rows, row label -> position
+        self._rows = {
+            str(squad): rows for squad, rows in df_tasks.groupby('Squad', observed=True).indices.items()
+        } if not df_tasks.empty else {}
+        self._label_pos = dict(zip(df_tasks.index, range(len(df_tasks))))
+
+        self._resource_rows = {}
+        if self.df_resource is not None:
+            for row in self.df_resource.drop_duplicates(subset='Squad').to_dict('records'):
+                self._resource_rows[str(row['Squad'])] = row
+
+    def _task_squad(self, label):
+        pos = self._label_pos.get(label)
+        if pos is None or pd.isna(self._squad[pos]):
+            return None
+        return str(self._squad[pos])
+
+    def affected_squads(self, edits) -> set:
+        """Squads whose metrics can change under the given edits."""
+        squads = set()
+        for edit in edits:
+            if edit.get('action') == 'headcount':
+                if self.df_resource is not None:  # Headcount edits need resource data
+                    squads.add(str(edit['squad']))
+                continue
+            source = self._task_squad(edit.get('task'))
+            if source is None:
+                continue  # Task no longer in the base data
+            squads.add(source)
+            if edit.get('action') == 'move':
+                squads.add(str(edit['squad']))
+        return squads
+
+    def _overlay(self, edits, squads):
+        """Applies the edits to the affected squads' task arrays only."""
+        positions = np.array(sorted(p for s in squads for p in self._rows.get(s, ())), dtype=np.int64)
+        local = {pos: i for i, pos in enumerate(positions)}
+
+        squad = self._squad[positions].astype(str)
+        start = self._start[positions].copy()
+        end = self._end[positions].copy()
+        keep = np.ones(len(positions), dtype=bool)
+        headcount = {}
+
+        for edit in edits:
+            action = edit.get('action')
+            if action == 'headcount':
+                headcount[str(edit['squad'])] = float(edit['headcount'])
+                continue
+            i = local.get(self._label_pos.get(edit.get('task')))
+            if i is None:
+                continue
+            if action == 'move':
+                squad[i] = str(edit['squad'])
+            elif action == 'shift':
+                delta = np.timedelta64(int(edit.get('days', 0)), 'D')
+                start[i] = start[i] + delta
+                end[i] = end[i] + delta
+            elif action == 'drop':
+                keep[i] = False
+
+        overlay = {
+            'squad': squad[keep],
+            'start': start[keep],
+            'end': end[keep],
+            'in_progress': self._in_progress[positions][keep],
+            'has_task': self._has_task[positions][keep],
+            'weight': self._weight[positions][keep],
+        }
+        return overlay, headcount
+
+    def _metrics(self, names, codes, overlay, headcount):
+        """Per-squad utilization rows for the overlay (columns match base_metrics)."""
+        today64 = np.datetime64(self.today)
+        active = overlay['in_progress'] | ((overlay['start'] <= today64) & (overlay['end'] >= today64))
+        n = len(names)
+        score = np.bincount(codes, weights=np.where(active, overlay['weight'], 0.0), minlength=n)
+
+        columns = {
+            'Squad': names,
+            'Total_Tasks': np.bincount(codes, weights=overlay['has_task'], minlength=n).astype(np.int64),
+            'Active_Tasks': np.bincount(codes, weights=active, minlength=n),
+            'Active_Tasks_Score': score,
+        }
+
+        if self.df_resource is None:
+            capacity = np.zeros(n)
+            columns.update({'Headcount': 0, 'Min_Personnel': 0, 'Capacity_Score': capacity,
+                            'Total_Load_Score': score, 'Shortage': 0.0})
+        else:
+            rows = [self._resource_rows.get(s, {}) for s in names]
+            for col in self._metric_cols:
+                if col not in columns:
+                    columns[col] = [r.get(col, np.nan) for r in rows]
+            columns['Headcount'] = pd.Series(
+                [headcount.get(s, r.get('Headcount', np.nan)) for s, r in zip(names, rows)], dtype=object
+            ).fillna(0).to_numpy()
+            columns['Min_Personnel'] = pd.Series(columns['Min_Personnel'], dtype=object).fillna(1.0).to_numpy()
+
+            capacity, unit_score = _capacity_columns(columns['Headcount'], columns['Min_Personnel'])
+            columns['Capacity_Score'] = capacity
+            columns['Total_Load_Score'] = score
+            columns['Shortage'] = ((score - capacity) / unit_score).round(1)
+
+        return pd.DataFrame(columns, columns=self._metric_cols), capacity
+
+    def _predictions(self, names, codes, overlay, capacity):
+        """Per-squad start-date predictions for the overlay (same rules as logic.predict_start_dates)."""
+        max_end = pd.Series(overlay['end']).groupby(codes).max().reindex(range(len(names)))
+        predicted = (max_end + pd.Timedelta(days=1)).fillna(pd.Timestamp(datetime.today()))
+
+        if self.capacity_aware and len(names):
+            latest_end = max_end.max()
+            horizon_end = max(self.today, latest_end.normalize() if pd.notna(latest_end) else self.today) + pd.Timedelta(days=1)
+            days = pd.date_range(self.today, horizon_end, freq='D')
+            starts, ends = _active_intervals(
+                overlay['start'].astype('datetime64[D]').astype('datetime64[ns]'),
+                overlay['end'].astype('datetime64[D]').astype('datetime64[ns]'),
+                overlay['in_progress'], self.today, horizon_end
+            )
+            load = _sweep_load(codes, starts, ends, overlay['weight'], len(names), self.today, len(days))
+            predicted = _first_day_below(load, capacity, days).fillna(predicted)
+
+        return pd.DataFrame({'Squad': names, 'Possible Start Date': predicted.to_numpy()})
+
+    def evaluate(self, edits) -> dict:
+        """
+        Applies `edits` and returns {'metrics', 'predictions', 'affected_squads'}.
+        Unaffected squads are taken from the base results as-is.
+        """
+        edits = list(edits or [])
+        squads = self.affected_squads(edits)
+        if not squads:
+            return {'metrics': self.base_metrics, 'predictions': self.base_predictions, 'affected_squads': set()}
+
+        overlay, headcount = self._overlay(edits, squads)
+        names, codes = np.unique(overlay['squad'], return_inverse=True)
+        names = names.astype(object)
+
+        fresh_metrics, capacity = self._metrics(names, codes, overlay, headcount)
+        fresh_predictions = self._predictions(names, codes, overlay, capacity)
+        # [User Request] Filter out '미정' and '공통' squads (as in calculate_utilization_metrics)
+        fresh_metrics = fresh_metrics[~fresh_metrics['Squad'].isin(['미정', '공통'])]
+
+        return {
+            'metrics': splice_squad_rows(self.base_metrics, fresh_metrics, squads),
+            'predictions': splice_squad_rows(self.base_predictions, fresh_predictions, squads),
+            'affected_squads': squads,
+        }
+
+    def compare(self, edits) -> pd.DataFrame:
+        """Before/after table for the squads touched by `edits`."""
+        result = self.evaluate(edits)
+        squads = result['affected_squads']
+        cols = ['Squad', 'Capacity_Score', 'Total_Load_Score', 'Shortage']
+
+        def _frame(metrics, predictions):
+            frame = metrics[metrics['Squad'].isin(squads)][cols].astype({'Squad': object})
+            preds = predictions.astype({'Squad': object}).set_index('Squad')['Possible Start Date']
+            frame['Possible Start Date'] = frame['Squad'].map(preds)
+            return frame.set_index('Squad')
+
+        before = _frame(self.base_metrics, self.base_predictions)
+        after = _frame(result['metrics'], result['predictions'])
+        return before.join(after, how='outer', lsuffix='_Before', rsuffix='_After').reset_index()
+
+
+def describe_edit(edit: dict, df_tasks: pd.DataFrame) -> str:
+    """Human readable label for a scenario edit."""
+    action = edit.get('action')
+    if action == 'headcount':
+        return f"👥 {edit['squad']} 보유 인원 → {edit['headcount']:g}명"
+
+    label = edit.get('task')
+    if label in df_tasks.index:
+        task = f"[{df_tasks.at[label, 'Squad']}] {df_tasks.at[label, 'Task']}"
+    else:
+        task = f"(삭제된 과제 #{label})"
+
+    if action == 'move':
+        return f"🔀 {task} → {edit['squad']}"
+    if action == 'shift':
+        return f"📆 {task} 일정 {int(edit['days']):+d}일"
+    if action == 'drop':
+        return f"⛔ {task} 제외"
+    return str(edit)
@@ -0,0 +1,169 @@
+## 여러 앱 프로세스(레플리카)가 함께 쓰는 디스크 캐시(SQLite) 관련 로직은 이 파일에서 중앙 관리
+## 환경 변수 ROADMAP_SHARED_CACHE에 파일 경로를 지정하면 다중 프로세스 모드가 켜진다. 한 프로세스가 불러온 시트,
+## 처리된 데이터셋, 생성한 차트는 직렬화된 채로 이 파일에 저장되어 다른 프로세스가 다시 계산하지 않고 사용한다.
+## 같은 키를 여러 프로세스가 동시에 계산하지 않도록 claims 테이블로 계산 중인 키를 표시한다.
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+import pandas as pd
+
+SHARED_CACHE_ENV = 'ROADMAP_SHARED_CACHE'  # Path of the SQLite file; unset = single-process mode
+SHARED_CACHE_BUDGET_BYTES = 1024 * 1024 * 1024
+CLAIM_TIMEOUT_S = 120  # A process that claimed a key and did not finish within this is assumed dead
+CLAIM_POLL_S = 0.05
+LAST_USED_RESOLUTION_S = 60  # Hits refresh an entry's LRU timestamp at most this often (a refresh is a write)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY, func TEXT NOT NULL, payload BLOB NOT NULL,
+    size INTEGER NOT NULL, expires REAL, last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+CREATE TABLE IF NOT EXISTS claims (key TEXT PRIMARY KEY, owner TEXT NOT NULL, until REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('epoch', 0);
+"""
+
+
+class SharedCache:
+    """
+    Serialized results in one SQLite file shared by every process on the host.
+    Entries carry a wall-clock expiry and are evicted least-recently-used first once the file's
+    payloads exceed max_bytes. clear() bumps an epoch so the other processes drop their local copies.
+    """
+
+    def __init__(self, path, max_bytes=SHARED_CACHE_BUDGET_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.files_dir = os.path.splitext(os.path.abspath(path))[0] + '_files'  # Large shared files (arrow_store)
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self):
+        """One connection per thread (sqlite3 connections are not shared between threads)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self):
+        return _Transaction(self._connect())
+
+    def epoch(self):
+        return self._connect().execute("SELECT value FROM meta WHERE name = 'epoch'").fetchone()[0]
+
+    def get(self, key):
+        """
+        (payload, expires) of a fresh entry, or None. A plain read: expired entries are left for put()
+        to delete, and last_used is only rewritten once it is LAST_USED_RESOLUTION_S old.
+        """
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute('SELECT payload, expires, last_used FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is None or (row[1] is not None and row[1] <= now):
+            return None
+        if now - row[2] >= LAST_USED_RESOLUTION_S:
+            conn.execute('UPDATE entries SET last_used = ? WHERE key = ? AND last_used < ?', (now, key, now))
+        return row[0], row[1]
+
+    def put(self, func, key, payload, expires=None):
+        if len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO entries (key, func, payload, size, expires, last_used) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, func, payload, len(payload), expires, now),
+            )
+            conn.execute('DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?', (now,))
+            excess = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0] - self.max_bytes
+            if excess > 0:
+                evict = []
+                for old_key, size in conn.execute('SELECT key, size FROM entries WHERE key != ? ORDER BY last_used', (key,)):
+                    evict.append((old_key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany('DELETE FROM entries WHERE key = ?', evict)
+
+    def claim(self, key):
+        """True if this process may compute key; False while another live process is computing it."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM claims WHERE key = ? AND until <= ?', (key, now))
+            cursor = conn.execute('INSERT OR IGNORE INTO claims (key, owner, until) VALUES (?, ?, ?)',
+                                  (key, self.owner, now + CLAIM_TIMEOUT_S))
+            return cursor.rowcount == 1
+
+    def release(self, key):
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM claims WHERE key = ? AND owner = ?', (key, self.owner))
+
+    def get_or_compute(self, func, key, compute, ttl=None):
+        """
+        (payload, expires, computed): the shared entry for key, waiting for another process that is computing it;
+        otherwise compute() -> payload bytes is run here and stored.
+        """
+        found = self.get(key)
+        if found is not None:
+            return (*found, False)
+        deadline = time.time() + CLAIM_TIMEOUT_S
+        while not self.claim(key):
+            time.sleep(CLAIM_POLL_S)
+            found = self.get(key)
+            if found is not None:
+                return (*found, False)
+            if time.time() > deadline:
+                break
+        try:
+            found = self.get(key)  # Finished between our last poll and the claim
+            if found is not None:
+                return (*found, False)
+            payload = compute()
+            expires = time.time() + ttl if ttl is not None else None
+            self.put(func, key, payload, expires)
+            return payload, expires, True
+        finally:
+            self.release(key)
+
+    def clear(self):
+        """Drops every entry for all processes and bumps the epoch they compare against."""
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM entries')
+            conn.execute("UPDATE meta SET value = value + 1 WHERE name = 'epoch'")
+
+    def stats(self) -> pd.DataFrame:
+        """One row per function: Function, Entries, Bytes."""
+        rows = self._connect().execute('SELECT func, COUNT(*), SUM(size) FROM entries GROUP BY func ORDER BY func').fetchall()
+        return pd.DataFrame(rows, columns=['Function', 'Entries', 'Bytes'])
+
+
+class _Transaction:
+    """`with` block = one immediate (write-locked) SQLite transaction on the thread's connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        return False
+
+
+def shared_cache_from_env():
+    """SharedCache at $ROADMAP_SHARED_CACHE, or None in single-process mode."""
+    path = os.environ.get(SHARED_CACHE_ENV)
+    return SharedCache(path) if path else None
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import arrow_store
+from logic import process_data, process_data_incremental
+
+def _raw():
+    today = pd.Timestamp(datetime.now().date())
+    return pd.DataFrame({
+        'Squad': ['회원', '커머스', '회원', '팬덤'],
+        'Task': ['T1', 'T2', 'T3', 'T4'],
+        'Status': ['진행 중', '진행 예정', '이슈', '진행 중'],
+        'Start': [today, today + pd.Timedelta(days=5), today - pd.Timedelta(days=3), None],
+        'End': [today + pd.Timedelta(days=10), today + pd.Timedelta(days=20), None, None],
+        'Type': ['Project', 'Task', 'Task', 'Project'],
+        'Comment': ['', '', 'blocked', ''],
+    })
+
+def _is_mapped(series):
+    values = series.cat.codes.to_numpy() if isinstance(series.dtype, pd.CategoricalDtype) else series.to_numpy()
+    return not values.flags.writeable  # Read-only = view of the mapped file
+
+def test_mapped_frame_round_trips_without_copies(tmp_path):
+    df = process_data.__wrapped__(_raw())
+    path = str(tmp_path / 'processed.arrow')
+    arrow_store.write_frame(path, df)
+    mapped = arrow_store.map_frame(path)
+
+    pd.testing.assert_frame_equal(mapped, df)
+    assert mapped['End'].isna().sum() == df['End'].isna().sum() > 0
+    categoricals = [c for c in mapped.columns if isinstance(mapped[c].dtype, pd.CategoricalDtype)]
+    assert 'Status' in categoricals
+    for col in categoricals + ['Start', 'End']:  # Categorical codes and datetimes with NaT
+        assert _is_mapped(mapped[col]), col
+
+    # Sessions edit shallow views; the mapped frame itself is never written
+    view = mapped.copy(deep=False)
+    view.loc[view.index[0], 'Start'] = pd.Timestamp('2020-01-01')
+    view['Extra'] = 1
+    assert mapped['Start'].iloc[0] == df['Start'].iloc[0] and 'Extra' not in mapped.columns
+
+def test_incremental_build_from_mapped_previous(tmp_path):
+    raw = _raw()
+    previous = arrow_store.materialize(arrow_store.externalize(process_data_incremental(raw), str(tmp_path), 'v1'))
+    assert isinstance(previous['raw_columns'], list)
+
+    changed = raw.copy()
+    changed.loc[1, 'Status'] = '이슈'
+    result = process_data_incremental(changed, previous)
+    pd.testing.assert_frame_equal(result['processed'], process_data.__wrapped__(changed), check_categorical=False)
+
+def test_externalize_keeps_frames_arrow_cannot_store(tmp_path, caplog):
+    mixed = pd.DataFrame({'a': pd.Series([1, 'x'], dtype=object)})
+    refs = arrow_store.externalize({'mixed': mixed, 'keys': pd.DataFrame({'k': np.arange(3, dtype='uint64')})},
+                                   str(tmp_path), 'v1')
+    assert refs['mixed'] is mixed
+    assert [r.levelname for r in caplog.records if 'mixed' in r.getMessage()] == ['WARNING']
+    assert isinstance(refs['keys'], arrow_store.MappedFrame) and os.path.exists(refs['keys'].path)
+
+def test_prune_removes_old_files(tmp_path):
+    old, new = tmp_path / 'old-processed.arrow', tmp_path / 'new-processed.arrow'
+    old.write_bytes(b'')
+    new.write_bytes(b'')
+    stale = time.time() - arrow_store.DATASET_FILE_MAX_AGE_S - 1
+    os.utime(old, (stale, stale))
+    arrow_store.prune(str(tmp_path))
+    assert not old.exists() and new.exists()
@@ -0,0 +1,119 @@
+import pickle
+import threading
+import time
+import pandas as pd
+import streamlit as st
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from bounded_cache import BoundedCache, bounded_cache, cache_key
+
+def _size(value):
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+def test_lru_eviction_under_byte_budget():
+    blob = 'x' * 1000
+    cache = BoundedCache(max_bytes=_size(blob) * 2 + 10)
+    cache.put('f', 'a', blob)
+    cache.put('f', 'b', blob)
+    assert cache.get('f', 'a') == (True, blob)  # 'a' is now the most recently used
+    cache.put('g', 'c', blob)                   # Over budget -> evicts 'b'
+
+    assert cache.get('f', 'b') == (False, None)
+    assert cache.get('f', 'a')[0] and cache.get('g', 'c')[0]
+    stats = cache.stats().set_index('Function')
+    assert stats.loc['f', 'Evictions'] == 1 and stats.loc['g', 'Evictions'] == 0
+    assert stats.loc['f', 'Hits'] == 2 and stats.loc['f', 'Misses'] == 1
+    assert stats['Bytes'].sum() == 2 * _size(blob) <= cache.max_bytes
+
+    cache.put('f', 'huge', 'y' * 10000)  # Larger than the whole budget: not stored, nothing evicted
+    assert cache.get('f', 'huge') == (False, None)
+    assert cache.summary()['entries'] == 2
+
+def test_entries_expire_and_hits_are_copies():
+    cache = BoundedCache()
+    df = pd.DataFrame({'a': [1, 2]})
+    cache.put('f', 'k', df, ttl=60)
+    hit, copy = cache.get('f', 'k')
+    copy.loc[0, 'a'] = 99
+    assert cache.get('f', 'k')[1].loc[0, 'a'] == 1
+
+    cache.put('f', 'old', df, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get('f', 'old') == (False, None)
+
+def test_cache_key_hashes_dataframes_by_content():
+    df = pd.DataFrame({'Squad': ['회원', '커머스'], 'Tags': [['a'], ['b']]})
+    assert cache_key('f', (df, 'Squad'), {}) == cache_key('f', (df.copy(), 'Squad'), {})
+    assert cache_key('f', (df, 'Squad'), {}) != cache_key('f', (df, 'Status'), {})
+    assert cache_key('f', (df, 'Squad'), {}) != cache_key('f', (df.iloc[:1], 'Squad'), {})
+    assert cache_key('f', (df,), {}) != cache_key('g', (df,), {})
+
+def test_decorator_computes_once_and_follows_cache_data_clear():
+    cache = BoundedCache()
+    calls = []
+
+    @bounded_cache(ttl=60)
+    def slow(df, col):
+        calls.append(col)
+        time.sleep(0.05)
+        return df[col].sum()
+
+    df = pd.DataFrame({'a': [1, 2, 3]})
+    with patch('bounded_cache.get_cache', return_value=cache):
+        threads = [threading.Thread(target=slow, args=(df, 'a')) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert slow(df, 'a') == 6
+        assert calls == ['a']  # Concurrent callers waited for one computation
+        summary = cache.summary()
+        assert summary['hits'] + summary['misses'] == 5 and summary['entries'] == 1
+
+        st.cache_data.clear()  # Refresh buttons clear st.cache_data -> bounded entries are dropped too
+        slow(df, 'a')
+        assert calls == ['a', 'a']
+        assert slow.__wrapped__(df, 'a') == 6 and len(calls) == 3  # Undecorated function always runs
+
+def test_unstored_results_keep_callers_serialized():
+    cache = BoundedCache(max_bytes=1)  # Every result is over budget: nothing is stored, each caller computes
+    running, overlaps = [], []
+
+    @bounded_cache()
+    def slow(x):
+        running.append(x)
+        overlaps.append(len(running))
+        time.sleep(0.03)
+        running.remove(x)
+        return x
+
+    with patch('bounded_cache.get_cache', return_value=cache):
+        threads = []
+        for _ in range(4):  # Staggered: later callers arrive while earlier ones are waiting on the key lock
+            threads.append(threading.Thread(target=slow, args=(1,)))
+            threads[-1].start()
+            time.sleep(0.01)
+        for t in threads:
+            t.join()
+    assert overlaps == [1, 1, 1, 1]
+    assert cache._key_locks == {}
+
+def test_peek_never_computes():
+    cache = BoundedCache()
+    calls = []
+
+    @bounded_cache(ttl=60)
+    def load(sheet, gid):
+        calls.append(sheet)
+        return pd.DataFrame({'a': [1]})
+
+    with patch('bounded_cache.get_cache', return_value=cache):
+        assert load.peek('sheet', '0') == (False, None)
+        load('sheet', '0')
+        hit, value = load.peek('sheet', '0')
+        assert hit and value['a'].tolist() == [1]
+        assert load.peek('sheet', '1') == (False, None)
+    assert calls == ['sheet']
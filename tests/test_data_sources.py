@@ -0,0 +1,64 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from data_sources import DataSources, PAGE_SOURCES
+
+def _sources(calls, memory=None):
+    sources = DataSources(memory=memory)
+    for name in ['roadmap', 'resource', 'weights']:
+        sources.register(name, lambda name=name: calls.append(name) or f"{name} data", key=('sheet', name))
+    return sources
+
+def test_sources_load_lazily_once():
+    calls = []
+    sources = _sources(calls)
+    assert calls == []  # Registering loads nothing
+    assert sources.key('weights') == ('sheet', 'weights')
+
+    assert sources.get('roadmap') == "roadmap data"
+    assert sources.get('roadmap') == "roadmap data"
+    assert calls == ['roadmap']
+    assert sources.get('unknown') is None
+
+def test_pages_resolve_only_declared_sources():
+    calls = []
+    sources = _sources(calls)
+    assert sources.resolve("로드맵") == {'roadmap': "roadmap data"}
+    assert sources.resolve("데이터 수정") == {'roadmap': "roadmap data"}
+    assert calls == ['roadmap']  # Resource and weight sheets are never requested
+
+    page_data = sources.resolve("리소스 및 이슈")
+    assert set(page_data) == set(PAGE_SOURCES["리소스 및 이슈"])
+    assert calls == ['roadmap', 'resource', 'weights']
+
+def test_resolved_never_loads():
+    calls = []
+    sources = _sources(calls)
+    sources.get('roadmap')
+    assert sources.resolved("리소스 및 이슈") == {'roadmap': "roadmap data"}
+    assert calls == ['roadmap']
+
+def test_resolved_uses_values_from_earlier_reruns():
+    calls, memory = [], {}
+    _sources(calls, memory).resolve("리소스 및 이슈")  # Rerun on the analysis page
+
+    calls.clear()
+    second = _sources(calls, memory)  # Next rerun on the roadmap page: same session memory
+    second.get('roadmap')
+    assert second.resolved("리소스 및 이슈") == {'roadmap': "roadmap data", 'resource': "resource data",
+                                              'weights': "weights data"}
+    assert calls == ['roadmap']
+
+    # A source whose key changed (another sheet) is not reused
+    third = DataSources(memory=memory)
+    third.register('resource', lambda: calls.append('new resource'), key=('sheet', 'other'))
+    assert 'resource' not in third.resolved("리소스 및 이슈")
+
+def test_resolved_peeks_without_loading():
+    calls = []
+    sources = DataSources()
+    sources.register('weights', lambda: calls.append('weights'), key=('sheet', 'weights'), peek=lambda: "cached weights")
+    sources.register('resource', lambda: calls.append('resource'), key=('sheet', 'resource'), peek=lambda: None)
+    assert sources.resolved("리소스 및 이슈") == {'weights': "cached weights"}
+    assert calls == []
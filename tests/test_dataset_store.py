@@ -0,0 +1,105 @@
+import gc
+import pandas as pd
+import numpy as np
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from dataset_store import DatasetStore, dataset_version, _SessionLease, _shared_build
+from bounded_cache import BoundedCache
+from shared_cache import SharedCache
+import utils
+
+SOURCE = ('gsheet', 'sheet', '0')
+
+def _raw(status='진행 중'):
+    return pd.DataFrame({'Squad': ['회원', '커머스'], 'Task': ['T1', 'T2'], 'Status': [status, '진행 예정']})
+
+def _build(calls):
+    def build(raw_df, previous):
+        calls.append(previous is not None)
+        return {'processed': raw_df.assign(Rank=range(len(raw_df)))}
+    return build
+
+def test_dataset_version_follows_content():
+    assert dataset_version(_raw()) == dataset_version(_raw())
+    assert dataset_version(_raw()) != dataset_version(_raw('이슈'))
+    assert dataset_version(_raw()) != dataset_version(_raw().iloc[::-1].reset_index(drop=True))
+
+def test_sessions_share_one_version_per_content():
+    store, calls = DatasetStore(), []
+    first = store.publish(SOURCE, _raw(), _build(calls), stamp=1)
+    again = store.publish(SOURCE, _raw(), _build(calls), stamp=2)  # Same content re-read after the TTL
+    assert again is first and first.stamp == 2
+    assert calls == [False]  # Built once
+
+    store.acquire('a', first)
+    store.acquire('b', first)
+    stats = store.stats()
+    assert len(stats) == 1 and stats['Sessions'].iloc[0] == 2
+
+    # Views share the data but never change the stored frames
+    view = first.view('processed')
+    view['Extra'] = 1
+    view.loc[0, 'Task'] = 'changed'
+    assert 'Extra' not in first.frames['processed'].columns
+    assert first.frames['processed'].loc[0, 'Task'] == 'T1'
+
+def test_views_without_copy_on_write_are_copies():
+    dataset = DatasetStore().publish(SOURCE, _raw(), _build([]))
+    # pandas 2 without utils.enable_copy_on_write() (scripts, tests): a view is a full copy instead of a shared one
+    with patch.object(utils.pd, '__version__', '2.2.3'), patch.object(utils.pd, 'get_option', return_value=False):
+        view = dataset.view('processed')
+    assert not np.shares_memory(view['Rank'].to_numpy(), dataset.frames['processed']['Rank'].to_numpy())
+    with patch.object(utils.pd, '__version__', '3.0.0'):  # Copy-on-Write always on: the view shares the data
+        view = dataset.view('processed')
+    assert np.shares_memory(view['Rank'].to_numpy(), dataset.frames['processed']['Rank'].to_numpy())
+
+def test_old_version_is_evicted_when_no_session_holds_it():
+    store, calls = DatasetStore(), []
+    v1 = store.publish(SOURCE, _raw(), _build(calls))
+    store.acquire('a', v1)
+    store.acquire('b', v1)
+
+    v2 = store.publish(SOURCE, _raw('이슈'), _build(calls))
+    assert calls == [False, True]  # The new version is built from the previous one
+    assert store.current(SOURCE) is v2
+    assert len(store.stats()) == 2  # v1 is still held by both sessions
+
+    store.acquire('a', v2)
+    assert len(store.stats()) == 2
+    store.release_session('b')  # Last holder of v1 is gone
+    stats = store.stats()
+    assert stats['Version'].tolist() == [v2.version] and stats['Sessions'].tolist() == [1]
+
+    # The current version stays even without holders
+    store.release_session('a')
+    assert store.current(SOURCE) is v2 and len(store.stats()) == 1
+
+def test_session_lease_releases_on_drop():
+    store = DatasetStore()
+    v1 = store.publish(SOURCE, _raw(), _build([]))
+    store.acquire('a', v1)
+    store.publish(SOURCE, _raw('이슈'), _build([]))
+
+    session_state = {'dataset_lease': _SessionLease(store, 'a')}
+    assert len(store.stats()) == 2
+    del session_state
+    gc.collect()
+    assert len(store.stats()) == 1
+
+def test_processes_share_one_mapped_build(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    calls = []
+    frames = []
+    for _ in range(2):  # Two processes: separate caches and stores over one shared file
+        with patch('dataset_store.get_cache', return_value=BoundedCache(shared=SharedCache(path))):
+            build = _shared_build(SOURCE, dataset_version(_raw()), _build(calls))
+            frames.append(DatasetStore().publish(SOURCE, _raw(), build).frames)
+
+    assert calls == [False]  # Built by the first process only
+    processed = frames[1]['processed']
+    pd.testing.assert_frame_equal(processed, frames[0]['processed'])
+    assert not processed['Rank'].to_numpy().flags.writeable  # Memory-mapped Arrow file, not a private copy
+    assert os.listdir(SharedCache(path).files_dir)
@@ -0,0 +1,57 @@
+import json
+import re
+import subprocess
+import sys
+import os
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Everything app.py imports at startup (app.py itself runs the Streamlit script, so it is not imported here)
+APP_IMPORTS = "import logic, gsheet_handler, utils, precompute, data_sources, dataset_store, bounded_cache, shared_cache, arrow_store, scenario; from views import roadmap, analysis, data_ops"
+# Loaded at first use only (Google Sheets client, unused plotly.express)
+DEFERRED_MODULES = ['gspread', 'oauth2client', 'plotly.express']
+# Cold-start budget relative to a bare `import pandas, streamlit` on the same machine
+# (the app modules add a few % on top of it; deferring gspread/plotly.express is what keeps it that way)
+BASELINE_IMPORTS = "import pandas, streamlit"
+IMPORT_BUDGET_RATIO = 1.5
+# Optional absolute budget in seconds; it can only tighten the ratio budget
+IMPORT_BUDGET_ENV = 'IMPORT_TIME_BUDGET_S'
+
+def _loaded_modules(code):
+    """Names in sys.modules after running `code` in a fresh interpreter."""
+    result = subprocess.run([sys.executable, '-c', f"{code}; import json, sys; print(json.dumps(sorted(sys.modules)))"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+def _deferred_loaded(modules):
+    return [name for name in DEFERRED_MODULES if any(m == name or m.startswith(name + '.') for m in modules)]
+
+def _importtime(code):
+    """Total seconds of top-level imports from `python -X importtime`."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    total_us = 0
+    for line in result.stderr.splitlines():
+        m = re.match(r'import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)', line)
+        if m and not m.group(2):  # Top-level import (nested ones are included in its cumulative time)
+            total_us += int(m.group(1))
+    return total_us / 1e6
+
+def test_gsheet_handler_defers_google_client():
+    modules = _loaded_modules("import gsheet_handler")
+    assert 'gsheet_handler' in modules
+    assert not _deferred_loaded(modules)
+
+def test_app_imports_defer_heavy_dependencies():
+    modules = _loaded_modules(APP_IMPORTS)
+    assert {'logic', 'gsheet_handler', 'views.roadmap', 'views.analysis'} <= modules
+    assert not _deferred_loaded(modules)
+
+def test_app_import_time_budget():
+    baseline_s = _importtime(BASELINE_IMPORTS)
+    budget_s = baseline_s * IMPORT_BUDGET_RATIO
+    if os.environ.get(IMPORT_BUDGET_ENV):
+        budget_s = min(budget_s, float(os.environ[IMPORT_BUDGET_ENV]))
+    total_s = _importtime(APP_IMPORTS)
+    assert total_s < budget_s, (f"cold-start imports took {total_s:.2f} s "
+                                f"(budget {budget_s:.2f} s; pandas + streamlit alone {baseline_s:.2f} s)")
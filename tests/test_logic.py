@@ -1,4 +1,6 @@
 import pytest
+import tracemalloc
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import sys
@@ -6,7 +8,8 @@ import os
 
 # Add parent directory to path to import logic
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from logic import process_data, apply_sorting, predict_start_date, identify_issues
+from logic import process_data, apply_sorting, predict_start_date, predict_start_dates, identify_issues, calculate_utilization_metrics, calculate_utilization_timeline
+from logic import compute_row_keys, diff_row_keys, process_data_incremental, update_utilization_metrics, memory_report, filter_data
 
 @pytest.fixture
 def sample_df():
@@ -57,3 +60,199 @@ def test_identify_issues(sample_df):
     
     # Overdue logic was removed, so Task1 (Overdue) should NOT be in issues
     assert 'Task1' not in issues['Task'].values
+
+def test_calculate_utilization_metrics_weights():
+    today = pd.Timestamp(datetime.now().date())
+    df_tasks = pd.DataFrame({
+        'Squad': ['A', 'A', 'A', 'B'],
+        'Task': ['T1', 'T2', 'T3', 'T4'],
+        'Start': [today, today, today + pd.Timedelta(days=5), today],
+        'End': [today, today, today + pd.Timedelta(days=9), today],
+        'Status': ['진행 예정', '진행 예정', '진행 중', '진행 예정'],
+        'Type': ['Project', ' Task ', 'Unknown', ''],
+    })
+    df_resource = pd.DataFrame({'Squad': ['A', 'B'], 'Headcount': [4, 2], 'Min_Personnel': [2, 0]})
+    df_weights = pd.DataFrame({'Type': ['Project', 'Task', 'Task'], 'Weight': ['2', 'x', '0.5']})
+
+    metrics = calculate_utilization_metrics(df_tasks, df_resource, df_weights).set_index('Squad')
+
+    # A: Project(2.0) + Task(0.5, last valid row wins) + Unknown(1.0, in progress)
+    assert metrics.loc['A', 'Active_Tasks'] == 3
+    assert metrics.loc['A', 'Total_Load_Score'] == 3.5
+    assert metrics.loc['A', 'Capacity_Score'] == 8.0
+    assert metrics.loc['A', 'Shortage'] == round((3.5 - 8.0) / 2.0, 1)
+
+    # B: blank Type weighs 1.0, Min_Personnel 0 falls back to 1.0
+    assert metrics.loc['B', 'Total_Load_Score'] == 1.0
+    assert metrics.loc['B', 'Capacity_Score'] == 8.0
+    assert metrics.loc['B', 'Shortage'] == round((1.0 - 8.0) / 4.0, 1)
+
+    # Same dtypes as the former merge-based implementation
+    assert metrics['Total_Tasks'].dtype == np.int64
+    assert metrics['Active_Tasks'].dtype == np.float64
+
+def test_calculate_utilization_timeline():
+    today = pd.Timestamp(datetime.now().date())
+    df_tasks = pd.DataFrame({
+        'Squad': ['A', 'A', 'B'],
+        'Task': ['T1', 'T2', 'T3'],
+        'Start': [today, today + pd.Timedelta(days=2), today + pd.Timedelta(days=1)],
+        'End': [today + pd.Timedelta(days=3), today + pd.Timedelta(days=4), today + pd.Timedelta(days=1)],
+        'Status': ['진행 예정', '진행 예정', '진행 예정'],
+    })
+    df_resource = pd.DataFrame({'Squad': ['A', 'B'], 'Headcount': [1, 1], 'Min_Personnel': [1, 1]})
+
+    timeline = calculate_utilization_timeline(df_tasks, df_resource, start_date=today, end_date=today + pd.Timedelta(days=5))
+    load_a = timeline[timeline['Squad'] == 'A']['Load_Score'].tolist()
+    load_b = timeline[timeline['Squad'] == 'B']['Load_Score'].tolist()
+
+    assert load_a == [1.0, 1.0, 2.0, 2.0, 1.0, 0.0]
+    assert load_b == [0.0, 1.0, 0.0, 0.0, 0.0, 0.0]
+    assert (timeline['Capacity_Score'] == 4.0).all()
+
+    # The timeline's 'today' column matches the single-day metric
+    metrics = calculate_utilization_metrics(df_tasks, df_resource).set_index('Squad')
+    today_row = timeline[timeline['Period'] == today].set_index('Squad')
+    assert today_row.loc['A', 'Load_Score'] == metrics.loc['A', 'Total_Load_Score']
+    assert today_row.loc['A', 'Shortage'] == metrics.loc['A', 'Shortage']
+
+    weekly = calculate_utilization_timeline(df_tasks, df_resource, freq='W', start_date=today, end_date=today + pd.Timedelta(days=5))
+    assert weekly.groupby('Squad')['Load_Score'].max().to_dict() == {'A': 2.0, 'B': 1.0}
+
+def test_utilization_timeline_reaches_today_for_overdue_tasks():
+    today = pd.Timestamp(datetime.now().date())
+    df_tasks = pd.DataFrame({
+        'Squad': ['A', 'B'],
+        'Task': ['T1', 'T2'],
+        'Start': [today - pd.Timedelta(days=10), today - pd.Timedelta(days=10)],
+        'End': [today - pd.Timedelta(days=5), today - pd.Timedelta(days=5)],
+        'Status': ['진행 중', '완료'],
+    })
+    df_resource = pd.DataFrame({'Squad': ['A', 'B'], 'Headcount': [1, 1], 'Min_Personnel': [1, 1]})
+
+    # Every End is in the past: the horizon still runs to today, where the overdue in-progress task is active
+    timeline = calculate_utilization_timeline(df_tasks, df_resource, start_date=today)
+    assert timeline['Period'].tolist() == [today, today]
+    today_row = timeline.set_index('Squad')
+    metrics = calculate_utilization_metrics(df_tasks, df_resource).set_index('Squad')
+    assert today_row.loc['A', 'Load_Score'] == metrics.loc['A', 'Total_Load_Score'] == 1.0
+    assert today_row.loc['B', 'Load_Score'] == 0.0
+
+def test_predict_start_dates(sample_df):
+    batch = predict_start_dates(sample_df).set_index('Squad')['Possible Start Date']
+    for squad in ['회원', '커머스', 'Unknown', '전사공통']:
+        assert batch[squad] == predict_start_date(sample_df, squad)
+
+def test_predict_start_dates_capacity_aware():
+    today = pd.Timestamp(datetime.now().date())
+    df_tasks = pd.DataFrame({
+        'Squad': ['A', 'A', 'B'],
+        'Task': ['T1', 'T2', 'T3'],
+        'Start': [today, today, today],
+        'End': [today + pd.Timedelta(days=3), today + pd.Timedelta(days=9), today + pd.Timedelta(days=9)],
+        'Status': ['진행 중', '진행 중', '진행 중'],
+    })
+    # A: capacity 1.6 -> frees up once T1 ends; B: no headcount -> falls back to End + 1
+    df_resource = pd.DataFrame({'Squad': ['A', 'B'], 'Headcount': [2, 0], 'Min_Personnel': [5, 1]})
+
+    preds = predict_start_dates(df_tasks, df_resource, capacity_aware=True).set_index('Squad')['Possible Start Date']
+    assert preds['A'] == today + pd.Timedelta(days=4)
+    assert preds['B'] == today + pd.Timedelta(days=10)
+
+def _raw_sheet():
+    today = pd.Timestamp(datetime.now().date())
+    return pd.DataFrame({
+        'squad': ['A', 'A', 'B', 'C', 'C'],
+        'subproject_name': ['T1', 'T1', 'T2', 'T3', 'T4'],
+        'start_date': [str((today - pd.Timedelta(days=d)).date()) for d in range(5)],
+        'end_date': [str((today + pd.Timedelta(days=d)).date()) for d in range(5)],
+        'status': ['진행 중', '진행 예정', '진행 중', '진행 완료', '진행 중'],
+        'type': ['BE', 'FE', 'BE', 'QA', 'BE'],
+    })
+
+def test_diff_row_keys():
+    raw = _raw_sheet()
+    keys = compute_row_keys(raw)
+    # Duplicate (Squad, Task) pairs still get distinct keys
+    assert keys['Task_Key'].is_unique
+
+    edited = raw.copy()
+    edited.loc[2, 'status'] = '진행 완료'
+    edited = pd.concat([edited.drop(index=4), pd.DataFrame([{'squad': 'D', 'subproject_name': 'T5'}])], ignore_index=True)
+    changes = diff_row_keys(keys, compute_row_keys(edited))
+
+    assert len(changes['inserted']) == 1
+    assert len(changes['updated']) == 1
+    assert len(changes['deleted']) == 1
+
+def test_process_data_incremental_matches_full():
+    raw = _raw_sheet()
+    state = process_data_incremental(raw)
+    assert state['changes'] is None
+
+    edited = raw.copy()
+    edited.loc[0, 'status'] = '이슈'
+    edited.loc[3, 'end_date'] = '2030-01-01'
+    edited = pd.concat([edited.drop(index=2), pd.DataFrame([{'squad': 'D', 'subproject_name': 'T5', 'status': '보류'}])], ignore_index=True)
+
+    incremental = process_data_incremental(edited, state)
+    full = process_data(edited.copy())
+    pd.testing.assert_frame_equal(incremental['processed'], full)
+    assert incremental['changed_squads'] == {'A', 'B', 'C', 'D'}
+
+def test_update_utilization_metrics_matches_full():
+    df_resource = pd.DataFrame({'Squad': ['A', 'B', 'C'], 'Headcount': [2, 1, 3], 'Min_Personnel': [1, 1, 2]})
+    raw = _raw_sheet()
+    state = process_data_incremental(raw)
+    metrics, util_state = update_utilization_metrics(state['processed'], df_resource, row_keys=state['keys'])
+
+    edited = raw.copy()
+    edited.loc[1, 'status'] = '진행 중'
+    edited = edited.drop(index=2)
+    state = process_data_incremental(edited, state)
+    metrics, util_state = update_utilization_metrics(state['processed'], df_resource, row_keys=state['keys'], previous=util_state)
+
+    expected = calculate_utilization_metrics(state['processed'], df_resource)
+    pd.testing.assert_frame_equal(metrics, expected)
+
+def test_compact_frame():
+    raw = pd.concat([_raw_sheet()] * 4, ignore_index=True)
+    raw['PM'] = ['김', '이'] * 10
+    raw['QA'] = '이'
+    raw['order'] = range(20)
+    processed = process_data(raw)
+
+    assert isinstance(processed['Squad'].dtype, pd.CategoricalDtype)
+    assert list(processed['Squad'].cat.categories) == ['A', 'B', 'C']
+    # People columns share one dictionary
+    assert processed['PM'].dtype == processed['QA'].dtype
+    assert processed['Order'].dtype == 'int8'
+    # Unique per row -> left as plain text
+    assert not isinstance(processed['Task'].dtype, pd.CategoricalDtype)
+
+    report = memory_report({'raw': raw, 'processed': processed}).set_index('Stage')
+    assert report.loc['raw', 'Saved_Bytes'] == 0
+    assert report.loc['processed', 'Saved_Bytes'] > 0
+    assert report.loc['processed', 'Bytes'] < report.loc['raw', 'Bytes']
+
+@patch('logic.get_squad_order')
+def test_pipeline_shares_buffers(mock_get_order):
+    mock_get_order.return_value = ['B', 'A']
+    raw = pd.concat([_raw_sheet()] * 2000, ignore_index=True)
+    raw_columns = list(raw.columns)
+    dataset_bytes = raw.memory_usage(index=True, deep=True).sum()
+
+    tracemalloc.start()
+    df = process_data.__wrapped__(raw)
+    filtered = filter_data(df, None, None)
+    final = apply_sorting(filtered)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < 4 * dataset_bytes
+    # No stage modifies its input
+    assert list(raw.columns) == raw_columns
+    assert isinstance(df['Squad'].dtype, pd.CategoricalDtype) and list(df['Squad'].cat.categories) == ['A', 'B', 'C']
+    # Unfiltered stages share column buffers instead of copying
+    assert np.shares_memory(filtered['Start'].to_numpy(), df['Start'].to_numpy())
+    assert len(final) == len(df)
@@ -0,0 +1,113 @@
+import pandas as pd
+import streamlit as st
+from datetime import datetime
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from logic import process_data
+from data_sources import DataSources
+import precompute
+
+def _frames():
+    today = pd.Timestamp(datetime.now().date())
+    raw = pd.DataFrame({
+        'Squad': ['회원', '커머스', '회원', '팬덤'],
+        'Task': ['T1', 'T2', 'T3', 'T4'],
+        'Status': ['진행 중', '진행 예정', '이슈', '진행 중'],
+        'Start': [today, today + pd.Timedelta(days=5), today - pd.Timedelta(days=3), None],
+        'End': [today + pd.Timedelta(days=10), today + pd.Timedelta(days=20), None, None],
+        'Type': ['Project', 'Task', 'Task', 'Project'],
+        'Comment': ['', '', 'blocked', ''],
+    })
+    df = process_data.__wrapped__(raw)
+    df_resource = pd.DataFrame({'Squad': ['회원', '커머스', '팬덤'], 'Headcount': [4, 2, 2], 'Min_Personnel': [2, 1, 1]})
+    return df, df_resource
+
+@patch('precompute.sort_squads', side_effect=sorted)
+@patch('logic.get_squad_order', return_value=[])
+def test_precompute_warms_other_pages(mock_order, mock_sort):
+    st.cache_data.clear()
+    precompute._jobs.clear()
+    df, df_resource = _frames()
+
+    thread = precompute.start_precompute(df, current_page=precompute.ROADMAP_PAGE, df_resource=df_resource)
+    thread.join()
+    # Same dataset and page -> no second job
+    assert precompute.start_precompute(df, current_page=precompute.ROADMAP_PAGE, df_resource=df_resource) is None
+
+    # The analysis page's calls (default filters) are served from the cache without recomputing
+    all_statuses, all_squads = precompute.analysis_filter_options(df)
+    with patch('precompute.identify_issues', side_effect=AssertionError), \
+         patch('precompute.update_utilization_metrics', side_effect=AssertionError), \
+         patch('precompute.calculate_utilization_timeline', side_effect=AssertionError), \
+         patch('precompute.predict_start_dates', side_effect=AssertionError):
+        final_df = precompute.analysis_frame(df, all_statuses, all_squads, None)
+        assert len(precompute.issues_table(final_df)) == 1
+        metrics, state = precompute.utilization_metrics(final_df, df_resource, None, None)
+        assert set(metrics['Squad']) == {'회원', '커머스', '팬덤'}
+        precompute.utilization_timeline(final_df, df_resource, None, freq='W', start_date=datetime.now().date())
+        precompute.start_date_predictions(final_df, df_resource, None, capacity_aware=True)
+
+@patch('precompute.sort_squads', side_effect=sorted)
+@patch('logic.get_squad_order', return_value=[])
+def test_roadmap_page_warms_analysis_metrics(mock_order, mock_sort):
+    st.cache_data.clear()
+    precompute._jobs.clear()
+    df, df_resource = _frames()
+    memory = {}  # st.session_state['loaded_sources']
+
+    def rerun(loaders):
+        sources = DataSources(memory=memory)
+        for name, loader in loaders.items():
+            sources.register(name, loader, key=('sheet', name))
+        return sources
+
+    def not_loaded():
+        raise AssertionError('loaded for the precompute job')
+
+    # The session opened the analysis page once, then the roadmap sheet changed
+    rerun({'roadmap': lambda: df, 'resource': lambda: df_resource, 'weights': lambda: None}).resolve(precompute.ANALYSIS_PAGE)
+    changed = df.assign(Status=df['Status'].where(df['Task'] != 'T2', '이슈'))
+
+    # Roadmap page rerun: only the roadmap is loaded; the job reuses the session's resource/weight data
+    sources = rerun({'roadmap': lambda: changed, 'resource': not_loaded, 'weights': not_loaded})
+    precompute.start_precompute_from_sources(sources, sources.get('roadmap'), current_page=precompute.ROADMAP_PAGE).join()
+
+    all_statuses, all_squads = precompute.analysis_filter_options(changed)
+    with patch('precompute.update_utilization_metrics', side_effect=AssertionError), \
+         patch('precompute.calculate_utilization_timeline', side_effect=AssertionError), \
+         patch('precompute.predict_start_dates', side_effect=AssertionError):
+        final_df = precompute.analysis_frame(changed, all_statuses, all_squads, None)
+        metrics, state = precompute.utilization_metrics(final_df, df_resource, None, None)
+        assert set(metrics['Squad']) == {'회원', '커머스', '팬덤'}
+        precompute.utilization_timeline(final_df, df_resource, None, freq='W', start_date=datetime.now().date())
+        precompute.start_date_predictions(final_df, df_resource, None, capacity_aware=True)
+
+def test_precompute_skips_current_page_work():
+    precompute._jobs.clear()
+    df, df_resource = _frames()
+    with patch('precompute.warm_analysis') as warm_analysis, patch('precompute.warm_roadmap') as warm_roadmap:
+        precompute.start_precompute(df, current_page=precompute.ANALYSIS_PAGE, df_resource=df_resource).join()
+    warm_analysis.assert_not_called()
+    warm_roadmap.assert_called_once()
+    assert precompute.start_precompute(pd.DataFrame()) is None
+
+def test_precompute_without_loaded_resources_skips_resource_metrics():
+    precompute._jobs.clear()
+    df, _ = _frames()
+    with patch('precompute.utilization_metrics') as metrics, patch('precompute.issues_table') as issues, \
+         patch('precompute.warm_roadmap'):
+        precompute.start_precompute(df, current_page=precompute.ROADMAP_PAGE, with_resources=False).join()
+    issues.assert_called_once()
+    metrics.assert_not_called()
+
+def test_precompute_failures_are_logged(caplog):
+    precompute._jobs.clear()
+    df, _ = _frames()
+    def warm_roadmap(df):
+        raise ValueError('boom')
+    with patch('precompute.warm_roadmap', warm_roadmap), caplog.at_level('ERROR', logger='precompute'):
+        precompute.start_precompute(df, current_page=precompute.ANALYSIS_PAGE).join()
+    assert 'Precompute warm_roadmap failed' in caplog.text and 'boom' in caplog.text
@@ -0,0 +1,212 @@
+import json
+import pytest
+import subprocess
+import pandas as pd
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+import sys
+import os
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from logic import process_data
+from views.roadmap import (
+    create_professional_gantt, create_summary_gantt, needs_summary, sort_roadmap_rows, time_scale, window_bounds,
+    filter_roadmap, filter_statuses, _drill_into_summary_group, _panel_width, _wrap_panel_label, _panel_color,
+    PRIMARY_PANEL_FONT, SECONDARY_PANEL_FONT, PANEL_MIN_PX, PANEL_PADDING_PX,
+    PX_PER_DAY, SUMMARY_MAX_GROUPS, TIMELINE_MAX_PX, TIMELINE_MIN_PX
+)
+
+@pytest.fixture
+def roadmap_df():
+    today = pd.Timestamp(datetime.now().date())
+    data = {
+        'Squad': ['회원', '회원', '커머스', '커머스', '팬덤', '팬덤'],
+        'Task': ['T1', 'T2', 'T3', 'T4', 'T5', 'T6'],
+        'Status': ['진행 중', '진행 예정', '진행 중', '이슈', '진행 예정', '진행 중'],
+        'Start': [today, today, None, None, today - pd.Timedelta(days=10), today],
+        'End': [today + pd.Timedelta(days=10), None, today + pd.Timedelta(days=5), None, today, today + pd.Timedelta(days=3)],
+        'Goal': ['G1', 'G1', 'G2', 'G2', 'G1', 'G2'],
+        'Type': ['Project', 'Task', 'Task', 'Task', 'Project', 'Task'],
+        'Comment': ['', 'memo', None, '', 'long ' * 30, ''],
+    }
+    return process_data.__wrapped__(pd.DataFrame(data))
+
+def _build(df, group_col='Squad'):
+    with patch('utils.get_custom_squad_order', return_value=[]):
+        return create_professional_gantt.__wrapped__(df, group_col)
+
+def test_gantt_batches_bars_per_status(roadmap_df):
+    fig = _build(roadmap_df)
+    bars = [t for t in fig.data if t.type == 'bar' and t.customdata is not None]
+    markers = [t for t in fig.data if t.type == 'scatter' and t.mode == 'markers+text']
+
+    # One bar trace per status, not per task
+    assert len(bars) == 2
+    assert sum(len(t.y) for t in bars) == 5
+    # T4 has neither date -> marker only
+    assert sum(len(t.y) for t in markers) == 1
+    assert fig.layout.barmode == 'overlay'
+
+    # Shared template, per-bar values via customdata
+    for trace in bars:
+        assert '%{customdata[0]}' in trace.hovertemplate
+        assert len(trace.customdata) == len(trace.y)
+
+def test_gantt_layout_shapes(roadmap_df):
+    fig = _build(roadmap_df, group_col='Status')
+    shapes = fig.layout.shapes
+
+    # One zebra stripe per row
+    stripes = [s for s in shapes if s.type == 'rect' and s.layer == 'below']
+    assert len(stripes) == len(roadmap_df)
+
+    # Dashed Squad separators only where the Squad changes inside the same Status group
+    squad_lines = sorted(s.y0 for s in shapes if s.line.dash == 'longdash')
+    assert squad_lines == [0.5, 1.5, 3.5]
+
+def test_gantt_badges_are_traces(roadmap_df):
+    fig = _build(roadmap_df)
+
+    # Panel labels (Squad, Squad/Goal) + Today only; no per-row badge annotations
+    n_panels = roadmap_df['Squad'].nunique() + roadmap_df.groupby(['Squad', 'Goal'], observed=True).ngroups
+    assert len(fig.layout.annotations) == n_panels + 1
+    badge_labels = [t for t in fig.data if t.type == 'scatter' and t.mode == 'text']
+    assert sorted(t.text for t in badge_labels) == ['<b>이슈</b>', '<b>진행 예정</b>', '<b>진행 중</b>']
+    assert sum(len(t.y) for t in badge_labels) == len(roadmap_df)
+
+def test_gantt_webgl_mode(roadmap_df):
+    with patch('utils.get_custom_squad_order', return_value=[]):
+        fig = create_professional_gantt.__wrapped__(roadmap_df, 'Squad', render_mode='webgl')
+
+    assert {t.type for t in fig.data} == {'scattergl', 'scatter'}  # scatter: legend entries only
+    lines = [t for t in fig.data if t.type == 'scattergl' and t.mode == 'lines']
+    # [start, end, gap] per bar
+    assert sum(len(t.x) for t in lines) == 5 * 3
+    # No per-row zebra shapes; panels are kept
+    assert not [s for s in fig.layout.shapes if s.layer == 'below' and s.type == 'rect']
+    assert any(s.type == 'rect' for s in fig.layout.shapes)
+
+def test_summary_gantt_size_is_bounded(roadmap_df):
+    big = pd.concat([roadmap_df] * 200, ignore_index=True)
+    big['Project'] = [f'P{i % 60}' for i in range(len(big))]
+    assert needs_summary(big) and not needs_summary(roadmap_df)
+
+    with patch('utils.get_custom_squad_order', return_value=[]):
+        by_squad = create_summary_gantt.__wrapped__(big, 'Squad')
+        by_project = create_summary_gantt.__wrapped__(big, 'Project')
+
+    heatmap, spans = by_squad.data
+    # One row per group, size independent of the task count
+    assert list(spans.y) == ['커머스', '팬덤', '회원']
+    assert [row[1] for row in spans.customdata] == [400] * 3
+    assert heatmap.z.shape[0] == 3 and heatmap.z.max() <= 400
+
+    # Too many groups -> folded into a '기타' row that cannot be drilled into
+    assert len(by_project.data[1].y) == SUMMARY_MAX_GROUPS
+    assert by_project.data[1].customdata[-1][0] is None
+    assert sum(row[1] for row in by_project.data[1].customdata) == len(big)
+
+def test_window_bounds():
+    df = pd.DataFrame({'Squad': ['A'] * 3 + ['B'] * 7 + ['C'] * 2 + ['D'] * 1})
+
+    assert window_bounds(df, 'Squad', 5) == [(0, 5), (5, 10), (10, 13)]
+    # Whole groups per page; B is larger than a page and gets split
+    assert window_bounds(df, 'Squad', 5, by_group=True) == [(0, 3), (3, 8), (8, 13)]
+    assert window_bounds(df, 'Squad', 10, by_group=True) == [(0, 10), (10, 13)]
+    assert window_bounds(df.iloc[:0], 'Squad', 5, by_group=True) == [(0, 0)]
+
+def test_gantt_window_keeps_panels_and_axis(roadmap_df):
+    with patch('utils.get_custom_squad_order', return_value=[]):
+        df_sorted = sort_roadmap_rows(roadmap_df, 'Squad').drop(columns='squad_rank')
+        full = create_professional_gantt.__wrapped__(df_sorted, 'Squad')
+        date_range = (roadmap_df['Start'].min(), roadmap_df['End'].max())
+        page = create_professional_gantt.__wrapped__(df_sorted.iloc[2:4], 'Squad', date_range=date_range)
+
+    # Panels are laid out for the window's own rows; the timeline ends where the full chart does
+    assert {a.text for a in page.layout.annotations} < {a.text for a in full.layout.annotations}
+    assert page.layout.yaxis.range == (2, -1)
+    assert page.layout.xaxis.range[1] == full.layout.xaxis.range[1]
+
+def test_time_scale_bounds_timeline():
+    start = pd.Timestamp('2026-01-01')
+    resolutions = {}
+    for days in [3, 20, 365, 1500, 6000]:
+        scale = time_scale(start, start + pd.Timedelta(days=days))
+        timeline_px = (scale['end'] - start).days * scale['px_per_day']
+        assert TIMELINE_MIN_PX - 1 <= timeline_px <= TIMELINE_MAX_PX + 1
+        resolutions[days] = scale['resolution']
+
+    assert resolutions == {3: 'day', 20: 'week', 365: 'month', 1500: 'quarter', 6000: 'year'}
+    # Typical one-year roadmaps keep the preferred density
+    assert time_scale(start, start + pd.Timedelta(days=365))['px_per_day'] == PX_PER_DAY
+
+def test_gantt_width_with_far_out_task(roadmap_df):
+    outlier = roadmap_df.copy()
+    outlier.loc[0, 'End'] = outlier['Start'].max() + pd.Timedelta(days=365 * 8)
+    fig = _build(outlier)
+
+    # Panels + compressed timeline instead of 8 years at 5 px/day
+    assert fig.layout.width < TIMELINE_MAX_PX + 1000
+    assert fig.layout.xaxis.dtick in ('M3', 'M12')
+
+def test_roadmap_filters(roadmap_df):
+    # Default filters (every squad/goal) keep all rows; search is case-insensitive
+    assert len(filter_roadmap(roadmap_df, squads=list(roadmap_df['Squad'].unique()))) == len(roadmap_df)
+    assert filter_roadmap(roadmap_df, search_query='t1')['Task'].tolist() == ['T1']
+    assert (filter_roadmap(roadmap_df, show_completed=False)['Status'] != '진행 완료').all()
+    assert filter_statuses(roadmap_df, []) is roadmap_df
+    assert set(filter_statuses(roadmap_df, ['이슈'])['Status']) <= {'이슈'}
+
+def test_summary_click_sets_drilldown():
+    state = {'roadmap_summary_chart': SimpleNamespace(selection=SimpleNamespace(points=[{'customdata': ['회원', 3]}]))}
+    with patch('views.roadmap.st.session_state', state):
+        _drill_into_summary_group('Squad')
+    assert state['roadmap_drilldown'] == ('Squad', '회원')
+
+    # The folded '기타' row has no group and selections cleared by a click elsewhere do nothing
+    for points in [[{'customdata': [None, 9]}], []]:
+        state = {'roadmap_summary_chart': SimpleNamespace(selection=SimpleNamespace(points=points))}
+        with patch('views.roadmap.st.session_state', state):
+            _drill_into_summary_group('Squad')
+        assert 'roadmap_drilldown' not in state
+
+def test_panel_width_uses_measured_fonts_only(roadmap_df):
+    font = ('Arial Black', 13)
+    # No measured table: visual-width heuristic (80 + 11 px per unit + 40; '커머스' = 6 units)
+    with patch('text_metrics.has_font_metrics', return_value=False):
+        assert _panel_width(roadmap_df, 'Squad', font) == (186, 146)
+        assert _wrap_panel_label('커머스', 146, font) == '커머스'
+    # Measured table: tight fit to the widest rendered label + padding
+    with patch('text_metrics.has_font_metrics', return_value=True), \
+         patch('text_metrics.text_widths_px', return_value=pd.Series([40.2, 100.5])):
+        assert _panel_width(roadmap_df, 'Squad', font) == (125, 101)
+
+    # The panel fonts ship measured tables, so real panels take the tight path ('커머스' = 3 x 11.6 px -> minimum width)
+    for panel_font in (PRIMARY_PANEL_FONT, SECONDARY_PANEL_FONT):
+        assert _panel_width(roadmap_df, 'Squad', panel_font) == (PANEL_MIN_PX, PANEL_MIN_PX - PANEL_PADDING_PX)
+
+def test_fallback_colors_are_stable_across_processes():
+    code = "from views.roadmap import _panel_color; print(_panel_color('Squad', '신규 스쿼드'), _panel_color('Goal', 'G9'))"
+    outputs = {subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+               for _ in range(2)}  # Each interpreter salts str hashes differently
+    assert outputs == {f"{_panel_color('Squad', '신규 스쿼드')} {_panel_color('Goal', 'G9')}\n"}
+
+def test_search_box_sends_debounced_value():
+    from streamlit.testing.v1 import AppTest
+    from views.search_box import SEARCH_DEBOUNCE_MS
+
+    def app():
+        import streamlit as st
+        from views.search_box import debounced_search
+        st.session_state['query'] = debounced_search("🔍 과제명 검색", key="roadmap_search")
+
+    at = AppTest.from_function(app).run()
+    args = json.loads(at.get('component_instance')[0].proto.json_args)
+    assert args['debounce_ms'] == SEARCH_DEBOUNCE_MS and at.session_state['query'] == ''
+
+    at.session_state['roadmap_search'] = '회원'  # Value sent by the frame after a typing pause
+    at.run()
+    assert at.session_state['query'] == '회원'
+    assert json.loads(at.get('component_instance')[0].proto.json_args)['value'] == '회원'  # Restored on remount
@@ -0,0 +1,57 @@
+import re
+import pandas as pd
+from datetime import datetime
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from logic import process_data
+from views.roadmap_canvas import build_canvas_payload, FRONTEND_DIR
+
+def _payload():
+    today = pd.Timestamp(datetime.now().date())
+    raw = pd.DataFrame({
+        'Squad': ['회원', '커머스', '회원', '팬덤'],
+        'Task': ['T1', 'T2', 'T3', None],
+        'Status': ['진행 중', '진행 예정', '이슈', '진행 중'],
+        'Start': [today, None, today - pd.Timedelta(days=3), None],
+        'End': [today + pd.Timedelta(days=10), today, None, None],
+        'Goal': ['G1', None, 'G1', 'G2'],
+        'Comment': ['', 'memo', None, ''],
+    })
+    df = process_data.__wrapped__(raw)
+    with patch('utils.get_custom_squad_order', return_value=['팬덤', '회원']):
+        return df, build_canvas_payload.__wrapped__(df)
+
+def test_canvas_payload_is_columnar():
+    df, payload = _payload()
+    assert payload['n'] == len(df)
+
+    # Dictionary-encoded columns decode back to the frame's values (-1 = missing)
+    for col, codes in payload['codes'].items():
+        decoded = [payload['dicts'][col][c] if c >= 0 else None for c in codes]
+        expected = [None if pd.isna(v) else str(v) for v in df[col]]
+        assert decoded == expected, col
+
+    # Dates are whole days since epoch; missing dates are None
+    today = (pd.Timestamp(datetime.now().date()) - pd.Timestamp('1970-01-01')).days
+    assert payload['days']['Start'] == [today, None, today - 3, None]
+    assert payload['days']['End'] == [today + 10, today, None, None]
+
+    # Styles and ranks are per dictionary value, not per task
+    assert 'Comment' not in payload['group_cols'] and 'Squad' in payload['group_cols']
+    assert set(payload['status_styles']) == set(payload['dicts']['Status'])
+    assert len(payload['squad_rank']) == len(payload['dicts']['Squad'])
+    ranks = dict(zip(payload['dicts']['Squad'], payload['squad_rank']))
+    assert ranks['팬덤'] < ranks['회원'] < ranks['커머스']
+
+def test_canvas_frontend_is_self_contained():
+    files = sorted(os.listdir(FRONTEND_DIR))
+    assert files == ['index.html', 'roadmap_canvas.js']
+    for name in files:
+        with open(os.path.join(FRONTEND_DIR, name), encoding='utf-8') as f:
+            source = f.read()
+        # No CDN / remote assets
+        assert not re.search(r'(src|href)=["\']?(https?:)?//', source)
+        assert 'import(' not in source and 'fetch(' not in source
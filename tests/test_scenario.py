@@ -0,0 +1,74 @@
+import pytest
+import pandas as pd
+from datetime import datetime
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from logic import calculate_utilization_metrics, predict_start_dates
+from scenario import ScenarioEngine
+
+@pytest.fixture
+def base_data():
+    today = pd.Timestamp(datetime.now().date())
+    df_tasks = pd.DataFrame({
+        'Squad': ['A', 'A', 'B', 'C', 'C'],
+        'Task': ['T1', 'T2', 'T3', 'T4', 'T5'],
+        'Start': [today, today - pd.Timedelta(days=3), today, today + pd.Timedelta(days=10), today],
+        'End': [today + pd.Timedelta(days=5), today + pd.Timedelta(days=20), today + pd.Timedelta(days=2),
+                today + pd.Timedelta(days=30), today + pd.Timedelta(days=7)],
+        'Status': ['진행 중', '진행 예정', '진행 중', '진행 예정', '진행 예정'],
+        'Type': ['Project', 'Task', 'Task', 'Project', 'Task'],
+    }, index=[10, 11, 12, 13, 14])
+    df_resource = pd.DataFrame({'Squad': ['A', 'B', 'C'], 'Headcount': [2, 4, 1], 'Min_Personnel': [1, 2, 1]})
+    df_weights = pd.DataFrame({'Type': ['Project', 'Task'], 'Weight': [2, 1]})
+    return df_tasks, df_resource, df_weights
+
+def _full_recompute(df_tasks, df_resource, df_weights):
+    metrics = calculate_utilization_metrics(df_tasks, df_resource, df_weights)
+    preds = predict_start_dates(df_tasks, df_resource, df_weights, capacity_aware=True)
+    return metrics.set_index('Squad').sort_index(), preds.set_index('Squad').sort_index()
+
+def test_scenario_matches_full_recompute(base_data):
+    df_tasks, df_resource, df_weights = base_data
+    engine = ScenarioEngine(df_tasks, df_resource, df_weights, capacity_aware=True)
+
+    edits = [
+        {'action': 'move', 'task': 10, 'squad': 'B'},
+        {'action': 'shift', 'task': 13, 'days': -10},
+        {'action': 'drop', 'task': 11},
+        {'action': 'headcount', 'squad': 'C', 'headcount': 3},
+    ]
+    result = engine.evaluate(edits)
+    assert result['affected_squads'] == {'A', 'B', 'C'}
+
+    edited = df_tasks.copy()
+    edited.loc[10, 'Squad'] = 'B'
+    edited.loc[13, ['Start', 'End']] = edited.loc[13, ['Start', 'End']] - pd.Timedelta(days=10)
+    edited = edited.drop(index=11)
+    edited_resource = df_resource.copy()
+    edited_resource.loc[edited_resource['Squad'] == 'C', 'Headcount'] = 3
+    expected_metrics, expected_preds = _full_recompute(edited, edited_resource, df_weights)
+
+    metrics = result['metrics'].set_index('Squad').sort_index()
+    cols = ['Total_Tasks', 'Active_Tasks', 'Capacity_Score', 'Total_Load_Score', 'Shortage']
+    pd.testing.assert_frame_equal(metrics[cols], expected_metrics[cols], check_dtype=False, check_index_type=False)
+    preds = result['predictions'].set_index('Squad').sort_index()
+    assert preds['Possible Start Date'].tolist() == expected_preds['Possible Start Date'].tolist()
+
+def test_scenario_only_touches_affected_squads(base_data):
+    df_tasks, df_resource, df_weights = base_data
+    engine = ScenarioEngine(df_tasks, df_resource, df_weights)
+
+    result = engine.evaluate([{'action': 'drop', 'task': 12}])
+    assert result['affected_squads'] == {'B'}
+    # Untouched squads are carried over from the base results
+    base = engine.base_metrics.set_index('Squad')
+    scenario = result['metrics'].set_index('Squad')
+    assert scenario.loc['A'].equals(base.loc['A'])
+    assert 'B' not in scenario.index  # B has no tasks left
+
+    comparison = engine.compare([{'action': 'headcount', 'squad': 'A', 'headcount': 4}])
+    row = comparison.set_index('Squad').loc['A']
+    assert row['Capacity_Score_Before'] == 8.0
+    assert row['Capacity_Score_After'] == 16.0
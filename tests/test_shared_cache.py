@@ -0,0 +1,93 @@
+import io
+import subprocess
+import threading
+import time
+import pandas as pd
+from unittest.mock import patch
+import sys
+import os
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+from shared_cache import SharedCache
+from bounded_cache import BoundedCache
+
+def test_entries_are_visible_to_other_processes(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    code = ("from shared_cache import SharedCache; import pickle, pandas as pd; "
+            f"SharedCache({path!r}).put('load_data', 'k', pickle.dumps(pd.DataFrame({{'a': [1, 2]}})))")
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
+
+    payload, expires = SharedCache(path).get('k')
+    assert pd.read_pickle(io.BytesIO(payload))['a'].tolist() == [1, 2]
+    assert expires is None
+
+def test_budget_and_expiry(tmp_path):
+    cache = SharedCache(str(tmp_path / 'cache.sqlite'), max_bytes=250)
+    cache.put('f', 'a', b'x' * 100)
+    time.sleep(0.01)
+    cache.put('f', 'b', b'x' * 100)
+    with patch('shared_cache.LAST_USED_RESOLUTION_S', 0):
+        cache.get('a')  # 'a' is now the most recently used
+    cache.put('g', 'c', b'x' * 100)  # Over budget -> evicts 'b'
+    assert cache.get('b') is None and cache.get('a') is not None
+    assert cache.stats().set_index('Function')['Bytes'].sum() == 200
+
+    cache.put('f', 'old', b'y', expires=time.time() - 1)
+    assert cache.get('old') is None
+    cache.put('f', 'huge', b'z' * 1000)  # Larger than the budget: not stored
+    assert cache.get('huge') is None
+
+def test_hits_are_plain_reads(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = SharedCache(path)
+    cache.put('f', 'k', b'x')
+    cache.put('f', 'old', b'y', expires=time.time() + 0.01)
+    time.sleep(0.02)
+
+    other = SharedCache(path)._connect()
+    other.execute('BEGIN IMMEDIATE')  # Another process holds the write lock
+    try:
+        assert cache.get('k') == (b'x', None)  # Recently used: no last_used write, so no wait for the lock
+        assert cache.get('old') is None
+    finally:
+        other.execute('ROLLBACK')
+    cache.put('f', 'new', b'z')  # Writers drop expired entries
+    assert cache.stats()['Entries'].sum() == 2
+
+def test_concurrent_processes_compute_once(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    calls, results = [], []
+
+    def replica():
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return b'figure'
+        results.append(SharedCache(path).get_or_compute('f', 'k', compute, ttl=60))
+
+    threads = [threading.Thread(target=replica) for _ in range(4)]  # Separate connections and owners
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert sorted(r[2] for r in results) == [False, False, False, True]
+    assert {r[0] for r in results} == {b'figure'}
+
+def test_bounded_caches_share_results_and_clears(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    a, b = BoundedCache(shared=SharedCache(path)), BoundedCache(shared=SharedCache(path))
+    for cache in (a, b):
+        cache.sync_generation(1)
+
+    value, payload, expires = a.shared_lookup('f', 'k', lambda: pd.DataFrame({'a': [1]}), ttl=60)
+    b_value, _, b_expires = b.shared_lookup('f', 'k', lambda: pd.DataFrame({'a': [2]}), ttl=60)
+    assert b_value['a'].tolist() == [1] and b_expires == expires
+    assert b.summary()['shared_hits'] == 1 and a.summary()['shared_hits'] == 0
+
+    b.put_payload('f', 'k', payload, ttl=60)
+    a.sync_generation(2)  # st.cache_data was cleared in process a -> shared cache cleared
+    assert a.shared.get('k') is None
+    b.sync_generation(1)  # Process b notices the new epoch and drops its local copy
+    assert b.get('f', 'k') == (False, None)
@@ -0,0 +1,68 @@
+import unicodedata
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import text_metrics
+
+SAMPLES = ['', 'Squad', '회원', '커머스 Platform', '公共 API', 'ＡＢＣ', '±·—', '😀 이모지', '𠀀', 'A' * 40 + '가' * 10]
+
+def _reference_width(text):
+    return sum(2 if unicodedata.east_asian_width(c) in ['F', 'W', 'A'] else 1 for c in str(text))
+
+def test_visual_width_matches_unicodedata():
+    for text in SAMPLES:
+        assert text_metrics.visual_width(text) == _reference_width(text), text
+
+def test_visual_widths_series():
+    series = pd.Series(SAMPLES * 3 + [None, np.nan], index=range(100, 132))
+    widths = text_metrics.visual_widths(series)
+
+    assert widths.index.equals(series.index)
+    assert widths.tolist() == series.astype(str).apply(_reference_width).tolist()
+    # Categoricals (compact_frame columns) measure their values the same way
+    assert text_metrics.visual_widths(series.astype('category')).tolist() == widths.tolist()
+    assert text_metrics.visual_widths(pd.Series([], dtype=object)).empty
+
+def test_wrap_text_by_pixels_is_memoized():
+    text_metrics.wrap_text_by_pixels.cache_clear()
+    wrapped = text_metrics.wrap_text_by_pixels('커머스 플랫폼 Squad', 100)
+
+    # 26 px per Korean char, 14 px per narrow char at font_size 12
+    line_px = [sum(26 if text_metrics.visual_width(c) == 2 else 14 for c in line) for line in wrapped.split('<br>')]
+    assert len(line_px) > 1 and max(line_px) <= 100
+    assert wrapped.replace('<br>', '') == '커머스 플랫폼 Squad'
+    assert text_metrics.wrap_text_by_pixels('커머스 플랫폼 Squad', 100) == wrapped
+    assert text_metrics.wrap_text_by_pixels.cache_info().hits == 1
+    # Font size is part of the key
+    assert text_metrics.wrap_text_by_pixels('커머스 플랫폼 Squad', 100, 16) != wrapped
+
+def test_only_measured_fonts_drive_layout():
+    # Arial/Arial Bold: Helvetica AFM advances + Hangul advance measured on the fallback font
+    for font in ['Arial', 'Arial Bold']:
+        assert text_metrics.has_font_metrics(font), font
+    # No table (or Hangul advance not measured) -> heuristics
+    for font in ['Arial Black', 'Pretendard']:
+        assert not text_metrics.has_font_metrics(font), font
+
+def test_text_width_px_uses_glyph_advances():
+    # Arial advances (per 1000 em): S=667 q=556 u=556 a=556 d=556; Hangul uses the wide advance (892)
+    assert abs(text_metrics.text_width_px('Squad', 'Arial', 10) - 28.91) < 1e-6
+    assert abs(text_metrics.text_width_px('회원', 'Arial Bold', 13) - 2 * 0.892 * 13) < 1e-6
+    assert text_metrics.text_width_px('Squad', 'Arial Bold', 10) > text_metrics.text_width_px('Squad', 'Arial', 10)
+
+    series = pd.Series(SAMPLES)
+    expected = [text_metrics.text_width_px(t, 'Arial Bold', 13) for t in SAMPLES]
+    assert np.allclose(text_metrics.text_widths_px(series, 'Arial Bold', 13), expected)
+
+def test_wrap_label_breaks_at_spaces_within_max_px():
+    label = '커머스 플랫폼 개발 스쿼드 Platform Engineering'
+    lines = text_metrics.wrap_label(label, 120, 'Arial Bold', 13).split('<br>')
+
+    assert ' '.join(lines) == label
+    assert all(text_metrics.text_width_px(line, 'Arial Bold', 13) <= 120 for line in lines)
+    # A single word wider than the line is split between characters
+    long_word = text_metrics.wrap_label('가' * 20, 60, 'Arial Bold', 13).split('<br>')
+    assert ''.join(long_word) == '가' * 20 and all(len(line) == 5 for line in long_word)  # 5 x 11.6 px
@@ -0,0 +1,193 @@
+## 텍스트 폭 계산 (라벨 폭 추정, 픽셀 기준 줄바꿈) 관련 로직은 이 파일에서 중앙 관리
+
+from functools import lru_cache
+import json
+import os
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+WIDE_CLASSES = ('F', 'W', 'A')  # East Asian Width classes counted as 2 units (Hangul, CJK, fullwidth, ambiguous)
+BMP_SIZE = 0x10000
+
+# Glyph advance tables (see build_font_metrics.py): ASCII advances per font, `wide` for Hangul/CJK, `default` otherwise
+FONT_METRICS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'font_metrics.json')
+
+# Pixel estimates per character for wrap_text_by_pixels (multiples of font_size)
+# Arial Black is very wide, so we use conservative multipliers
+WIDE_PX_RATIO = 2.2
+NARROW_PX_RATIO = 1.2
+
+
+@lru_cache(maxsize=1)
+def _width_table():
+    """Visual width (1 or 2) for every BMP code point; ASCII, Hangul and CJK all resolve by index."""
+    return np.fromiter(
+        (2 if unicodedata.east_asian_width(chr(c)) in WIDE_CLASSES else 1 for c in range(BMP_SIZE)),
+        dtype=np.uint8, count=BMP_SIZE
+    )
+
+
+def _char_width(char):
+    code = ord(char)
+    if code < BMP_SIZE:
+        return int(_width_table()[code])
+    return 2 if unicodedata.east_asian_width(char) in WIDE_CLASSES else 1
+
+
+@lru_cache(maxsize=8192)
+def visual_width(text):
+    """Visual width of text: East Asian Width 'W', 'F', 'A' count as 2, others as 1."""
+    text = str(text)
+    if text.isascii():
+        return len(text)
+    return sum(_char_width(c) for c in text)
+
+
+def _per_value_sums(series, table, fallback):
+    """
+    Sum of table[code point] over the characters of every value of a Series (values formatted with str()).
+    Each distinct value is measured once: all of them are encoded into one code point array and
+    reduced per value; code points outside the BMP use fallback(char).
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    texts = [str(v) for v in uniques]
+    if not texts:
+        return pd.Series(np.zeros(len(series), dtype=table.dtype), index=series.index)
+
+    points = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32)
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+
+    values = np.empty(len(points), dtype=table.dtype)
+    in_bmp = points < BMP_SIZE
+    values[in_bmp] = table[points[in_bmp]]
+    values[~in_bmp] = [fallback(chr(p)) for p in points[~in_bmp].tolist()]
+
+    # Per-value sums (empty strings have no code points)
+    totals = np.zeros(len(texts), dtype=table.dtype)
+    nonempty = lengths > 0
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    totals[nonempty] = np.add.reduceat(values, offsets[nonempty]) if len(values) else 0
+    return pd.Series(totals[codes], index=series.index)
+
+
+def visual_widths(series):
+    """visual_width for every value of a Series (values are formatted with str(), like .astype(str))."""
+    return _per_value_sums(series, _width_table().astype(np.int64), _char_width)
+
+
+# -----------------------------------------------------------------------------
+# Font-metric layout (glyph advances for the fonts used in the Gantt panels/badges)
+# -----------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def _font_metrics():
+    with open(FONT_METRICS_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def has_font_metrics(font):
+    """
+    True if `font` has a measured table: ASCII and Hangul/CJK (`wide`) advances both taken from font files
+    by build_font_metrics.py. Layout code uses the visual-width heuristics for other fonts.
+    """
+    entry = _font_metrics()['fonts'].get(font)
+    return bool(entry and entry.get('measured'))
+
+
+@lru_cache(maxsize=None)
+def _advance_table(font):
+    """Advance (per em) of every BMP code point in `font`: ASCII from the table, wide/default otherwise."""
+    metrics = _font_metrics()
+    entry = metrics['fonts'][font]
+    units = float(metrics['units_per_em'])
+    table = np.where(_width_table() == 2, entry['wide'], entry['default']).astype(np.float64) / units
+    start = metrics['ascii_start']
+    table[:start] = 0  # Control characters
+    table[start:start + len(entry['ascii'])] = np.asarray(entry['ascii'], dtype=np.float64) / units
+    return table
+
+
+def _char_advance(char, font):
+    code = ord(char)
+    if code < BMP_SIZE:
+        return float(_advance_table(font)[code])
+    entry = _font_metrics()['fonts'][font]
+    return (entry['wide'] if _char_width(char) == 2 else entry['default']) / float(_font_metrics()['units_per_em'])
+
+
+@lru_cache(maxsize=8192)
+def text_width_px(text, font='Arial', font_size=12):
+    """Rendered width of a single line of text in px (font: a key of assets/font_metrics.json)."""
+    return sum(_char_advance(c, font) for c in str(text)) * font_size
+
+
+def text_widths_px(series, font='Arial', font_size=12):
+    """text_width_px for every value of a Series (values formatted with str())."""
+    return _per_value_sums(series, _advance_table(font), lambda c: _char_advance(c, font)) * font_size
+
+
+@lru_cache(maxsize=4096)
+def wrap_label(text, max_px, font='Arial', font_size=12):
+    """
+    Breaks a label into lines no wider than max_px (joined with <br>), using the font's glyph advances.
+    Breaks at spaces where possible; words wider than a line are split between characters.
+    """
+    if not text: return ""
+
+    lines = []
+    line = ''
+    for word in str(text).split():
+        candidate = f"{line} {word}" if line else word
+        if text_width_px(candidate, font, font_size) <= max_px:
+            line = candidate
+            continue
+        if line:
+            lines.append(line)
+
+        # Longest prefixes that fit (at least one character per line)
+        while text_width_px(word, font, font_size) > max_px and len(word) > 1:
+            advances = np.cumsum([_char_advance(c, font) * font_size for c in word])
+            cut = max(1, int(np.searchsorted(advances, max_px, side='right')))
+            lines.append(word[:cut])
+            word = word[cut:]
+        line = word
+
+    if line:
+        lines.append(line)
+    return "<br>".join(lines)
+
+
+@lru_cache(maxsize=4096)
+def wrap_text_by_pixels(text, max_px, font_size=12):
+    """
+    Wraps text ensuring each line does not exceed max_px (lines joined with <br>).
+    Assumes wide chars (Korean/CJK) take WIDE_PX_RATIO * font_size and narrow ones NARROW_PX_RATIO * font_size.
+    """
+    if not text: return ""
+
+    px_wide = int(font_size * WIDE_PX_RATIO)
+    px_narrow = int(font_size * NARROW_PX_RATIO)
+
+    lines = []
+    current_line = []
+    current_px = 0
+    for char in str(text):
+        char_px = px_wide if _char_width(char) == 2 else px_narrow
+
+        # Check if adding char exceeds max_px
+        if current_px + char_px > max_px:
+            # Push current line and start new
+            if current_line:
+                lines.append("".join(current_line))
+            current_line = [char]
+            current_px = char_px
+        else:
+            current_line.append(char)
+            current_px += char_px
+
+    if current_line:
+        lines.append("".join(current_line))
+
+    return "<br>".join(lines)
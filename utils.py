@@ -5,6 +5,8 @@ import os
 import unicodedata
 from datetime import datetime, timedelta
 
+import text_metrics
+
 # -----------------------------------------------------------------------------
 # 상수 및 스타일 정의
 # -----------------------------------------------------------------------------
@@ -75,6 +77,22 @@ DEFAULT_STATUS_COLOR = '#888888'
 # 헬퍼 함수 정의
 # -----------------------------------------------------------------------------
 
+def enable_copy_on_write():
+    """Turns on pandas Copy-on-Write at app startup (always on from pandas 3.0, where the option is deprecated)."""
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
+def copy_on_write_enabled():
+    return int(pd.__version__.split('.')[0]) >= 3 or bool(pd.get_option('mode.copy_on_write'))
+
+def shallow_copy(obj):
+    """
+    Copy of obj for callers that then write to it. With Copy-on-Write (see enable_copy_on_write) this is
+    obj.copy(deep=False), which shares the data until a write; without it (pandas < 3 outside the app,
+    e.g. scripts and tests) a full copy, so writes never reach obj either way.
+    """
+    return obj.copy(deep=not copy_on_write_enabled())
+
 def get_status_color(status):
     """상태에 따른 색상을 반환 (동적 처리)"""
     if status in STATUS_COLORS:
@@ -85,56 +103,20 @@ def get_status_color(status):
 def get_visual_width(text):
     """
     Calculate visual width of text.
-    East Asian Width 'W', 'F', 'A' count as 2, others as 1.
+    East Asian Width 'W', 'F', 'A' count as 2, others as 1. (width table + cache in text_metrics)
     """
-    width = 0
-    for char in str(text):
-        if unicodedata.east_asian_width(char) in ['F', 'W', 'A']:
-            width += 2
-        else:
-            width += 1
-    return width
+    return text_metrics.visual_width(str(text))
 
 def wrap_text_by_pixels(text, max_px, font_size=12):
     """
     Wraps text ensuring each line does not exceed max_px.
     Assumes:
-    - Wide char (Korean/CJK): ~1.8 * font_size (Safe for Arial Black/Bold)
-    - Narrow char (English/Num): ~0.95 * font_size
+    - Wide char (Korean/CJK): ~2.2 * font_size (Safe for Arial Black/Bold)
+    - Narrow char (English/Num): ~1.2 * font_size
+    Results are memoized per (text, max_px, font_size) in text_metrics.
     """
     if not text: return ""
-    
-    str_text = str(text)
-    lines = []
-    current_line = []
-    current_px = 0
-    
-    # Constants for pixel estimation (Dynamic based on font size)
-    # Arial Black is very wide, so we use conservative multipliers
-    # INCREASED multipliers to force wrapping (V4 fix was insufficient)
-    PX_WIDE = int(font_size * 2.2)   
-    PX_NARROW = int(font_size * 1.2) 
-    
-    for char in str_text:
-        # Determine char width
-        is_wide = unicodedata.east_asian_width(char) in ['F', 'W', 'A']
-        char_px = PX_WIDE if is_wide else PX_NARROW
-        
-        # Check if adding char exceeds max_px
-        if current_px + char_px > max_px:
-            # Push current line and start new
-            if current_line:
-                lines.append("".join(current_line))
-            current_line = [char]
-            current_px = char_px
-        else:
-            current_line.append(char)
-            current_px += char_px
-            
-    if current_line:
-        lines.append("".join(current_line))
-        
-    return "<br>".join(lines)
+    return text_metrics.wrap_text_by_pixels(str(text), max_px, font_size)
 
 def wrap_text_html(text, width=40):
     if not text: return ""
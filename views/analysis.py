@@ -1,14 +1,14 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from logic import calculate_workload, predict_start_date, identify_issues, calculate_utilization_metrics
+from logic import update_utilization_metrics
+from precompute import issues_table, utilization_metrics, utilization_timeline, start_date_predictions
 from gsheet_handler import save_snapshot
-import textwrap
+from scenario import ScenarioEngine, SCENARIO_ACTIONS, describe_edit
 import utils
 from datetime import datetime
 
-def render_analysis_report(df: pd.DataFrame, raw_df: pd.DataFrame, sheet_id: str, worksheet_name: str, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None):
+def render_analysis_report(df: pd.DataFrame, raw_df: pd.DataFrame, sheet_id: str, worksheet_name: str, df_resource: pd.DataFrame = None, df_weights: pd.DataFrame = None, row_keys: pd.DataFrame = None):
     if 'last_sync_time' not in st.session_state:
         st.session_state.last_sync_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -42,8 +42,8 @@ def render_analysis_report(df: pd.DataFrame, raw_df: pd.DataFrame, sheet_id: str
         </p>
     </div>
     """, unsafe_allow_html=True)
-    # identify_issues is imported at the top.
-    issues = identify_issues(df)
+    # Cached identify_issues (usually warmed by precompute before the page is opened)
+    issues = issues_table(df)
     
     if not issues.empty:
         # [User Request] Add icons to Status column
@@ -75,8 +75,15 @@ def render_analysis_report(df: pd.DataFrame, raw_df: pd.DataFrame, sheet_id: str
     
     st.subheader("📈 스쿼드별 업무 로드 및 리소스 분석")
     
-    # Calculate Utilization Metrics
-    metrics_df = calculate_utilization_metrics(df, df_resource, df_weights)
+    # Calculate Utilization Metrics (only squads whose rows changed since the last run are recomputed)
+    previous_state = st.session_state.get('utilization_state')
+    if previous_state is None:
+        # First run: full calculation, usually warmed by precompute
+        metrics_df, st.session_state['utilization_state'] = utilization_metrics(df, df_resource, df_weights, row_keys)
+    else:
+        metrics_df, st.session_state['utilization_state'] = update_utilization_metrics(
+            df, df_resource, df_weights, row_keys, previous_state
+        )
     
     if not metrics_df.empty:
         # 1. Formula Explanation (Detailed Box)
@@ -169,164 +176,68 @@ def render_analysis_report(df: pd.DataFrame, raw_df: pd.DataFrame, sheet_id: str
         else:
             score_help_text += "\n(데이터 없음)"
             
-        # Create 2 columns for Master-Detail view (Right side wider per request)
-        col1, col2 = st.columns([0.8, 1.2])
-        
-        with col1:
-            st.markdown("###### 👈 스쿼드를 선택하여 상세 과제를 확인하세요")
-            
-            # Interactive Dataframe with st.dataframe using style mapping
-            styled_df = metrics_df[display_cols].style
-            
-            selection = st.dataframe(
-                styled_df,
-                column_config={
-                    "Squad": st.column_config.TextColumn("스쿼드", disabled=True),
-                    "Head_Min": st.column_config.TextColumn(
-                        "보유/최소(Head/Min)", 
-                        help="스쿼드의 보유 인원과 과제 1개를 수행하는 데 필요한 최소 투입 인원"
-                    ),
-                    "Capacity_Score": st.column_config.NumberColumn(
-                        "Capacity", 
-                        format="%.1f",
-                        help="스쿼드에서 공급가능한 과제 리소스\n(스쿼드 보유 인원 ÷ 최소 투입 인원) × 5.0 × 0.8"
-                    ),
-                    "Total_Load_Score": st.column_config.NumberColumn(
-                        "Total Load", 
-                        format="%.1f",
-                        help=score_help_text
-                    )
-                },
-                hide_index=True,
-                use_container_width=True,
-                on_select="rerun",
-                selection_mode="single-row"
-            )
-
-        with col2:
-            if selection and selection.selection.rows:
-                selected_index = selection.selection.rows[0]
-                selected_squad = metrics_df.iloc[selected_index]['Squad']
-                
-                st.markdown(f"###### 📌 {selected_squad} - 진행중 과제 목록")
-                
-                # Filter Active Tasks for selected squad
-                task_mask = (
-                    (df['Squad'] == selected_squad) &
-                    (df['Status'] == '진행 중')
-                )
-                
-                active_tasks_df = df[task_mask].copy()
-                
-                if not active_tasks_df.empty:
-                    # Sort by End date for relevance
-                    active_tasks_df = active_tasks_df.sort_values(by='End', na_position='last')
-                    
-                    # Ensure 'Priority per squad' exists
-                    if 'Priority per squad' not in active_tasks_df.columns:
-                        active_tasks_df['Priority per squad'] = ""
-                    else:
-                        active_tasks_df['Priority per squad'] = active_tasks_df['Priority per squad'].astype(object).fillna("")
-                        
-                    st.caption("💡 **'우선순위'** 열의 데이터만 더블 클릭하여 수정할 수 있습니다. (숫자 및 텍스트 입력 가능)")
-                    
-                    edited_df = st.data_editor(
-                        active_tasks_df[['Priority per squad', 'Task', 'Biz_impact', 'Type', 'Status', 'End']],
-                        key=f"priority_editor_{selected_squad}",
-                        column_config={
-                            "Priority per squad": st.column_config.TextColumn(
-                                "우선순위",
-                                help="스쿼드 내 과제 우선순위 (숫자 또는 텍스트 입력 가능)"
-                            ),
-                            "Task": st.column_config.TextColumn("과제명", disabled=True),
-                            "Biz_impact": st.column_config.TextColumn("비즈니스 임팩트 (Biz Impact)", disabled=True),
-                            "Type": st.column_config.TextColumn("Type", disabled=True),
-                            "Status": st.column_config.TextColumn("상태", disabled=True),
-                            "End": st.column_config.DateColumn("종료일", format="YYYY-MM-DD", disabled=True)
-                        },
-                        hide_index=True,
-                        use_container_width=True,
-                        num_rows="fixed"
-                    )
-                    
-                    submit_col_time, submit_col_refresh, submit_col_save = st.columns([0.65, 0.15, 0.2])
-                    with submit_col_time:
-                        st.markdown(f"<div style='text-align: right; padding-top: 5px; color: #888; font-size: 0.85em;'>최근 동기화: {st.session_state.last_sync_time}</div>", unsafe_allow_html=True)
-                    with submit_col_refresh:
-                        refresh_button = st.button("🔄 새로고침", use_container_width=True, key=f"refresh_btn_{selected_squad}")
-                    with submit_col_save:
-                        submit_button = st.button("저장하기", type="primary", use_container_width=True, key=f"save_btn_{selected_squad}")
-                        
-                    if refresh_button:
-                        st.cache_data.clear()
-                        st.session_state.last_sync_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        st.rerun()
-                        
-                    if submit_button:
-                            # 1) Get the original full dataframe
-                            if raw_df is not None and sheet_id:
-                                with st.spinner("데이터 저장 중..."):
-                                    # Create a copy to modify
-                                    updated_raw_df = raw_df.copy()
-                                    
-                                    # Ensure column exists in raw_df
-                                    if 'Priority per squad' not in updated_raw_df.columns:
-                                        updated_raw_df['Priority per squad'] = None
-                                        
-                                    # Sync changes back to raw_df
-                                    # edited_df has the same index as active_tasks_df, which has same index as df
-                                    # But raw_df may have different index if df was filtered/sorted
-                                    # Match by 'Task' name to be safe since Task should be unique enough,
-                                    # or we could match by multiple columns. We'll use Task.
-                                    
-                                    for idx, row in edited_df.iterrows():
-                                        task_name = row['Task']
-                                        new_priority = row['Priority per squad']
-                                        
-                                        if pd.notna(new_priority):
-                                            # Find matching row in raw_df based on Task name
-                                            match_idx = updated_raw_df[updated_raw_df['Task'] == task_name].index
-                                            if not match_idx.empty:
-                                                updated_raw_df.loc[match_idx, 'Priority per squad'] = new_priority
-                                    
-                                    # Save to GSheet
-                                    success = save_snapshot(sheet_id, updated_raw_df, worksheet_name)
-                                    if success:
-                                        st.success("우선순위가 성공적으로 저장되었습니다!")
-                                        st.rerun()
-                                    else:
-                                        st.error("저장에 실패했습니다. GSheet 연결 상태를 확인해주세요.")
-                            else:
-                                st.warning("원본 데이터를 찾을 수 없어 저장할 수 없습니다.")
-                else:
-                    st.info("해당 스쿼드에 진행 중인 과제가 없습니다.")
-            else:
-                st.info("👈 좌측 표에서 스쿼드를 선택하면 진행중인 과제 목록이 여기에 표시됩니다.")
+        # Master-Detail view reruns on its own (row selection, priority edits)
+        _squad_detail_panel(df, metrics_df, display_cols, score_help_text, raw_df, sheet_id, worksheet_name)
     else:
         st.info("데이터가 없습니다.")
 
     st.divider()
 
+    # 3-1. Weekly Overload Outlook (sweep-line timeline from today to the roadmap end)
+    st.subheader("📆 주간 리소스 과부하 전망")
+
+    timeline_df = utilization_timeline(df, df_resource, df_weights, freq='W', start_date=datetime.now().date())
+
+    if not timeline_df.empty:
+        has_capacity = df_resource is not None and not df_resource.empty
+        value_col = 'Shortage' if has_capacity else 'Load_Score'
+        heat_df = timeline_df.pivot(index='Squad', columns='Period', values=value_col)
+        if 'Shortage' in metrics_df.columns:
+            # Keep the same squad order as the chart above (Shortage descending)
+            heat_df = heat_df.reindex([s for s in metrics_df['Squad'] if s in heat_df.index])
+
+        heat_fig = go.Figure(go.Heatmap(
+            z=heat_df.to_numpy(),
+            x=heat_df.columns,
+            y=heat_df.index.astype(str),
+            colorscale='RdBu_r' if has_capacity else 'Reds',
+            zmid=0 if has_capacity else None,
+            colorbar=dict(title='부족 인원' if has_capacity else 'Load'),
+            hovertemplate="<b>%{y}</b><br>주차: %{x|%Y-%m-%d}<br>" + ('부족 인원: %{z:.1f}명' if has_capacity else 'Load Score: %{z:.1f}') + "<extra></extra>"
+        ))
+        heat_fig.update_layout(
+            height=max(300, len(heat_df) * 28 + 120),
+            xaxis=dict(type='date', tickformat='%Y-%m-%d'),
+            yaxis=dict(autorange='reversed'),
+            margin=dict(t=30, l=10, r=10, b=30)
+        )
+        st.plotly_chart(heat_fig, use_container_width=True)
+        if has_capacity:
+            st.caption("※ 주차별 최대 부하일 기준 부족 인원입니다. (빨간색: 공급 대비 수요 초과 주간)")
+        else:
+            st.caption("※ 리소스 데이터가 없어 주차별 최대 Total Load만 표시합니다.")
+    else:
+        st.info("전망을 계산할 일정 데이터가 없습니다.")
+
+    st.divider()
+
     # 4. Shortest Start Date Prediction (Moved below Detailed Data)
     st.subheader("📅 스쿼드별 최단 시작 가능일 예측")
     
-    squads = df['Squad'].unique()
-    # Filter '미정', '공통' again if inconsistent, but df implies full data. logic.py filters metrics_df only.
-    # We should respect the filter for this view too.
-    filtered_squads = [s for s in squads if s not in ['미정', '공통']]
-    
-    # We need to ensure logic.predict_start_date is available. It is imported at the top.
-    
-    prediction_data = []
-    for squad in filtered_squads:
-        pred_date = predict_start_date(df, squad)
-        prediction_data.append({
-            "Squad": squad,
-            "Possible Start Date": pred_date
-        })
+    has_resource = df_resource is not None and not df_resource.empty
+    capacity_aware = st.toggle(
+        "리소스 기반 예측",
+        value=False,
+        disabled=not has_resource,
+        help="보유 인원/최소 투입 인원 기준 공급(Capacity)보다 진행 과제 부하가 처음으로 낮아지는 날을 시작 가능일로 계산합니다."
+    )
+
+    # Single groupby pass for every squad (optionally capacity-aware)
+    all_pred_df = start_date_predictions(df, df_resource, df_weights, capacity_aware=capacity_aware and has_resource)
+    # logic.py filters '미정', '공통' from metrics_df only; respect the same filter here.
+    pred_df = all_pred_df[~all_pred_df['Squad'].isin(['미정', '공통'])]
     
-    if prediction_data:
-        pred_df = pd.DataFrame(prediction_data)
+    if not pred_df.empty:
         # Sort by date for better visibility
         pred_df = pred_df.sort_values(by="Possible Start Date")
         
@@ -342,13 +253,245 @@ def render_analysis_report(df: pd.DataFrame, raw_df: pd.DataFrame, sheet_id: str
             hide_index=True,
             use_container_width=True
         )
-        st.caption("※ 각 스쿼드의 현재 진행 중인 마지막 과제 종료일 다음 날을 기준으로 계산됩니다.")
+        if capacity_aware and has_resource:
+            st.caption("※ 오늘 이후 스쿼드의 진행 과제 부하가 공급(Capacity)보다 처음으로 낮아지는 날을 기준으로 계산됩니다.")
+        else:
+            st.caption("※ 각 스쿼드의 현재 진행 중인 마지막 과제 종료일 다음 날을 기준으로 계산됩니다.")
     else:
         st.info("예측 가능한 스쿼드 데이터가 없습니다.")
 
 
+    st.divider()
+
+    # 5. Swap / What-if Scenarios
+    st.subheader("🔀 스왑 시나리오 (What-if)")
+    st.caption("과제 이동·일정 변경·과제 제외·인원 변경을 가정했을 때 영향받는 스쿼드의 부하, 부족 인원, 시작 가능일 변화를 계산합니다. (원본 데이터는 변경되지 않습니다)")
+
+    if df.empty:
+        st.info("시나리오를 구성할 과제가 없습니다.")
+        return
+
+    if 'scenario_edits' not in st.session_state:
+        st.session_state.scenario_edits = []
+
+    # Base results are reused; each scenario only recomputes the squads it touches
+    engine = ScenarioEngine(
+        df, df_resource, df_weights,
+        capacity_aware=capacity_aware and has_resource,
+        base_metrics=metrics_df.drop(columns=['Head_Min'], errors='ignore'),
+        base_predictions=all_pred_df
+    )
+
+    squad_options = sorted(df['Squad'].dropna().astype(str).unique().tolist())
+    action_options = [a for a in SCENARIO_ACTIONS if a != 'headcount' or has_resource]
 
-# Mock for logic that wasn't fully defined in previous step or needs import fix
-# logic.py didn't include start_swap_scenario, so removing import or fixing usage.
-# Fixed usage above by implementing simple list instead of complex swap logic function if not exists.
-# Wait, I didn't define start_swap_scenario in logic.py. I'll stick to logic implemented in tab3.
+    c_action, c_target, c_value, c_add = st.columns([0.2, 0.4, 0.25, 0.15])
+    with c_action:
+        action = st.selectbox("시나리오 유형", action_options, format_func=lambda a: SCENARIO_ACTIONS[a], key="scenario_action")
+
+    edit = None
+    if action == 'headcount':
+        with c_target:
+            target_squad = st.selectbox("스쿼드", squad_options, key="scenario_squad")
+        with c_value:
+            current = 0.0
+            if target_squad in df_resource['Squad'].values:
+                current = float(df_resource.loc[df_resource['Squad'] == target_squad, 'Headcount'].iloc[0])
+            new_headcount = st.number_input("보유 인원", min_value=0.0, value=current, step=1.0, key="scenario_headcount")
+        edit = {'action': 'headcount', 'squad': target_squad, 'headcount': new_headcount}
+    else:
+        with c_target:
+            task_label = st.selectbox(
+                "과제", list(df.index),
+                format_func=lambda i: f"[{df.at[i, 'Squad']}] {df.at[i, 'Task']}",
+                key="scenario_task"
+            )
+        with c_value:
+            if action == 'move':
+                to_squad = st.selectbox("이동할 스쿼드", squad_options, key="scenario_to_squad")
+                edit = {'action': 'move', 'task': task_label, 'squad': to_squad}
+            elif action == 'shift':
+                days = st.number_input("이동 일수 (+/-)", value=14, step=7, key="scenario_days")
+                edit = {'action': 'shift', 'task': task_label, 'days': int(days)}
+            else:
+                edit = {'action': 'drop', 'task': task_label}
+
+    with c_add:
+        st.markdown("<div style='margin-top: 28px;'></div>", unsafe_allow_html=True)
+        if st.button("➕ 추가", use_container_width=True, key="scenario_add"):
+            st.session_state.scenario_edits.append(edit)
+
+    edits = st.session_state.scenario_edits
+    if edits:
+        c_list, c_reset = st.columns([0.85, 0.15])
+        with c_list:
+            st.markdown("<br>".join(describe_edit(e, df) for e in edits), unsafe_allow_html=True)
+        with c_reset:
+            if st.button("초기화", use_container_width=True, key="scenario_reset"):
+                st.session_state.scenario_edits = []
+                st.rerun()
+
+        comparison = engine.compare(edits)
+        if comparison.empty:
+            st.info("현재 데이터에 해당하는 과제가 없어 시나리오를 적용할 수 없습니다.")
+        else:
+            st.dataframe(
+                comparison,
+                column_config={
+                    "Squad": st.column_config.TextColumn("스쿼드"),
+                    "Capacity_Score_Before": st.column_config.NumberColumn("Capacity (현재)", format="%.1f"),
+                    "Total_Load_Score_Before": st.column_config.NumberColumn("Total Load (현재)", format="%.1f"),
+                    "Shortage_Before": st.column_config.NumberColumn("부족 인원 (현재)", format="%.1f"),
+                    "Possible Start Date_Before": st.column_config.DateColumn("시작 가능일 (현재)", format="YYYY-MM-DD"),
+                    "Capacity_Score_After": st.column_config.NumberColumn("Capacity (시나리오)", format="%.1f"),
+                    "Total_Load_Score_After": st.column_config.NumberColumn("Total Load (시나리오)", format="%.1f"),
+                    "Shortage_After": st.column_config.NumberColumn("부족 인원 (시나리오)", format="%.1f"),
+                    "Possible Start Date_After": st.column_config.DateColumn("시작 가능일 (시나리오)", format="YYYY-MM-DD"),
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+    else:
+        st.info("시나리오 항목을 추가하면 영향받는 스쿼드의 변화가 여기에 표시됩니다.")
+
+
+@st.fragment
+def _squad_detail_panel(df: pd.DataFrame, metrics_df: pd.DataFrame, display_cols, score_help_text: str,
+                        raw_df: pd.DataFrame, sheet_id: str, worksheet_name: str):
+    """
+    Squad table (select a row) + the squad's in-progress tasks with an editable priority column.
+    Selecting a squad or editing a cell reruns only this fragment; refresh/save rerun the app (the data changed).
+    """
+    # Create 2 columns for Master-Detail view (Right side wider per request)
+    col1, col2 = st.columns([0.8, 1.2])
+    
+    with col1:
+        st.markdown("###### 👈 스쿼드를 선택하여 상세 과제를 확인하세요")
+        
+        # Interactive Dataframe with st.dataframe using style mapping
+        styled_df = metrics_df[display_cols].style
+        
+        selection = st.dataframe(
+            styled_df,
+            column_config={
+                "Squad": st.column_config.TextColumn("스쿼드", disabled=True),
+                "Head_Min": st.column_config.TextColumn(
+                    "보유/최소(Head/Min)", 
+                    help="스쿼드의 보유 인원과 과제 1개를 수행하는 데 필요한 최소 투입 인원"
+                ),
+                "Capacity_Score": st.column_config.NumberColumn(
+                    "Capacity", 
+                    format="%.1f",
+                    help="스쿼드에서 공급가능한 과제 리소스\n(스쿼드 보유 인원 ÷ 최소 투입 인원) × 5.0 × 0.8"
+                ),
+                "Total_Load_Score": st.column_config.NumberColumn(
+                    "Total Load", 
+                    format="%.1f",
+                    help=score_help_text
+                )
+            },
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row"
+        )
+
+    with col2:
+        if selection and selection.selection.rows:
+            selected_index = selection.selection.rows[0]
+            selected_squad = metrics_df.iloc[selected_index]['Squad']
+            
+            st.markdown(f"###### 📌 {selected_squad} - 진행중 과제 목록")
+            
+            # Filter Active Tasks for selected squad
+            task_mask = (
+                (df['Squad'] == selected_squad) &
+                (df['Status'] == '진행 중')
+            )
+            
+            active_tasks_df = df[task_mask]
+            
+            if not active_tasks_df.empty:
+                # Sort by End date for relevance
+                active_tasks_df = active_tasks_df.sort_values(by='End', na_position='last')
+                
+                # Ensure 'Priority per squad' exists
+                if 'Priority per squad' not in active_tasks_df.columns:
+                    active_tasks_df['Priority per squad'] = ""
+                else:
+                    active_tasks_df['Priority per squad'] = active_tasks_df['Priority per squad'].astype(object).fillna("")
+                    
+                st.caption("💡 **'우선순위'** 열의 데이터만 더블 클릭하여 수정할 수 있습니다. (숫자 및 텍스트 입력 가능)")
+                
+                edited_df = st.data_editor(
+                    active_tasks_df[['Priority per squad', 'Task', 'Biz_impact', 'Type', 'Status', 'End']],
+                    key=f"priority_editor_{selected_squad}",
+                    column_config={
+                        "Priority per squad": st.column_config.TextColumn(
+                            "우선순위",
+                            help="스쿼드 내 과제 우선순위 (숫자 또는 텍스트 입력 가능)"
+                        ),
+                        "Task": st.column_config.TextColumn("과제명", disabled=True),
+                        "Biz_impact": st.column_config.TextColumn("비즈니스 임팩트 (Biz Impact)", disabled=True),
+                        "Type": st.column_config.TextColumn("Type", disabled=True),
+                        "Status": st.column_config.TextColumn("상태", disabled=True),
+                        "End": st.column_config.DateColumn("종료일", format="YYYY-MM-DD", disabled=True)
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    num_rows="fixed"
+                )
+                
+                submit_col_time, submit_col_refresh, submit_col_save = st.columns([0.65, 0.15, 0.2])
+                with submit_col_time:
+                    st.markdown(f"<div style='text-align: right; padding-top: 5px; color: #888; font-size: 0.85em;'>최근 동기화: {st.session_state.last_sync_time}</div>", unsafe_allow_html=True)
+                with submit_col_refresh:
+                    refresh_button = st.button("🔄 새로고침", use_container_width=True, key=f"refresh_btn_{selected_squad}")
+                with submit_col_save:
+                    submit_button = st.button("저장하기", type="primary", use_container_width=True, key=f"save_btn_{selected_squad}")
+                    
+                if refresh_button:
+                    st.cache_data.clear()
+                    st.session_state.last_sync_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    st.rerun()
+                    
+                if submit_button:
+                        # 1) Get the original full dataframe
+                        if raw_df is not None and sheet_id:
+                            with st.spinner("데이터 저장 중..."):
+                                # Create a copy to modify
+                                updated_raw_df = utils.shallow_copy(raw_df)
+                                
+                                # Ensure column exists in raw_df
+                                if 'Priority per squad' not in updated_raw_df.columns:
+                                    updated_raw_df['Priority per squad'] = None
+                                    
+                                # Sync changes back to raw_df
+                                # edited_df has the same index as active_tasks_df, which has same index as df
+                                # But raw_df may have different index if df was filtered/sorted
+                                # Match by 'Task' name to be safe since Task should be unique enough,
+                                # or we could match by multiple columns. We'll use Task.
+                                
+                                for idx, row in edited_df.iterrows():
+                                    task_name = row['Task']
+                                    new_priority = row['Priority per squad']
+                                    
+                                    if pd.notna(new_priority):
+                                        # Find matching row in raw_df based on Task name
+                                        match_idx = updated_raw_df[updated_raw_df['Task'] == task_name].index
+                                        if not match_idx.empty:
+                                            updated_raw_df.loc[match_idx, 'Priority per squad'] = new_priority
+                                
+                                # Save to GSheet
+                                success = save_snapshot(sheet_id, updated_raw_df, worksheet_name)
+                                if success:
+                                    st.success("우선순위가 성공적으로 저장되었습니다!")
+                                    st.rerun()
+                                else:
+                                    st.error("저장에 실패했습니다. GSheet 연결 상태를 확인해주세요.")
+                        else:
+                            st.warning("원본 데이터를 찾을 수 없어 저장할 수 없습니다.")
+            else:
+                st.info("해당 스쿼드에 진행 중인 과제가 없습니다.")
+        else:
+            st.info("👈 좌측 표에서 스쿼드를 선택하면 진행중인 과제 목록이 여기에 표시됩니다.")
@@ -32,6 +32,13 @@ def render_data_ops(df: pd.DataFrame, sheet_url_or_id, worksheet_name):
         """)
     
     
+    # Edits rerun only the editor fragment; refresh/save rerun the app
+    _data_editor(df, sheet_url_or_id, worksheet_name)
+
+
+@st.fragment
+def _data_editor(df: pd.DataFrame, sheet_url_or_id, worksheet_name):
+    """Full-sheet data editor with refresh/save (cell edits rerun only this fragment)."""
     # Initialize session state for data editor key if not exists
     if "data_ops_key" not in st.session_state:
         st.session_state.data_ops_key = 0
@@ -46,7 +53,7 @@ def render_data_ops(df: pd.DataFrame, sheet_url_or_id, worksheet_name):
     # Use dynamic key to allow resetting state
     editor_key = f"data_editor_{st.session_state.data_ops_key}"
     edited_df = st.data_editor(df, num_rows="dynamic", use_container_width=True, key=editor_key)
-    
+
     if st.button("변경 사항 저장 (Save Snapshot)", type="primary"):
         with st.spinner("저장 중..."):
             success = save_snapshot(sheet_url_or_id, edited_df, worksheet_name)
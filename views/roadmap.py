@@ -1,21 +1,386 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import textwrap
 import sys
 import os
 import unicodedata
+import zlib
 
 # Add parent directory to path to allow importing utils if needed (though usually streamlit handles root)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import utils
+import text_metrics
+from bounded_cache import bounded_cache
+from views.search_box import debounced_search
 
-@st.cache_data(ttl=3600, show_spinner="차트를 생성 중입니다...")
-def create_professional_gantt(df, group_col='Squad'):
-    """Gantt 차트 생성 로직"""
-    df_plot = df.copy()
+MS_PER_DAY = 24 * 60 * 60 * 1000
+
+# Adaptive time scale (see time_scale): the timeline width stays within a pixel budget
+PX_PER_DAY = 5               # Preferred density while the timeline fits the budget
+TIMELINE_MIN_PX = 900        # Short roadmaps are stretched to at least this width
+TIMELINE_MAX_PX = 4800       # Long roadmaps (or far-out outliers) are compressed to at most this width
+TIMELINE_PAD_RATIO = 0.05    # Breathing room after the last End, as a share of the span (3-90 days)
+MIN_TICK_PX = 100            # Axis uses the finest unit whose ticks are at least this far apart
+# (resolution, days per unit, plotly dtick, tick format), finest first
+TIME_UNITS = [
+    ('day', 1, MS_PER_DAY, '%m-%d'),
+    ('week', 7, 7 * MS_PER_DAY, '%m-%d'),
+    ('month', 30.44, 'M1', '%Y-%m'),
+    ('quarter', 91.31, 'M3', '%Y-%m'),
+    ('year', 365.25, 'M12', '%Y'),
+]
+
+# Level-of-detail: above these sizes the roadmap opens as a per-group summary (click a group to drill down)
+LOD_ROW_THRESHOLD = 400      # Detail chart would be ~16,000 px tall
+LOD_MIN_RESOLUTION = 'month' # Spans that need a coarser axis than this (multi-year) are summarized
+SUMMARY_WIDTH_PX = 1200      # Summary chart size is fixed by these, not by the number of tasks
+SUMMARY_ROW_PX = 36
+SUMMARY_MAX_GROUPS = 40      # Remaining groups are folded into one '기타' row
+SUMMARY_BIN_PX = 6           # Density strip resolution (one time bin per 6 px)
+
+# Windowed mode: rows per page (about 25 rows fit on screen at 40 px per row)
+WINDOW_PAGE_SIZES = [25, 50, 100, 200]
+
+# WebGL render mode (see create_professional_gantt): bars become Scattergl line segments
+WEBGL_ROW_THRESHOLD = 1500   # 'auto' switches to WebGL above this many rows
+WEBGL_ROW_PX = 12            # Row height in WebGL mode
+WEBGL_MAX_HEIGHT_PX = 8000   # Keeps the WebGL canvas within browser limits (zoom in for detail)
+
+# Status badge size: label width (bold 10px Arial) + padding/border
+BADGE_FONT = ('Arial Bold', 10)
+BADGE_PX_PER_UNIT = 6        # Without measured metrics: px per visual width unit (Korean = 2 units)
+BADGE_PADDING_PX = 8
+BADGE_HEIGHT_PX = 18
+
+# Panel label layout: (font in assets/font_metrics.json, size); labels are drawn as bold Arial (<b>)
+PRIMARY_PANEL_FONT = ('Arial Bold', 13)
+SECONDARY_PANEL_FONT = ('Arial Bold', 11)
+PANEL_PADDING_PX = 24        # Left + right padding around the widest label
+PANEL_MIN_PX = 90
+PANEL_MAX_PX = 600           # Wider labels wrap
+# Fonts without measured metrics (text_metrics.has_font_metrics): base + px per visual unit + padding
+HEURISTIC_PANEL_BASE_PX = 80
+HEURISTIC_PANEL_PX_PER_UNIT = 11
+HEURISTIC_PANEL_PADDING_PX = 40
+HEURISTIC_PANEL_MIN_PX = 140
+
+# Shared hover for all bars of a trace (values come from customdata, in this order)
+HOVER_FIELDS = ['Task', 'Squad', 'Type', 'Status_Text', 'Period_Start', 'Period_End', 'Comment_Html']
+HOVER_TEMPLATE = (
+    "<span style='font-size:14px; font-weight:bold;'>%{customdata[0]}</span><br><br>"
+    "<b>Squad:</b> %{customdata[1]}<br>"
+    "<b>Type:</b> %{customdata[2]}<br>"
+    "<b>Status:</b> %{customdata[3]}<br>"
+    "<b>Period:</b> %{customdata[4]} ~ %{customdata[5]}<br>"
+    "<b>Comment:</b> %{customdata[6]}<extra></extra>"
+)
+
+def _bar_span(df_plot, today_ts):
+    """
+    Drawn start/end per row (start is NaT when the row has no dates).
+    - Case 1: Start X, End O -> bar from today (clamped to End)
+    - Case 2: Start X, End X -> marker at today only
+    - Case 3: Start O, End O -> normal bar
+    - Case 4: Start O, End X -> bar up to today (ongoing)
+    """
+    start = pd.to_datetime(df_plot['Start'])
+    end = pd.to_datetime(df_plot['End'])
+    bar_start = start.mask(start.isna(), end.clip(upper=today_ts))
+    bar_end = end.mask(end.isna(), today_ts)
+    return bar_start, bar_end, start.notna(), end.notna()
+
+def time_scale(start, end, timeline_px=None):
+    """
+    Pixel density and axis ticks for a timeline from `start` to `end`.
+    The timeline gets span * PX_PER_DAY pixels, clamped to [TIMELINE_MIN_PX, TIMELINE_MAX_PX]
+    (or exactly `timeline_px`); the tick unit is the finest of TIME_UNITS that stays readable.
+    Returns {'px_per_day', 'end' (padded), 'resolution', 'dtick', 'tickformat'}.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(max(end, start))
+    pad_days = min(90, max(3, round((end - start).days * TIMELINE_PAD_RATIO)))
+    end = end + timedelta(days=pad_days)
+    span_days = max(1, (end - start).days)
+    
+    if timeline_px is None:
+        timeline_px = min(TIMELINE_MAX_PX, max(TIMELINE_MIN_PX, span_days * PX_PER_DAY))
+    px_per_day = timeline_px / span_days
+    
+    for resolution, unit_days, dtick, tickformat in TIME_UNITS:
+        if unit_days * px_per_day >= MIN_TICK_PX:
+            break
+    return {'px_per_day': px_per_day, 'end': end, 'resolution': resolution, 'dtick': dtick, 'tickformat': tickformat}
+
+def _gantt_bar_rows(df_plot, today_val):
+    """
+    Per-row bar geometry, label and hover fields for the Gantt (indexed by row position).
+    Rows without any date (Case 2 in _bar_span) are markers at today (is_bar=False).
+    """
+    today_ts = pd.Timestamp(today_val)
+    bar_start, bar_end, has_start, has_end = _bar_span(df_plot, today_ts)
+    days = (bar_end - bar_start).dt.days.to_numpy(dtype=float)
+    # Ongoing bars (Case 4) may shrink to zero; the others keep a half-day minimum
+    min_days = np.where(has_end.to_numpy(), 0.5, 0.0)
+    duration = np.maximum(min_days, np.nan_to_num(days)) * MS_PER_DAY
+
+    status = df_plot['Status']
+    icons = {s: utils.get_status_style(s)['icon'] for s in status.dropna().unique()}
+    text = [
+        f"<b>{icons.get(s, '')} {t}</b>" if icons.get(s, '') else f"<b>{t}</b>"
+        for s, t in zip(status, df_plot['Task'])
+    ]
+
+    comments = df_plot['Comment'] if 'Comment' in df_plot.columns else pd.Series('', index=df_plot.index)
+    rows = pd.DataFrame({
+        'Status': status,
+        'is_bar': (has_start | has_end).to_numpy(),
+        'Base': bar_start.fillna(today_ts),
+        'Duration_MS': duration,
+        'Text': text,
+        'Task': [f"{t}" for t in df_plot['Task']],
+        'Squad': [f"{s}" for s in df_plot['Squad']],
+        'Type': [f"{t}" for t in df_plot['Type']] if 'Type' in df_plot.columns else '',
+        'Status_Text': [f"{s}" for s in status],
+        'Period_Start': bar_start.dt.strftime('%Y-%m-%d').fillna('Unknown'),
+        'Period_End': bar_end.dt.strftime('%Y-%m-%d').fillna('Ongoing'),
+        'Comment_Html': [utils.wrap_text_html(c, 50) for c in comments],
+    }, index=df_plot.index)
+    return rows
+
+def _squad_rank(squads):
+    """Sort rank per row: custom squad order (sheet/file), else '공통' first and the rest alphabetical."""
+    custom_order = utils.get_custom_squad_order()
+    
+    if custom_order:
+        # Normalize keys for robust matching
+        # Use a high number for undefined squads to put them at the end
+        rank_map = {unicodedata.normalize('NFC', str(s)).strip(): i for i, s in enumerate(custom_order)}
+        
+        def get_squad_rank(squad_name):
+            norm_name = unicodedata.normalize('NFC', str(squad_name)).strip()
+            # If found in map, return rank. Else return 999.
+            return rank_map.get(norm_name, 999)
+            
+        return squads.apply(get_squad_rank)
+    # Fallback: '공통' first, others 999 (effective alphabetical if sort includes name)
+    return squads.astype(str).apply(
+        lambda x: 0 if '공통' in unicodedata.normalize('NFC', x) else 999
+    )
+
+def _secondary_col(df, primary_col):
+    """Column shown in the second panel next to `primary_col` (None if the data has none)."""
+    if primary_col == 'Squad':
+        if 'project_name' in df.columns: return 'project_name'
+        elif 'Group' in df.columns: return 'Group' 
+        elif 'Goal' in df.columns: return 'Goal'
+        else: return None
+    return 'Squad'
+
+def sort_roadmap_rows(df, group_col='Squad'):
+    """Rows in Gantt order (primary panel, squad rank, secondary panel, Start), with a fresh RangeIndex."""
+    primary_col = group_col
+    secondary_col = _secondary_col(df, primary_col)
+    df = df.assign(squad_rank=_squad_rank(df['Squad']))
+    
+    if primary_col == 'Squad':
+        sort_cols = ['squad_rank', primary_col, secondary_col, 'Start']
+    elif secondary_col == 'Squad':
+        sort_cols = [primary_col, 'squad_rank', secondary_col, 'Start']
+    else:
+        sort_cols = [primary_col, secondary_col, 'Start']
+        
+    existing_sort_cols = [c for c in sort_cols if c and c in df.columns]
+    
+    if existing_sort_cols:
+         df = df.sort_values(by=existing_sort_cols, ascending=[True] * len(existing_sort_cols))
+         
+    return df.reset_index(drop=True)
+
+def _fallback_color(p_name):
+    # crc32 rather than hash(): str hashes are salted per process, so replicas (and cached figures) would disagree
+    return utils.FALLBACK_COLORS[zlib.crc32(str(p_name).encode()) % len(utils.FALLBACK_COLORS)]
+
+def _panel_color(primary_col, p_name):
+    """Primary panel colour: squad colour, status fill, or a fallback colour picked by a stable hash of the name."""
+    if primary_col == 'Squad':
+        if p_name in utils.SQUAD_COLORS:
+            return utils.SQUAD_COLORS[p_name]
+        return _fallback_color(p_name)
+    elif primary_col == 'Status' or unicodedata.normalize('NFC', str(p_name)).strip() in utils.STATUS_CONFIG:
+         clean_p_name = unicodedata.normalize('NFC', str(p_name)).strip()
+         style = utils.get_status_style(clean_p_name)
+         return style.get('fill', '#888888')
+    return _fallback_color(p_name)
+
+def _add_bar_traces(fig, bars, row_px, px_per_day):
+    """Bars (go.Bar), date-less markers and status badges, one set of traces per status."""
+    # Modified to support solid bars with internal text as requested
+    for status, group in bars.groupby('Status', sort=False, observed=True, dropna=False):
+        style = utils.get_status_style(status)
+
+        # Case 2: Start X, End X (Only Marker)
+        markers = group[~group['is_bar']]
+        if not markers.empty:
+            fig.add_trace(go.Scatter(
+                x=markers['Base'], y=markers.index, mode='markers+text',
+                marker=dict(symbol='line-ns-open', size=10, color=style['border'], line=dict(width=2)),
+                text=markers['Text'],
+                textposition="middle right",
+                textfont=dict(size=12, color="black"),
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+
+        # Case 1/3/4: Bars
+        group = group[group['is_bar']]
+        if group.empty:
+            continue
+
+        # Get style config for this status
+        bar_style = utils.STATUS_CONFIG.get(status, {})
+        fig.add_trace(go.Bar(
+            y=group.index,
+            x=group['Duration_MS'],
+            base=group['Base'],
+            orientation='h',
+            marker=dict(
+                color=bar_style.get('bg_color', '#FFFFFF'),
+                line=dict(width=2, color=bar_style.get('border', '#000000')), # Colored border
+                cornerradius=10 # Rounded corners (requires Plotly 5.23+)
+            ),
+            width=0.8, # Thicker bar for card look
+            opacity=1.0,
+            showlegend=False,
+            text=group['Text'],
+            textposition='inside',
+            insidetextanchor='start', # Left align task name
+            insidetextfont=dict(size=13, color=bar_style.get('text_color', '#000000'), family="Pretendard, Apple SD Gothic Neo, Arial"), # Colored text
+            textangle=0, # Force horizontal
+            constraintext='none', # Allow overflow, don't rotate/shrink weirdly
+            customdata=group[HOVER_FIELDS],
+            hovertemplate=HOVER_TEMPLATE,
+            hoverlabel=dict(bgcolor="white", font_size=13, font_family="Arial", align="left")
+        ))
+
+    # Status Badges (instead of one layout annotation per row)
+    # Badge overlapping top-left border: y=idx is center, bar width=0.8 means top edge is idx - 0.4
+    # Per status: a short filled bar (background sized from the label width) + a text trace with one shared label.
+    # The label is a scatter trace so the bars' uniformtext setting does not resize it.
+    badge_thickness = min(0.45, BADGE_HEIGHT_PX / row_px)
+    badge_traces = []
+    
+    for status, group in bars.groupby('Status', sort=False, observed=True, dropna=False):
+        fill_color = utils.get_status_style(status)['fill']
+        if text_metrics.has_font_metrics(BADGE_FONT[0]):
+            badge_px = text_metrics.text_width_px(f"{status}", *BADGE_FONT) + BADGE_PADDING_PX
+        else:
+            badge_px = text_metrics.visual_width(f"{status}") * BADGE_PX_PER_UNIT + BADGE_PADDING_PX
+        fig.add_trace(go.Bar(
+            y=group.index - 0.4, # Top edge
+            x=np.full(len(group), badge_px / px_per_day * MS_PER_DAY),
+            base=group['Base'],
+            orientation='h',
+            width=badge_thickness,
+            marker=dict(color=fill_color, line=dict(width=1, color=fill_color), cornerradius=3),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+        badge_traces.append(go.Scatter(
+            x=group['Base'] + pd.Timedelta(days=BADGE_PADDING_PX / 2 / px_per_day),
+            y=group.index - 0.4,
+            mode='text',
+            text=f"<b>{status}</b>",
+            textposition='middle right',
+            textfont=dict(color='white', size=10, family="Arial"),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+    
+    # Labels after all badge backgrounds so they are drawn on top
+    fig.add_traces(badge_traces)
+
+def _add_webgl_bar_traces(fig, bars, row_px):
+    """
+    High-volume variant of _add_bar_traces: every bar of a status is one Scattergl line
+    (segments separated by gaps), drawn with WebGL instead of one SVG element per bar.
+    Task names move into the hover; badges are dropped (the status colour identifies the bar).
+    """
+    line_px = max(1.0, row_px * 0.8)
+    
+    for status, group in bars.groupby('Status', sort=False, observed=True, dropna=False):
+        style = utils.get_status_style(status)
+        bar_style = utils.STATUS_CONFIG.get(status, {})
+        color = bar_style.get('border', style['border'])
+        
+        # Case 2: Start X, End X (Only Marker)
+        markers = group[~group['is_bar']]
+        if not markers.empty:
+            fig.add_trace(go.Scattergl(
+                x=markers['Base'], y=markers.index, mode='markers',
+                marker=dict(symbol='line-ns-open', size=max(4, min(10, row_px)), color=color, line=dict(width=2)),
+                customdata=markers[HOVER_FIELDS],
+                hovertemplate=HOVER_TEMPLATE,
+                showlegend=False
+            ))
+        
+        group = group[group['is_bar']]
+        if group.empty:
+            continue
+        
+        # [start, end, gap] per bar (the NaN y breaks the line); hover on both ends
+        starts = group['Base'].to_numpy(dtype='datetime64[ms]')
+        ends = starts + group['Duration_MS'].to_numpy().astype('timedelta64[ms]')
+        x = np.stack([starts, ends, ends], axis=1).ravel()
+        y = np.repeat(group.index.to_numpy(dtype=float), 3)
+        y[2::3] = np.nan
+        customdata = np.repeat(group[HOVER_FIELDS].to_numpy(dtype=object), 3, axis=0)
+        
+        fig.add_trace(go.Scattergl(
+            x=x, y=y, mode='lines',
+            line=dict(color=color, width=line_px),
+            connectgaps=False,
+            customdata=customdata,
+            hovertemplate=HOVER_TEMPLATE,
+            hoverlabel=dict(bgcolor="white", font_size=13, font_family="Arial", align="left"),
+            showlegend=False
+        ))
+
+def _panel_width(df_plot, col, font):
+    """
+    (panel width, inner width for wrapping) in px for the labels of col.
+    Measured fonts: tight fit to the widest rendered label (glyph advances, see text_metrics);
+    otherwise the visual-width heuristic (Korean = 2 units).
+    """
+    if text_metrics.has_font_metrics(font[0]):
+        if df_plot.empty or col not in df_plot.columns:
+            return PANEL_MIN_PX, PANEL_MIN_PX - PANEL_PADDING_PX
+        widest = text_metrics.text_widths_px(df_plot[col], *font).max()
+        panel = max(PANEL_MIN_PX, min(PANEL_MAX_PX, int(np.ceil(widest)) + PANEL_PADDING_PX))
+        return panel, panel - PANEL_PADDING_PX
+
+    units = text_metrics.visual_widths(df_plot[col]).max() if not df_plot.empty and col in df_plot.columns else None
+    if units is None or pd.isna(units): units = 5
+    calc_px = HEURISTIC_PANEL_BASE_PX + units * HEURISTIC_PANEL_PX_PER_UNIT + HEURISTIC_PANEL_PADDING_PX
+    panel = max(HEURISTIC_PANEL_MIN_PX, min(PANEL_MAX_PX, int(calc_px)))
+    return panel, panel - HEURISTIC_PANEL_PADDING_PX
+
+def _wrap_panel_label(text, max_px, font):
+    """Panel label wrapped to max_px: glyph advances for measured fonts, per-character px estimates otherwise."""
+    if text_metrics.has_font_metrics(font[0]):
+        return text_metrics.wrap_label(str(text), max_px, *font)
+    return text_metrics.wrap_text_by_pixels(str(text), max_px)
+
+@bounded_cache(ttl=3600, show_spinner="차트를 생성 중입니다...")  # One figure per filter combination
+def create_professional_gantt(df, group_col='Squad', render_mode='auto', date_range=None):
+    """
+    Gantt 차트 생성 로직
+    render_mode: 'svg' (default look), 'webgl' (large roadmaps) or 'auto' (webgl above WEBGL_ROW_THRESHOLD rows)
+    date_range: optional (first Start, last End) for the time axis, so every window of a paged roadmap shares one axis
+    """
+    df_plot = utils.shallow_copy(df)  # CoW: only the helper columns added below allocate
     # -------------------------------------------------------------
     # [Layout Fix] Pixel-based Logic for Panels
     # We convert pixels to "days" so we can draw panels on the x-axis (time domain)
@@ -27,78 +392,51 @@ def create_professional_gantt(df, group_col='Squad'):
     secondary_col = 'Squad' # Default
     
     # Resolve Secondary Column Logic
-    if primary_col == 'Squad':
-        if 'project_name' in df_plot.columns: secondary_col = 'project_name'
-        elif 'Group' in df_plot.columns: secondary_col = 'Group' 
-        elif 'Goal' in df_plot.columns: secondary_col = 'Goal'
-        else: secondary_col = None
-    elif primary_col == 'Group':
-        secondary_col = 'Squad'
-    else:
-        secondary_col = 'Squad'
+    secondary_col = _secondary_col(df_plot, primary_col)
 
     # [Dynamic Panel Width Calculation]
-    # Calculate max length to adjust panel width
-    max_len_primary = 0
-    if not df_plot.empty and primary_col in df_plot.columns:
-        # Use visual width (Korean=2, English=1)
-        max_len_primary = df_plot[primary_col].astype(str).apply(utils.get_visual_width).max()
-        if pd.isna(max_len_primary): max_len_primary = 5
-        
-    # Heuristic: Base 80px + 11px per visual unit + 40px Padding. 
-    # (Visual unit 1 = approx 11px, Visual unit 2 (Korean) = approx 22px) -> More conservative
-    PADDING_PX = 40
-    calc_primary_px = 80 + (max_len_primary * 11) + PADDING_PX
-    SQUAD_PANEL_PX = max(140, min(600, int(calc_primary_px)))
-    
-    # Calculate max pixel width for wrapping
-    # We pass this to utils.wrap_text_by_pixels
-    primary_max_px = SQUAD_PANEL_PX - PADDING_PX
+    # (panel px, inner px for wrapping); labels wider than PANEL_MAX_PX wrap
+    SQUAD_PANEL_PX, primary_max_px = _panel_width(df_plot, primary_col, PRIMARY_PANEL_FONT)
 
     GROUP_PANEL_PX = 200 # Default
     secondary_max_px = 160 # Default
     
     if secondary_col and secondary_col in df_plot.columns:
-        max_len_sec = df_plot[secondary_col].astype(str).apply(utils.get_visual_width).max()
-        if pd.isna(max_len_sec): max_len_sec = 5
-        
-        calc_sec_px = 80 + (max_len_sec * 11) + PADDING_PX
-        GROUP_PANEL_PX = max(140, min(600, int(calc_sec_px)))
-        secondary_max_px = GROUP_PANEL_PX - PADDING_PX
+        GROUP_PANEL_PX, secondary_max_px = _panel_width(df_plot, secondary_col, SECONDARY_PANEL_FONT)
 
-    PX_PER_DAY = 5  # Fixed scale: 5 pixels per 1 day
     # SQUAD_PANEL_PX & GROUP_PANEL_PX set dynamically above
     
     # Calculate Data Range
-    data_min_date = df_plot['Start'].min()
+    data_min_date, data_max_date = date_range if date_range else (df_plot['Start'].min(), df_plot['End'].max())
     if pd.isna(data_min_date): data_min_date = datetime.now()
     
-    data_max_date = df_plot['End'].max()
     if pd.isna(data_max_date): data_max_date = datetime.now() + timedelta(days=30)
     
-    # Extend max date for visual breathing room
-    vis_max_date = data_max_date + timedelta(days=90)
+    # Time scale from the span and the pixel budget (also extends max date for visual breathing room)
+    scale = time_scale(data_min_date, data_max_date)
+    px_per_day = scale['px_per_day']
+    vis_max_date = scale['end']
     
     # Calculate Panel Widths in Days (deltas)
-    squad_days = SQUAD_PANEL_PX / PX_PER_DAY
-    group_days = GROUP_PANEL_PX / PX_PER_DAY
+    squad_days = SQUAD_PANEL_PX / px_per_day
+    group_days = GROUP_PANEL_PX / px_per_day
     
     # (Removed previous static column logic block from here as it's moved up)
 
     # Calculate Start Date for the Axis (Left edge of panels)
     # Axis Start = Data Start - (Panel Days)
-    # We add a small buffer (10 days) between panels and data
-    BUFFER_DAYS = 5
+    # We add a small buffer (25px) between panels and data
+    BUFFER_PX = 25
     
-    total_panel_days = squad_days + BUFFER_DAYS
+    total_panel_days = squad_days + BUFFER_PX / px_per_day
     if secondary_col:
         total_panel_days += group_days
 
     axis_min_date = data_min_date - timedelta(days=total_panel_days)
     
-    # Calculate Total Width required
+    # Calculate Total Width required (panels + timeline, bounded by TIMELINE_MAX_PX)
     total_plot_days = (vis_max_date - axis_min_date).days
-    chart_width = max(1200, total_plot_days * PX_PER_DAY)
+    chart_width = max(1200, int(total_plot_days * px_per_day))
     
     # Shapes (Panels) Calculation
     # Primary Panel (Leftmost)
@@ -112,149 +450,115 @@ def create_professional_gantt(df, group_col='Squad'):
     
     # Update Fig Layout early to enforce width
     fig = go.Figure()
+
+    # [Performance] Shapes/annotations are collected as plain dicts and assigned to the layout once
+    # (fig.add_shape revalidates the whole shape list on every call)
+    shapes = []
+    panel_annotations = []
+
+    # WebGL mode: compact rows (bounded canvas height), no per-row SVG shapes
+    use_webgl = render_mode == 'webgl' or (render_mode == 'auto' and len(df_plot) > WEBGL_ROW_THRESHOLD)
+    if use_webgl:
+        chart_height = min(WEBGL_MAX_HEIGHT_PX, max(600, len(df_plot) * WEBGL_ROW_PX + 150))
+    else:
+        chart_height = max(600, len(df_plot) * 40 + 100)
     
     # 1. Zebra Background (Full Width)
-    for idx in range(len(df_plot)):
-        stripe_color = 'rgba(248, 248, 248, 1)' if idx % 2 == 0 else 'rgba(255, 255, 255, 1)'
-        # Cover entire visible range
-        fig.add_shape(type="rect", x0=axis_min_date, x1=vis_max_date, y0=idx - 0.4, y1=idx + 0.4,
-                      fillcolor=stripe_color, line=dict(width=0), layer="below")
-    
+    if not use_webgl:
+        shapes += [
+            dict(type="rect", x0=axis_min_date, x1=vis_max_date, y0=idx - 0.4, y1=idx + 0.4,
+                 fillcolor='rgba(248, 248, 248, 1)' if idx % 2 == 0 else 'rgba(255, 255, 255, 1)',
+                 line=dict(width=0), layer="below")
+            for idx in range(len(df_plot))  # Cover entire visible range
+        ]
     
-    # 1. Custom Order (from Google Sheet or File)
-    custom_order = utils.get_custom_squad_order()
     
-    if custom_order:
-        # Normalize keys for robust matching
-        # Use a high number for undefined squads to put them at the end
-        rank_map = {unicodedata.normalize('NFC', str(s)).strip(): i for i, s in enumerate(custom_order)}
-        
-        def get_squad_rank(squad_name):
-            norm_name = unicodedata.normalize('NFC', str(squad_name)).strip()
-            # If found in map, return rank. Else return 999.
-            return rank_map.get(norm_name, 999)
-            
-        df_plot['squad_rank'] = df_plot['Squad'].apply(get_squad_rank)
-    else:
-        # Fallback: '공통' first, others 999 (effective alphabetical if sort includes name)
-        df_plot['squad_rank'] = df_plot['Squad'].astype(str).apply(
-            lambda x: 0 if '공통' in unicodedata.normalize('NFC', x) else 999
-        )
-    
-    if primary_col == 'Squad':
-        sort_cols = ['squad_rank', primary_col, secondary_col, 'Start']
-    elif secondary_col == 'Squad':
-        sort_cols = [primary_col, 'squad_rank', secondary_col, 'Start']
-    else:
-        sort_cols = [primary_col, secondary_col, 'Start']
-        
-    existing_sort_cols = [c for c in sort_cols if c and c in df_plot.columns]
-    
-    if existing_sort_cols:
-         df_plot = df_plot.sort_values(by=existing_sort_cols, ascending=[True] * len(existing_sort_cols))
-         
-    df_plot = df_plot.reset_index(drop=True)
+    # 1. Custom Order (from Google Sheet or File) + panel sort
+    df_plot = sort_roadmap_rows(df_plot, primary_col)
     df_plot['row_idx'] = range(len(df_plot))
     
-    primary_groups = df_plot.groupby(primary_col, sort=False)
+    primary_bounds = df_plot.groupby(primary_col, sort=False, observed=True)['row_idx'].agg(['min', 'max'])
     
     # 2-1. Primary Panel Draw using Date Coordinates (xref='x')
-    for p_name, p_group in primary_groups:
-        min_idx = p_group['row_idx'].min()
-        max_idx = p_group['row_idx'].max()
-        
-        if primary_col == 'Squad':
-            if p_name in utils.SQUAD_COLORS:
-                panel_color = utils.SQUAD_COLORS[p_name]
-            else:
-                panel_color = utils.FALLBACK_COLORS[hash(p_name) % len(utils.FALLBACK_COLORS)]
-        elif primary_col == 'Status' or unicodedata.normalize('NFC', str(p_name)).strip() in utils.STATUS_CONFIG:
-             clean_p_name = unicodedata.normalize('NFC', str(p_name)).strip()
-             style = utils.get_status_style(clean_p_name)
-             panel_color = style.get('fill', '#888888')
-        else:
-            panel_color = utils.FALLBACK_COLORS[hash(p_name) % len(utils.FALLBACK_COLORS)]
+    for p_name, min_idx, max_idx in primary_bounds.itertuples():
+        panel_color = _panel_color(primary_col, p_name)
         
         # Background Box (xref='x')
         GAP = 0.05
-        fig.add_shape(type="rect", xref="x", yref="y",
-                      x0=primary_x0, x1=primary_x1, 
-                      y0=min_idx - 0.5 + GAP, y1=max_idx + 0.5 - GAP,
-                      fillcolor=panel_color, line=dict(width=0), layer="above")
+        shapes.append(dict(type="rect", xref="x", yref="y",
+                           x0=primary_x0, x1=primary_x1, 
+                           y0=min_idx - 0.5 + GAP, y1=max_idx + 0.5 - GAP,
+                           fillcolor=panel_color, line=dict(width=0), layer="above"))
         
         # Text (Calculate center in time domain)
         center_date = primary_x0 + (primary_x1 - primary_x0) / 2
         
         # Dynamic Wrapping based on max pixel width
-        wrapped_text = utils.wrap_text_by_pixels(p_name, max_px=primary_max_px)
+        wrapped_text = _wrap_panel_label(p_name, primary_max_px, PRIMARY_PANEL_FONT)
         
-        font_size = 13
-        p_len = len(str(p_name))
+        font_size = PRIMARY_PANEL_FONT[1]
         
         # Adaptive font size (Simplified because wrapping handles resizing)
         # if p_len > 40: font_size = 11
         
-        fig.add_annotation(
+        panel_annotations.append(dict(
             xref="x", yref="y",
             x=center_date, y=(min_idx + max_idx) / 2,
             text=f"<b>{wrapped_text}</b>", 
             showarrow=False,
-            font=dict(size=font_size, color='white', family='Arial Black'),
+            font=dict(size=font_size, color='white', family='Arial'),
             align="center",
             xanchor="center"
-        )
+        ))
         
         # Separator
         if min_idx > 0:
             # Existing panel separator (white gap for panel)
-            fig.add_shape(type="line", xref="x", yref="y",
-                          x0=primary_x0, x1=primary_x1, y0=min_idx - 0.5, y1=min_idx - 0.5,
-                          line=dict(color="white", width=4), layer="above")
+            shapes.append(dict(type="line", xref="x", yref="y",
+                               x0=primary_x0, x1=primary_x1, y0=min_idx - 0.5, y1=min_idx - 0.5,
+                               line=dict(color="white", width=4), layer="above"))
             
             # [Visual Improvement] Global Separator Line between Groups
             # Changed layer to 'above' to ensure it's not hidden by background
             # Made color darker for better visibility
             # Use xref='paper' to guarantee it spans the entire view width
-            fig.add_shape(type="line", xref="paper", yref="y",
-                          x0=0, x1=1, 
-                          y0=min_idx - 0.5, y1=min_idx - 0.5,
-                          line=dict(color="#333333", width=2, dash="solid"), 
-                          layer="above")
+            shapes.append(dict(type="line", xref="paper", yref="y",
+                               x0=0, x1=1, 
+                               y0=min_idx - 0.5, y1=min_idx - 0.5,
+                               line=dict(color="#333333", width=2, dash="solid"), 
+                               layer="above"))
     
     # [Fix] Add a final bottom line to close the table visually
     # The loop above draws lines *between* groups (top of each group starting from index > 0)
     # We need one at the very bottom of the entire chart.
     total_rows = len(df_plot)
     if total_rows > 0:
-        fig.add_shape(type="line", xref="paper", yref="y",
-                      x0=0, x1=1, 
-                      y0=total_rows - 0.5, y1=total_rows - 0.5,
-                      line=dict(color="#333333", width=2, dash="solid"), 
-                      layer="above")
+        shapes.append(dict(type="line", xref="paper", yref="y",
+                           x0=0, x1=1, 
+                           y0=total_rows - 0.5, y1=total_rows - 0.5,
+                           line=dict(color="#333333", width=2, dash="solid"), 
+                           layer="above"))
 
     # 2-2. Secondary Panel Draw
     if secondary_col:
-        secondary_groups = df_plot.groupby([primary_col, secondary_col], sort=False)
+        secondary_bounds = df_plot.groupby([primary_col, secondary_col], sort=False, observed=True)['row_idx'].agg(['min', 'max'])
         
-        for (p_val, s_val), group_data in secondary_groups:
-            min_idx = group_data['row_idx'].min()
-            max_idx = group_data['row_idx'].max()
-            
+        for (p_val, s_val), min_idx, max_idx in secondary_bounds.itertuples():
             sec_color = '#E8E8E8'
             
-            fig.add_shape(type="rect", xref="x", yref="y",
-                          x0=sec_x0, x1=sec_x1, 
-                          y0=min_idx - 0.49, y1=max_idx + 0.49,
-                          fillcolor=sec_color, 
-                          line=dict(width=1, color='#CCCCCC'), 
-                          layer="above")
+            shapes.append(dict(type="rect", xref="x", yref="y",
+                               x0=sec_x0, x1=sec_x1, 
+                               y0=min_idx - 0.49, y1=max_idx + 0.49,
+                               fillcolor=sec_color, 
+                               line=dict(width=1, color='#CCCCCC'), 
+                               layer="above"))
             
             center_sec_date = sec_x0 + (sec_x1 - sec_x0) / 2
             
-            wrapped_sec_text = utils.wrap_text_by_pixels(s_val, max_px=secondary_max_px)
-            sec_font_size = 11
+            wrapped_sec_text = _wrap_panel_label(s_val, secondary_max_px, SECONDARY_PANEL_FONT)
+            sec_font_size = SECONDARY_PANEL_FONT[1]
             
-            fig.add_annotation(
+            panel_annotations.append(dict(
                 xref="x", yref="y",
                 x=center_sec_date, 
                 y=(min_idx + max_idx) / 2,
@@ -263,196 +567,54 @@ def create_professional_gantt(df, group_col='Squad'):
                 font=dict(size=sec_font_size, color='#333333', family='Arial'),
                 align="center",
                 xanchor="center"
-            )
+            ))
             
             if min_idx > 0:
-                fig.add_shape(type="line", xref="x", yref="y",
-                              x0=sec_x0, x1=sec_x1, 
-                              y0=min_idx - 0.5, y1=min_idx - 0.5,
-                              line=dict(color="#CCCCCC", width=1), layer="above")
+                shapes.append(dict(type="line", xref="x", yref="y",
+                                   x0=sec_x0, x1=sec_x1, 
+                                   y0=min_idx - 0.5, y1=min_idx - 0.5,
+                                   line=dict(color="#CCCCCC", width=1), layer="above"))
 
     # [New Feature] Sub-Group Separator (Squad Separator when grouped by Status/etc)
     # If the primary column is NOT Squad, we still want to see separators between Squads.
-    if primary_col != 'Squad':
-        # Iterate through rows to find where Squad changes
-        for i in range(1, len(df_plot)):
-            # Check if Squad changed from previous row
-            curr_squad = df_plot.iloc[i]['Squad']
-            prev_squad = df_plot.iloc[i-1]['Squad']
-            
-            # Check if Primary Group also changed (we already have a line there from the main loop)
-            # We only want to add *extra* lines if the primary group didn't change but the squad did.
-            curr_primary = df_plot.iloc[i][primary_col]
-            prev_primary = df_plot.iloc[i-1][primary_col]
-            
-            if curr_squad != prev_squad and curr_primary == prev_primary:
-                 # Draw a separator
-                 # We use a slightly different style (e.g. thinner/lighter) or same?
-                 # User requested "separator", let's use a clear grey line.
-                 fig.add_shape(type="line", xref="paper", yref="y",
-                          x0=0, x1=1, 
-                          y0=i - 0.5, y1=i - 0.5,
-                          line=dict(color="#999999", width=1, dash="longdash"), # Distinct from main block
-                          layer="below") # Below to not obscure text, but visible on background
+    if primary_col != 'Squad' and len(df_plot) > 1:
+        # Rows where the Squad changes but the Primary Group does not
+        # (a primary group change already has a line from the main loop)
+        squad_vals = df_plot['Squad'].to_numpy(dtype=object)
+        primary_vals = df_plot[primary_col].to_numpy(dtype=object)
+        squad_changed = squad_vals[1:] != squad_vals[:-1]
+        same_primary = primary_vals[1:] == primary_vals[:-1]
+        
+        # User requested "separator", let's use a clear grey line.
+        shapes += [
+            dict(type="line", xref="paper", yref="y",
+                 x0=0, x1=1, 
+                 y0=i - 0.5, y1=i - 0.5,
+                 line=dict(color="#999999", width=1, dash="longdash"), # Distinct from main block
+                 layer="below") # Below to not obscure text, but visible on background
+            for i in (np.flatnonzero(squad_changed & same_primary) + 1).tolist()
+        ]
 
     # [Important] Update Layout with explicit width and range
 
 
     # 3. Bar Chart Drawing Logic
-    # Modified to support solid bars with internal text as requested
-
-    # Separate traces for bars (with text) and simple markers
+    # [Performance] One trace per status (arrays + shared customdata hovertemplate) instead of one trace per task
+    bars = _gantt_bar_rows(df_plot, datetime.now())
+    row_px = (chart_height - 150) / (len(df_plot) + 1)  # Plot area (minus top/bottom margin) per row
     
-    annotations = []
-    
-    for idx, row in df_plot.iterrows():
-        status = row['Status']
-        style = utils.get_status_style(status)
-        border_color = style['border']
-        fill_color = style['fill']
-        text_color = style.get('text_color', 'black') # Default to black if not set
-        icon_display = style['icon']
-        
-        start_date = row['Start']
-        end_date = row['End']
-        task_text = row['Task']
-        if icon_display:
-            task_text = f"{icon_display} {task_text}"
-            
-        today_val = datetime.now()
-        
-        # Determine bar properties
-        bar_base = None
-        bar_x = None
-        show_bar = False
-        bar_opacity = 1.0
-        
-        # Case 1: Start X, End O (Start=Today)
-        if pd.isna(start_date) and pd.notna(end_date):
-            start_date = today_val
-            if start_date > end_date: start_date = end_date
-            bar_base = start_date
-            bar_x = (max(0.5, (end_date - start_date).days) * 24 * 60 * 60 * 1000)
-            show_bar = True
-            
-        # Case 2: Start X, End X (Only Marker)
-        elif pd.isna(start_date) and pd.isna(end_date):
-            fig.add_trace(go.Scatter(
-                x=[today_val], y=[idx], mode='markers+text',
-                marker=dict(symbol='line-ns-open', size=10, color=border_color, line=dict(width=2)),
-                text=[f"<b>{task_text}</b>"],
-                textposition="middle right",
-                textfont=dict(size=12, color="black"),
-                showlegend=False,
-                hoverinfo='skip'
-            ))
-            
-            # [Fix] Add Status Badge for Markers as well
-            annotations.append(dict(
-                x=today_val,
-                y=idx - 0.4, # Top edge like bars
-                text=f"<b>{status}</b>",
-                showarrow=False,
-                xanchor='left',
-                yanchor='middle',
-                xshift=0, 
-                yshift=0,
-                font=dict(color='white', size=10, family="Arial"),
-                bgcolor=fill_color,
-                bordercolor=fill_color,
-                borderwidth=1,
-                borderpad=2,
-                opacity=1.0
-            ))
-            continue # Done for this row
-            
-        # Case 3: Start O, End O (Normal)
-        elif pd.notna(start_date) and pd.notna(end_date):
-            bar_base = start_date
-            bar_x = (max(0.5, (end_date - start_date).days) * 24 * 60 * 60 * 1000)
-            show_bar = True
-            
-        # Case 4: Start O, End X (Ongoing infinite?)
-        elif pd.notna(start_date) and pd.isnull(end_date):
-            end_date = datetime.now()
-            if start_date > end_date: 
-                duration_days = 0 
-            else:
-                duration_days = (end_date - start_date).days
-            
-            bar_base = start_date
-            bar_x = (duration_days * 24 * 60 * 60 * 1000)
-            show_bar = True
-            bar_opacity = 1.0 # Keep opaque text
-            # task_text += " (진행중)" # Removed as per user request
-        
-        if show_bar:
-            # Get style config for this status
-            style = utils.STATUS_CONFIG.get(status, {})
-            bar_color = style.get('bg_color', '#FFFFFF')
-            border_color = style.get('border', '#000000')
-            text_color = style.get('text_color', '#000000')
-            
-            # 1. Main White Bar (Box)
-            fig.add_trace(go.Bar(
-                y=[idx],
-                x=[bar_x],
-                base=[bar_base],
-                orientation='h',
-                marker=dict(
-                    color=bar_color, 
-                    line=dict(width=2, color=border_color), # Colored border
-                    cornerradius=10 # Rounded corners (requires Plotly 5.23+)
-                ),
-                width=0.8, # Thicker bar for card look
-                opacity=bar_opacity,
-                showlegend=False,
-                text=f"<b>{task_text}</b>",
-                textposition='inside', 
-                insidetextanchor='start', # Left align task name
-                insidetextfont=dict(size=13, color=text_color, family="Pretendard, Apple SD Gothic Neo, Arial"), # Colored text
-                textangle=0, # Force horizontal
-                constraintext='none', # Allow overflow, don't rotate/shrink weirdly
-                hovertemplate=(
-                    f"<span style='font-size:14px; font-weight:bold;'>{row['Task']}</span><br><br>"
-                    f"<b>Squad:</b> {row['Squad']}<br>"
-                    f"<b>Type:</b> {row.get('Type', '')}<br>"
-                    f"<b>Status:</b> {status}<br>"
-                    f"<b>Period:</b> {start_date.strftime('%Y-%m-%d') if pd.notna(start_date) else 'Unknown'} ~ "
-                    f"{end_date.strftime('%Y-%m-%d') if pd.notna(end_date) else 'Ongoing'}<br>"
-                    f"<b>Comment:</b> {utils.wrap_text_html(row['Comment'], 50)}<extra></extra>"
-                ),
-                hoverlabel=dict(bgcolor="white", font_size=13, font_family="Arial", align="left")
-            ))
-            
-            # 2. Status Badge (Annotation)
-            # Badge overlapping top-left border
-            # y=idx is center. Bar width=0.8 means top edge is idx - 0.4
-            
-            annotations.append(dict(
-                x=bar_base,
-                y=idx - 0.4, # Top edge
-                text=f"<b>{status}</b>",
-                showarrow=False,
-                xanchor='left',
-                yanchor='middle', # Straddle the line
-                xshift=0, 
-                yshift=0,
-                font=dict(color='white', size=10, family="Arial"),
-                bgcolor=fill_color,
-                bordercolor=fill_color,
-                borderwidth=1,
-                borderpad=2,
-                opacity=1.0
-            ))
+    if use_webgl:
+        _add_webgl_bar_traces(fig, bars, row_px)
+    else:
+        _add_bar_traces(fig, bars, row_px, px_per_day)
 
     # 5. Today Line
     today = datetime.now()
-    fig.add_shape(type="line", x0=today, x1=today, y0=-1, y1=len(df_plot),
-                  line=dict(color="red", width=1.5, dash="dot"), layer="above")
+    shapes.append(dict(type="line", x0=today, x1=today, y0=-1, y1=len(df_plot),
+                       line=dict(color="red", width=1.5, dash="dot"), layer="above"))
     
     # Move Today label inside the plot (below the timeline axis) to avoid overlap with Date Labels
-    fig.add_annotation(
+    panel_annotations.append(dict(
         x=today, 
         y=1.0, 
         yref="paper", 
@@ -462,19 +624,18 @@ def create_professional_gantt(df, group_col='Squad'):
         xanchor='center',
         yanchor='top', # Anchor to top
         yshift=-10 # Shift DOWN into the chart area
-    )
+    ))
 
-    # Combine existing annotations with badge annotations
-    existing_annotations = list(fig.layout.annotations) if fig.layout.annotations else []
-    fig.layout.annotations = existing_annotations + annotations
+    # One layout assignment for all shapes and annotations
+    fig.update_layout(shapes=shapes, annotations=panel_annotations)
 
     fig.update_layout(
         width=chart_width,  # Explicitly Set Width
-        height=max(600, len(df_plot) * 40 + 100), 
+        height=chart_height, 
         xaxis=dict(
             type='date', 
-            tickformat='%Y-%m', 
-            dtick="M3", 
+            tickformat=scale['tickformat'], 
+            dtick=scale['dtick'], 
             gridcolor='lightgray',
             side='top',
             # Fixed Range covering Panels + Data
@@ -490,6 +651,7 @@ def create_professional_gantt(df, group_col='Squad'):
         # Margin: Zero left margin because panels are inside the plot area now
         margin=dict(t=120, l=10, r=50, b=30), 
         hovermode='closest',
+        barmode='overlay',  # Each row has its own y slot; no side-by-side grouping across status traces
         plot_bgcolor='white',
         showlegend=True,
         uniformtext_minsize=12, 
@@ -534,6 +696,226 @@ def create_professional_gantt(df, group_col='Squad'):
     
     return fig
 
+def needs_summary(df):
+    """True when the detail Gantt would exceed the LOD row/width budget."""
+    if len(df) > LOD_ROW_THRESHOLD:
+        return True
+    start, end = df['Start'].min(), df['End'].max()
+    if pd.isna(start) or pd.isna(end):
+        return False
+    resolutions = [unit[0] for unit in TIME_UNITS]
+    return resolutions.index(time_scale(start, end)['resolution']) > resolutions.index(LOD_MIN_RESOLUTION)
+
+def summary_group_keys(df, group_col):
+    """Group label per row as shown in the summary (missing values -> '(없음)')."""
+    return df[group_col].astype(object).where(df[group_col].notna(), '(없음)').astype(str)
+
+def _summary_groups(df, group_col):
+    """
+    Group label per row and the group order (custom squad order first when grouping by Squad).
+    Groups beyond SUMMARY_MAX_GROUPS share one '기타' label (returned as `other`, None if unused).
+    """
+    keys = summary_group_keys(df, group_col)
+    rank = _squad_rank(df['Squad']) if group_col == 'Squad' else 0
+    order = pd.DataFrame({'key': keys, 'rank': rank}).groupby('key')['rank'].min()
+    ordered = order.reset_index().sort_values(['rank', 'key'])['key'].tolist()
+    other = None
+    if len(ordered) > SUMMARY_MAX_GROUPS:
+        kept = ordered[:SUMMARY_MAX_GROUPS - 1]
+        other = f"기타 ({len(ordered) - len(kept)}개 그룹)"
+        keys = keys.where(keys.isin(kept), other)
+        ordered = kept + [other]
+    return keys, ordered, other
+
+@bounded_cache(ttl=3600, show_spinner="요약 차트를 생성 중입니다...")
+def create_summary_gantt(df, group_col='Squad'):
+    """
+    Level-of-detail roadmap: one row per group with its overall span and a density strip
+    (concurrent tasks per time bin). Figure size depends on the screen budget
+    (SUMMARY_WIDTH_PX, SUMMARY_MAX_GROUPS), not on the number of tasks.
+    Bars carry the group name in customdata[0] for drill-down (None for the '기타' row).
+    """
+    today_ts = pd.Timestamp(datetime.now().date())
+    bar_start, bar_end, _, _ = _bar_span(df, today_ts)
+    bar_start = bar_start.fillna(today_ts)  # Date-less tasks count at today
+    
+    keys, groups, other = _summary_groups(df, group_col)
+    codes = pd.Categorical(keys, categories=groups).codes
+    n_groups = len(groups)
+    
+    # Time bins: at most SUMMARY_WIDTH_PX / SUMMARY_BIN_PX, whole days each
+    t0 = min(bar_start.min(), today_ts).normalize()
+    t1 = max(bar_end.max(), today_ts).normalize() + pd.Timedelta(days=1)
+    n_bins_max = SUMMARY_WIDTH_PX // SUMMARY_BIN_PX
+    bin_days = max(1, -(-(t1 - t0).days // n_bins_max))
+    n_bins = max(1, -(-(t1 - t0).days // bin_days))
+    bin_ns = bin_days * MS_PER_DAY * 1_000_000
+    
+    first = ((bar_start - t0).to_numpy(dtype='timedelta64[ns]').astype(np.int64) // bin_ns).clip(0, n_bins - 1)
+    last = ((bar_end - t0).to_numpy(dtype='timedelta64[ns]').astype(np.int64) // bin_ns).clip(0, n_bins - 1)
+    last = np.maximum(first, last)  # End before Start in the sheet -> a single bin
+    
+    # Active tasks per (group, bin): +1 at the first bin, -1 after the last, then a running sum
+    delta = np.zeros((n_groups, n_bins + 1))
+    np.add.at(delta, (codes, first), 1)
+    np.add.at(delta, (codes, last + 1), -1)
+    density = delta.cumsum(axis=1)[:, :n_bins]
+    
+    bin_starts = t0 + pd.to_timedelta(np.arange(n_bins) * bin_days, unit='D')
+    ticks = time_scale(t0, t1, timeline_px=SUMMARY_WIDTH_PX)  # Tick unit only; the range is the bins'
+    
+    # Per-group span, task count and status breakdown
+    spans = pd.DataFrame({'Group': codes, 'Start': bar_start.to_numpy(), 'End': bar_end.to_numpy(),
+                          'Status': df['Status'].astype(str).to_numpy()})
+    agg = spans.groupby('Group').agg(Start=('Start', 'min'), End=('End', 'max'), Tasks=('Start', 'size'))
+    agg = agg.reindex(range(n_groups))
+    breakdown = spans.groupby(['Group', 'Status']).size().unstack(fill_value=0).reindex(range(n_groups), fill_value=0)
+    status_text = [" · ".join(f"{s} {c}" for s, c in row.items() if c) for row in breakdown.to_dict('records')]
+    drillable = [None if g == other else g for g in groups]
+    tick_text = [f"<b>{g}</b> ({int(n)})" for g, n in zip(groups, agg['Tasks'].fillna(0))]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(
+        x=bin_starts + pd.Timedelta(days=bin_days / 2), y=groups, z=density,
+        zmin=0, colorscale=[[0, 'rgba(255,255,255,0)'], [0.001, '#DCEBFA'], [1, '#1F4E79']],
+        xgap=0, ygap=6,
+        colorbar=dict(title=dict(text="동시 진행", side='right'), thickness=10, len=0.6),
+        hovertemplate="<b>%{y}</b><br>%{x|%Y-%m-%d} 전후<br>진행 과제: %{z}개<extra></extra>"
+    ))
+    fig.add_trace(go.Bar(
+        y=groups, base=agg['Start'], x=(agg['End'] - agg['Start']).dt.total_seconds() * 1000,
+        orientation='h', width=0.7,
+        marker=dict(color='rgba(0,0,0,0)', line=dict(width=1.5, color='#333333')),
+        customdata=np.column_stack([
+            drillable, agg['Tasks'].fillna(0).astype(int),
+            agg['Start'].dt.strftime('%Y-%m-%d').fillna('-'), agg['End'].dt.strftime('%Y-%m-%d').fillna('-'),
+            status_text
+        ]),
+        hovertemplate=(
+            "<span style='font-size:14px; font-weight:bold;'>%{y}</span><br><br>"
+            "<b>과제:</b> %{customdata[1]}개<br>"
+            "<b>Period:</b> %{customdata[2]} ~ %{customdata[3]}<br>"
+            "<b>Status:</b> %{customdata[4]}<extra></extra>"
+        ),
+        hoverlabel=dict(bgcolor="white", font_size=13, font_family="Arial", align="left"),
+        selected=dict(marker=dict(opacity=1)), unselected=dict(marker=dict(opacity=1)),
+        showlegend=False
+    ))
+    
+    fig.update_layout(
+        width=SUMMARY_WIDTH_PX,
+        height=max(300, n_groups * SUMMARY_ROW_PX + 150),
+        shapes=[dict(type="line", x0=today_ts, x1=today_ts, y0=0, y1=1, yref="paper",
+                     line=dict(color="red", width=1.5, dash="dot"), layer="above")],
+        annotations=[dict(x=today_ts, y=1.0, yref="paper", text="<b>Today</b>", showarrow=False,
+                          font=dict(size=11, color="red", family="Arial Black"),
+                          xanchor='center', yanchor='bottom')],
+        xaxis=dict(type='date', tickformat=ticks['tickformat'], dtick=ticks['dtick'], gridcolor='lightgray', side='top',
+                   range=[t0, t0 + pd.Timedelta(days=n_bins * bin_days)], tickfont=dict(size=12, family="Arial")),
+        yaxis=dict(type='category', categoryorder='array', categoryarray=groups,
+                   tickvals=groups, ticktext=tick_text, autorange='reversed', tickfont=dict(size=12)),
+        margin=dict(t=80, l=10, r=30, b=30),
+        hovermode='closest',
+        clickmode='event+select',
+        dragmode=False,
+        plot_bgcolor='white',
+    )
+    return fig
+
+def window_bounds(df_sorted, group_col, page_rows, by_group=False):
+    """
+    [(start, stop)] row windows over Gantt-ordered rows (see sort_roadmap_rows).
+    by_group: pages hold whole `group_col` groups up to page_rows rows; a larger group is split.
+    """
+    n = len(df_sorted)
+    if not by_group or n == 0:
+        return [(i, min(i + page_rows, n)) for i in range(0, n, page_rows)] or [(0, 0)]
+    
+    keys = df_sorted[group_col].astype(str).to_numpy(dtype=object)
+    group_starts = np.concatenate([[0], np.flatnonzero(keys[1:] != keys[:-1]) + 1]).tolist()
+    group_ends = group_starts[1:] + [n]
+    
+    windows = []
+    start = 0
+    for g_start, g_end in zip(group_starts, group_ends):
+        if g_end - start > page_rows and g_start > start:
+            windows.append((start, g_start))  # Close the page before this group
+            start = g_start
+        while g_end - start > page_rows:
+            windows.append((start, start + page_rows))
+            start += page_rows
+    if start < n:
+        windows.append((start, n))
+    return windows
+
+@bounded_cache(ttl=3600)
+def paged_roadmap(df, group_col, page_rows, by_group):
+    """Sorted rows, their windows and the overall (first Start, last End) shared by all pages."""
+    df_sorted = sort_roadmap_rows(df, group_col).drop(columns='squad_rank')
+    return df_sorted, window_bounds(df_sorted, group_col, page_rows, by_group), (df['Start'].min(), df['End'].max())
+
+# Never offered as group-by in the sidebar
+ROADMAP_SYSTEM_COLS = ['Task', 'Start', 'End', 'Comment', 'Display_Date', 'Duration_Text', 'Tick_Label', 'Duration', 'row_idx']
+
+def roadmap_group_options(df):
+    """Group-by options (original column order) and the default index (Status, else Squad)."""
+    # [User Request] Keep original column order from data
+    group_options = [c for c in df.columns if c not in ROADMAP_SYSTEM_COLS]
+    
+    # Ensure 'Squad' is present if implied (though it should be in df columns)
+    if 'Squad' not in group_options and 'Squad' in df.columns:
+        group_options.insert(0, 'Squad')
+        
+    # Default logic (Status or Squad)
+    default_index = 0
+    if 'Status' in group_options:
+        default_index = group_options.index('Status')
+    elif 'Squad' in group_options:
+        default_index = group_options.index('Squad')
+    return group_options, default_index
+
+def filter_roadmap(df, search_query='', squads=None, goals=None, show_completed=True):
+    """Sidebar search/squad/goal/completed filters (each step returns a new frame)."""
+    df_filtered = df
+    
+    if search_query:
+        df_filtered = df_filtered[df_filtered['Task'].str.contains(search_query, case=False, na=False)]
+        
+    if squads:
+        df_filtered = df_filtered[df_filtered['Squad'].isin(squads)]
+        
+    if goals:
+        df_filtered = df_filtered[df_filtered['Goal'].isin(goals)]
+        
+    if not show_completed:
+        df_filtered = df_filtered[df_filtered['Status'] != '진행 완료']
+    return df_filtered
+
+def filter_statuses(df, statuses):
+    """Status multiselect filter (nothing selected = every row)."""
+    return df[df['Status'].isin(statuses)] if statuses else df
+
+def build_default_chart(df_original):
+    """
+    Builds the chart render_roadmap opens with when every sidebar option is at its default
+    (all squads/goals/statuses, no period, auto render mode and level of detail, no paging).
+    The figure lands in the same cache entry, so precompute can warm it off the request thread.
+    """
+    group_options, default_index = roadmap_group_options(df_original)
+    if not group_options or df_original.empty:
+        return None
+    group_col = group_options[default_index]
+    
+    goals = sorted(df_original['Goal'].dropna().unique().tolist()) if 'Goal' in df_original.columns else []
+    df_filtered = filter_roadmap(df_original, squads=list(df_original['Squad'].unique()), goals=goals)
+    df_chart = filter_statuses(df_filtered, sorted(df_filtered['Status'].dropna().unique()))
+    if df_chart.empty:
+        return None
+    
+    if needs_summary(df_chart):
+        return create_summary_gantt(df_chart, group_col=group_col)
+    return create_professional_gantt(df_chart, group_col=group_col, render_mode='auto', date_range=None)
+
 def render_roadmap(df_original):
     # Top Action Bar
     col_action, _ = st.columns([0.2, 0.8])
@@ -542,120 +924,105 @@ def render_roadmap(df_original):
             st.cache_data.clear()
             st.rerun()
 
-    # Sidebar Filters
-    with st.sidebar:
+    # Filters, metrics and chart rerun on their own (the data is an explicit input)
+    roadmap_view(df_original)
 
-        st.markdown('<div class="sidebar-section-header">📂 정렬 기준</div>', unsafe_allow_html=True)
-        
-        # 1. Group By (Dynamic based on Excel columns)
-        # Exclude system columns that shouldn't be grouped by
-        system_cols = ['Task', 'Start', 'End', 'Comment', 'Display_Date', 'Duration_Text', 'Tick_Label', 'Duration', 'row_idx']
-        
-        # [User Request] Keep original column order from data
-        group_options = [c for c in df_original.columns if c not in system_cols]
-        
-        # Ensure 'Squad' is present if implied (though it should be in df columns)
-        if 'Squad' not in group_options and 'Squad' in df_original.columns:
-            group_options.insert(0, 'Squad')
-            
-        # Default logic (Status or Squad)
-        default_index = 0
-        if 'Status' in group_options:
-            default_index = group_options.index('Status')
-        elif 'Squad' in group_options:
-            default_index = group_options.index('Squad')
-        
-        selected_group_col = st.selectbox("정렬 기준 선택", group_options, index=default_index, label_visibility="collapsed")
-        
-        # Removed divider per user request
-        
-        st.markdown('<div class="sidebar-section-header">🔍 검색 및 필터</div>', unsafe_allow_html=True)
+def _reset_period_filter():
+    st.session_state['roadmap_period_filter'] = ()
 
-        # Search
-        search_query = st.text_input("과제명 검색", "")
-        
-        # Squad Filter
-        all_squads = list(df_original['Squad'].unique())
-        if 'Squad' in df_original.columns:
-            # Custom sorting for Squad list if needed, or rely on df order
-            pass
-            
-        selected_squads = st.multiselect("Squad 선택", all_squads, default=all_squads)
-        
-        # Goal Filter
-        all_goals = []
-        if 'Goal' in df_original.columns:
-            all_goals = sorted(df_original['Goal'].dropna().unique().tolist())
-            
-        selected_goals = st.multiselect("Goal 선택", all_goals, default=all_goals)
-        
+def _drill_into_summary_group(group_col):
+    """on_select of the summary chart: open the clicked group (customdata[0]; None = '기타' row)."""
+    event = st.session_state.get('roadmap_summary_chart')
+    points = event.selection.points if event else []
+    group = points[0].get('customdata', [None])[0] if points else None
+    if group is not None:
+        st.session_state['roadmap_drilldown'] = (group_col, group)
 
+@st.fragment
+def roadmap_view(df_original):
+    """
+    Roadmap filters, metrics and chart as one fragment: search, group-by, filter, period, drill-down and
+    paging interactions rerun only this function, not app.py (loading/processing/precompute).
+    Fragments cannot write to the sidebar, so the roadmap's controls live in the main area.
+    """
+    # Toolbar: Group By / Search / Period
+    c_group, c_search, c_period, c_reset = st.columns([0.22, 0.3, 0.38, 0.1])
+    
+    with c_group:
+        # 1. Group By (Dynamic based on Excel columns, system columns excluded)
+        group_options, default_index = roadmap_group_options(df_original)
+        selected_group_col = st.selectbox("📂 정렬 기준", group_options, index=default_index, key="roadmap_group_col")
+    
+    with c_search:
+        # Search as you type, debounced: one fragment rerun per typing pause, not per keystroke
+        search_query = debounced_search("🔍 과제명 검색", key="roadmap_search")
+    
+    # Date Period Filter (Start Date 기준, default: all)
+    if 'roadmap_period_filter' not in st.session_state:
+        st.session_state['roadmap_period_filter'] = ()
+    
+    with c_period:
+        period_input = st.date_input(
+            "📅 기간 설정 (Start Date 기준)", 
+            key='roadmap_period_filter'
+        )
+    with c_reset:
+        # Add spacer to align button with input
+        st.markdown("<div style='margin-top: 28px;'></div>", unsafe_allow_html=True)
+        st.button("🔄", help="기간 설정 초기화 (전체 보기)", on_click=_reset_period_filter)
+    
+    with st.expander("⚙️ 필터 및 보기 설정", expanded=False):
+        c_filter, c_view = st.columns(2)
         
-        # Filter Logic
-        df_filtered = df_original.copy()
-        
-        if search_query:
-            df_filtered = df_filtered[df_filtered['Task'].str.contains(search_query, case=False, na=False)]
+        with c_filter:
+            # Squad Filter (data order)
+            all_squads = list(df_original['Squad'].unique())
+            selected_squads = st.multiselect("Squad 선택", all_squads, default=all_squads, key="roadmap_squads")
             
-        if selected_squads:
-            df_filtered = df_filtered[df_filtered['Squad'].isin(selected_squads)]
+            # Goal Filter
+            all_goals = []
+            if 'Goal' in df_original.columns:
+                all_goals = sorted(df_original['Goal'].dropna().unique().tolist())
+            selected_goals = st.multiselect("Goal 선택", all_goals, default=all_goals, key="roadmap_goals")
             
-        if selected_goals:
-            df_filtered = df_filtered[df_filtered['Goal'].isin(selected_goals)]
+            show_completed = st.checkbox("진행 완료 포함", value=True, key="roadmap_show_completed")
             
-
-        # Additional Filters from original code (Manager, Show Completed)
-        # Assuming they are less critical or added if needed. Let's add Show Completed as it's common.
-        show_completed = st.checkbox("진행 완료 포함", value=True)
-        if not show_completed:
-            df_filtered = df_filtered[df_filtered['Status'] != '진행 완료']
+            # Filter Logic (returns new frames; df_original is never modified)
+            df_filtered = filter_roadmap(df_original, search_query, selected_squads, selected_goals, show_completed)
             
-        st.divider()
-        st.subheader("⚙️ 보기 설정")
-        
-        # 1. Group By (Moved to Top) -> Removed from here
-
-        # 2. Status Filter (Moved to Sidebar)
-        all_statuses = sorted(df_filtered['Status'].dropna().unique())
-        selected_statuses = st.multiselect("상태 필터 (Status)", all_statuses, default=all_statuses)
-        
-        # Apply Status Filter
-        if selected_statuses:
-            df_chart = df_filtered[df_filtered['Status'].isin(selected_statuses)]
-        else:
-            df_chart = df_filtered
+            # Status Filter (options follow the filters above)
+            all_statuses = sorted(df_filtered['Status'].dropna().unique())
+            selected_statuses = st.multiselect("상태 필터 (Status)", all_statuses, default=all_statuses, key="roadmap_statuses")
+            df_chart = filter_statuses(df_filtered, selected_statuses)
         
-    # Main Area
-    # Title handled in app.py
-    # st.markdown("<h3 style='text-align: center; margin-bottom: 20px;'>📊 Project Roadmap</h3>", unsafe_allow_html=True)
-
-    # Date Period Filter (Main Area)
-    today = datetime.now().date()
-    this_year_start = datetime(today.year, 1, 1).date()
-    this_year_end = datetime(today.year, 12, 31).date()
-
-    # Initialize Session State for Period Filter if not present
-    # Initialize Session State for Period Filter if not present
-    if 'roadmap_period_filter' not in st.session_state:
-        st.session_state['roadmap_period_filter'] = () # Default to All (Empty)
-
-    def reset_period_filter():
-        st.session_state['roadmap_period_filter'] = ()
-
-    # Layout: Input + Reset Button
-    c_period_1, c_period_2 = st.columns([0.4, 0.6])
-    
-    with c_period_1:
-         c_p_input, c_p_btn = st.columns([0.8, 0.2])
-         with c_p_input:
-             period_input = st.date_input(
-                 "📅 기간 설정 (Start Date 기준)", 
-                 key='roadmap_period_filter'
-             )
-         with c_p_btn:
-             # Add spacer to align button with input
-             st.markdown("<div style='margin-top: 28px;'></div>", unsafe_allow_html=True)
-             st.button("🔄", help="기간 설정 초기화 (전체 보기)", on_click=reset_period_filter)
+        with c_view:
+            # Render Mode (WebGL for very large roadmaps)
+            render_mode_labels = {'auto': '자동', 'svg': '기본', 'webgl': 'WebGL (대용량)', 'canvas': '캔버스 (브라우저)'}
+            render_mode = st.radio(
+                "렌더링 모드", list(render_mode_labels.keys()),
+                format_func=render_mode_labels.get, horizontal=True, key="roadmap_render_mode",
+                help=f"자동: 과제가 {WEBGL_ROW_THRESHOLD:,}개를 넘으면 WebGL로 그립니다. "
+                     "캔버스: 과제 데이터만 보내고 브라우저에서 그립니다 (그룹/검색/상태 변경이 즉시 반영)."
+            )
+            
+            # Level of Detail (summary per group for oversized roadmaps)
+            lod_labels = {'auto': '자동', 'summary': '요약', 'detail': '상세'}
+            lod_mode = st.radio(
+                "표시 수준", list(lod_labels.keys()),
+                format_func=lod_labels.get, horizontal=True, key="roadmap_lod_mode",
+                help=f"자동: 과제가 {LOD_ROW_THRESHOLD:,}개를 넘거나 기간이 너무 길면 그룹별 요약을 먼저 보여줍니다. 요약에서 그룹을 클릭하면 상세 차트로 들어갑니다."
+            )
+            
+            # Windowed rendering (only one page of rows is sent to the browser)
+            window_labels = {'off': '끄기', 'rows': '행 단위', 'groups': '그룹 단위'}
+            window_mode = st.radio(
+                "페이지 나누기", list(window_labels.keys()),
+                format_func=window_labels.get, horizontal=True, key="roadmap_window_mode",
+                help="상세 차트를 페이지 단위로 나누어 그립니다. 그룹 단위는 정렬 기준 그룹이 페이지 사이에서 끊기지 않게 나눕니다."
+            )
+            page_rows = WINDOW_PAGE_SIZES[0]
+            if window_mode != 'off':
+                page_rows = st.selectbox("페이지당 과제 수", WINDOW_PAGE_SIZES, key="roadmap_window_rows")
     
     # Apply Period Filter to df_chart if range is selected
     if isinstance(period_input, tuple) and len(period_input) == 2:
@@ -735,19 +1102,91 @@ def render_roadmap(df_original):
     st.divider()
 
     # 3. Chart Area
-    with st.spinner('차트를 생성 중입니다...'):
-        fig = create_professional_gantt(df_chart, group_col=selected_group_col)
-        
-        plotly_config = {
-            'scrollZoom': False, 
-            'displayModeBar': True,
-            'toImageButtonOptions': {
-                'format': 'png', 
-                'filename': 'project_roadmap',
-                'height': None,
-                'width': None,
-                'scale': 3
-            }
+    plotly_config = {
+        'scrollZoom': False, 
+        'displayModeBar': True,
+        'toImageButtonOptions': {
+            'format': 'png', 
+            'filename': 'project_roadmap',
+            'height': None,
+            'width': None,
+            'scale': 3
         }
+    }
+    
+    # Browser-side renderer: layout, grouping and filtering happen client-side (no summary/paging needed)
+    if render_mode == 'canvas':
+        from views import roadmap_canvas  # Imports this module; loaded on first use
+        roadmap_canvas.render_canvas_roadmap(df_chart, group_col=selected_group_col)
+        return
+    
+    # Drill-down target from the summary chart: (group column, group label)
+    drilldown = st.session_state.get('roadmap_drilldown')
+    if drilldown and drilldown[0] == selected_group_col and lod_mode != 'detail':
+        group_keys = summary_group_keys(df_chart, selected_group_col)
+        if (group_keys == drilldown[1]).any():
+            df_chart = df_chart[group_keys == drilldown[1]]
+        else:
+            drilldown = None  # Group filtered out -> back to the summary
+    else:
+        drilldown = None
+    
+    # Paging already bounds the chart size, so 'auto' only summarizes unpaged roadmaps
+    auto_summary = lod_mode == 'auto' and window_mode == 'off' and needs_summary(df_chart)
+    if drilldown is None and (lod_mode == 'summary' or auto_summary):
+        st.caption("🔭 과제가 많아 그룹별 요약을 표시합니다. 막대를 클릭하면 해당 그룹의 상세 일정을 볼 수 있습니다.")
+        fig = create_summary_gantt(df_chart, group_col=selected_group_col)
+        # Clicking a group sets the drill-down before the fragment reruns
+        st.plotly_chart(
+            fig, use_container_width=False, theme=None, config=plotly_config,
+            on_select=lambda: _drill_into_summary_group(selected_group_col),
+            selection_mode="points", key="roadmap_summary_chart"
+        )
+        return
+    
+    if drilldown is not None:
+        def clear_drilldown():
+            st.session_state.pop('roadmap_drilldown', None)
+        
+        c_back, c_title = st.columns([0.2, 0.8])
+        with c_back:
+            st.button("⬅️ 전체 요약으로", on_click=clear_drilldown, key="roadmap_drilldown_back")
+        with c_title:
+            st.markdown(f"**{selected_group_col}: {drilldown[1]}** · {len(df_chart)}개 과제")
+    
+    date_range = None
+    if window_mode != 'off':
+        df_sorted, windows, date_range = paged_roadmap(df_chart, selected_group_col, page_rows, window_mode == 'groups')
+        
+        # Filters/page size changed -> back to the first page
+        if st.session_state.get('roadmap_page', 0) >= len(windows):
+            st.session_state['roadmap_page'] = 0
+        
+        def move_page(step):
+            st.session_state['roadmap_page'] = min(max(0, st.session_state.get('roadmap_page', 0) + step), len(windows) - 1)
+        
+        def page_label(i):
+            start, stop = windows[i]
+            first, last = df_sorted[selected_group_col].iloc[[start, stop - 1]].astype(str)
+            groups = first if first == last else f"{first} ~ {last}"
+            return f"{i + 1} / {len(windows)} 페이지 · {start + 1}-{stop}행 · {groups}"
+        
+        c_prev, c_page, c_next = st.columns([0.1, 0.8, 0.1])
+        with c_prev:
+            st.button("◀ 이전", on_click=move_page, args=(-1,), key="roadmap_page_prev",
+                      disabled=st.session_state.get('roadmap_page', 0) == 0)
+        with c_next:
+            st.button("다음 ▶", on_click=move_page, args=(1,), key="roadmap_page_next",
+                      disabled=st.session_state.get('roadmap_page', 0) >= len(windows) - 1)
+        with c_page:
+            page = st.selectbox("페이지", list(range(len(windows))), format_func=page_label,
+                                key="roadmap_page", label_visibility="collapsed")
+        
+        start, stop = windows[page]
+        df_chart = df_sorted.iloc[start:stop]
+    
+    with st.spinner('차트를 생성 중입니다...'):
+        # Each window is its own cache entry, so paging back and forth reuses the built figures
+        fig = create_professional_gantt(df_chart, group_col=selected_group_col, render_mode=render_mode, date_range=date_range)
         
         st.plotly_chart(fig, use_container_width=False, theme=None, config=plotly_config)
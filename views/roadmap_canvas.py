@@ -0,0 +1,87 @@
+## 브라우저(캔버스) 로드맵 렌더러
+## 서버는 과제 데이터를 코드/날짜/사전 형태의 컬럼 payload로만 보내고,
+## 레이아웃(패널 폭, 줄바꿈, 막대, 축)과 그룹/필터 변경은 브라우저에서 처리한다.
+
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit.components.v1 as components
+
+import utils
+from bounded_cache import bounded_cache
+from views.roadmap import _panel_color, _squad_rank
+
+# Vendored frontend (plain HTML/JS, no build step, no CDN)
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'roadmap_canvas')
+
+_roadmap_canvas = components.declare_component("roadmap_canvas", path=FRONTEND_DIR)
+
+# Columns sent as plain strings (one value per task) instead of dictionary codes
+CANVAS_TEXT_COLS = ['Task']
+# Never offered as group-by in the browser
+CANVAS_SYSTEM_COLS = ['Task', 'Start', 'End', 'Comment']
+
+EPOCH = pd.Timestamp('1970-01-01')
+
+
+def _day_numbers(series):
+    """Days since 1970-01-01 per row (None for missing dates)."""
+    days = (pd.to_datetime(series).dt.normalize() - EPOCH).dt.days
+    return [None if pd.isna(d) else int(d) for d in days]
+
+
+def _dictionary(series):
+    """(codes, values) with -1 codes for missing values; categoricals keep their category order."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = [str(v) for v in series.cat.categories]
+        return series.cat.codes.to_numpy(dtype=np.int64).tolist(), values
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes.tolist(), [str(v) for v in uniques]
+
+
+@bounded_cache(ttl=3600)
+def build_canvas_payload(df):
+    """
+    Compact columnar payload for the canvas renderer:
+    - days: {'Start': [...], 'End': [...]} as days since epoch (None = missing)
+    - text: per-task strings (Task)
+    - codes / dicts: dictionary-encoded columns (Squad, Status, Goal, Comment, ...)
+    - styles: status colours, panel colours per dictionary value, squad sort ranks
+    """
+    payload = {
+        'n': len(df),
+        'today': int((pd.Timestamp.now().normalize() - EPOCH).days),
+        'days': {col: _day_numbers(df[col]) for col in ['Start', 'End'] if col in df.columns},
+        'text': {col: ['' if pd.isna(v) else str(v) for v in df[col]] for col in CANVAS_TEXT_COLS if col in df.columns},
+        'codes': {},
+        'dicts': {},
+        'panel_colors': {},
+    }
+
+    for col in df.columns:
+        if col in payload['days'] or col in payload['text']:
+            continue
+        codes, values = _dictionary(df[col])
+        payload['codes'][col] = codes
+        payload['dicts'][col] = values
+        if col not in CANVAS_SYSTEM_COLS:
+            payload['panel_colors'][col] = [_panel_color(col, v) for v in values]
+
+    payload['group_cols'] = [c for c in df.columns if c not in CANVAS_SYSTEM_COLS and c in payload['codes']]
+
+    statuses = payload['dicts'].get('Status', [])
+    payload['status_styles'] = {
+        s: {k: utils.get_status_style(s).get(k, d) for k, d in
+            [('fill', '#888888'), ('border', '#888888'), ('bg_color', '#FFFFFF'), ('text_color', '#000000'), ('icon', '')]}
+        for s in statuses
+    }
+    squads = payload['dicts'].get('Squad', [])
+    payload['squad_rank'] = _squad_rank(pd.Series(squads, dtype=object)).tolist() if squads else []
+    return payload
+
+
+def render_canvas_roadmap(df, group_col='Squad', height=720, key="roadmap_canvas"):
+    """Renders the roadmap in the browser; grouping, search and status toggles do not rerun the script."""
+    payload = build_canvas_payload(df)
+    return _roadmap_canvas(payload=payload, group_col=group_col, max_height=height, key=key, default=None)
@@ -0,0 +1,26 @@
+## 입력을 멈추면 바로 반영되는(디바운스) 검색창 컴포넌트
+## st.text_input은 Enter/포커스 이동 때만 값을 보내므로, 입력이 SEARCH_DEBOUNCE_MS 동안 멈추면 값을 보내는
+## 작은 컴포넌트(assets/search_box)를 쓴다. 키 입력마다 rerun하지 않고, 입력을 멈출 때마다 한 번만 rerun한다.
+
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+SEARCH_DEBOUNCE_MS = 300
+
+# Vendored frontend (plain HTML/JS, no build step, no CDN)
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'search_box')
+
+_search_box = components.declare_component("search_box", path=FRONTEND_DIR)
+
+
+def debounced_search(label, key, placeholder='', debounce_ms=SEARCH_DEBOUNCE_MS):
+    """
+    Search-as-you-type input: the value is sent once typing pauses for debounce_ms (or on Enter / blur),
+    so a pause reruns the script (or fragment) once instead of every keystroke.
+    Returns the last sent value ('' before any input).
+    """
+    value = st.session_state.get(key) or ''
+    return _search_box(label=label, placeholder=placeholder, debounce_ms=debounce_ms, value=value,
+                       key=key, default='') or ''